@@ -0,0 +1,102 @@
+"""
+Benchmark import time of the src package with ``python -X importtime``
+
+Each import statement runs in a fresh interpreter a few times; the fastest
+run is reported together with the heaviest third-party packages. Statements
+that should stay light (a scoring-only process that just needs the
+preprocessor) also check that no plotting modules were pulled in, and the
+script exits non-zero on a regression so it can run in CI.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeat 5 --max-ms 1500
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# name -> (statement, modules it must not import)
+TARGETS = {
+    'package': ("import src", ('matplotlib', 'seaborn', 'sklearn', 'imblearn')),
+    'preprocessor': ("from src import ChurnDataPreprocessor", ('matplotlib', 'seaborn', 'imblearn')),
+    'scoring': ("from src.scoring import load_scorer",
+                ('matplotlib', 'seaborn', 'imblearn', 'src.model_training')),
+    'evaluation': ("from src.model_evaluation import evaluate_models", ('seaborn',)),
+    'everything': ("import src; [getattr(src, name) for name in src.__all__]", ()),
+}
+
+
+def _run_importtime(statement):
+    """Run one statement under -X importtime and parse the per-module timings"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def _summarize(modules):
+    total_ms = sum(self_us for _, self_us, _ in modules) / 1000
+    # Cost of each top-level package (pandas, sklearn, matplotlib, ...) wherever it was first imported
+    packages = {}
+    for name, _, cumulative_us in modules:
+        name = name.strip()
+        if '.' not in name and name != 'src':
+            packages[name] = max(packages.get(name, 0), cumulative_us / 1000)
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    names = {name.strip() for name, _, _ in modules}
+    loaded = names | {name.split('.')[0] for name in names}
+    return total_ms, heaviest, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark src import time")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per statement (fastest is kept)")
+    parser.add_argument('--top', type=int, default=5, help="Heaviest packages to list")
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help="Fail when the light targets (package, preprocessor, scoring) exceed this")
+    parser.add_argument('--targets', nargs='*', default=list(TARGETS), choices=list(TARGETS))
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("IMPORT TIME BENCHMARK (python -X importtime)")
+    print("=" * 70)
+
+    failures = []
+    for name in args.targets:
+        statement, forbidden = TARGETS[name]
+        runs = [_summarize(_run_importtime(statement)) for _ in range(args.repeat)]
+        total_ms, heaviest, loaded = min(runs, key=lambda run: run[0])
+
+        print(f"\n{name}: {statement}")
+        print(f"  total {total_ms:8.1f} ms")
+        for module, cumulative_ms in heaviest[:args.top]:
+            print(f"    {module:<40}{cumulative_ms:>10.1f} ms")
+
+        unexpected = sorted(set(forbidden) & loaded)
+        if unexpected:
+            failures.append(f"{name} imports {', '.join(unexpected)}")
+        if args.max_ms is not None and name in ('package', 'preprocessor', 'scoring') \
+                and total_ms > args.max_ms:
+            failures.append(f"{name} took {total_ms:.0f} ms (budget {args.max_ms:.0f} ms)")
+
+    print("\n" + "=" * 70)
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+    print("✓ No import-time regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark model artifact codecs: file size, load time and per-process memory
+
+Saves one trained model with every codec in MODEL_CODECS, then loads each
+file in fresh worker processes and reports load time, RSS and PSS
+(proportional set size, which splits shared page-cache pages between the
+processes mapping them). Uncompressed files are loaded with mmap_mode='r'.
+
+Usage:
+    python scripts/benchmark_model_io.py                      # synthetic Random Forest
+    python scripts/benchmark_model_io.py --model ../models/best_model.pkl --workers 4
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.model_training import MODEL_CODECS, ChurnModelTrainer
+
+# Runs in a fresh interpreter so memory numbers only include one model load
+_WORKER_CODE = """
+import json, sys, time, resource
+sys.path.insert(0, {root!r})
+from src.model_training import ChurnModelTrainer
+
+def memory_kb():
+    stats = {{}}
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                key, value = line.split(':', 1)
+                if key in ('Rss', 'Pss'):
+                    stats[key.lower()] = int(value.split()[0])
+    except OSError:
+        stats['rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return stats
+
+before = memory_kb()
+start = time.perf_counter()
+data = ChurnModelTrainer().load_model({path!r}, mmap_mode={mmap!r})
+load_time = time.perf_counter() - start
+after = memory_kb()
+sys.stdin.readline()  # hold the mapping until every worker has loaded
+print(json.dumps({{
+    'load_s': load_time,
+    'rss_mb': (after.get('rss', 0) - before.get('rss', 0)) / 1024,
+    'pss_mb': (after.get('pss', 0) - before.get('pss', 0)) / 1024,
+}}))
+"""
+
+
+def _train_synthetic_model(n_samples, n_estimators):
+    from sklearn.datasets import make_classification
+
+    X, y = make_classification(n_samples=n_samples, n_features=30, random_state=42)
+    trainer = ChurnModelTrainer()
+    trainer.train_random_forest(X, y, n_estimators=n_estimators, max_depth=None)
+    return trainer, 'Random Forest'
+
+
+def _load_in_workers(path, mmap_mode, workers):
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    code = _WORKER_CODE.format(root=root, path=path, mmap=mmap_mode)
+    procs = [subprocess.Popen([sys.executable, '-c', code], stdin=subprocess.PIPE,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+             for _ in range(workers)]
+    results = []
+    for proc in procs:
+        out, _ = proc.communicate('\n')
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark model save codecs")
+    parser.add_argument('--model', help="Existing model file saved with save_model")
+    parser.add_argument('--workers', type=int, default=4, help="Processes loading each file")
+    parser.add_argument('--samples', type=int, default=50_000, help="Rows for the synthetic model")
+    parser.add_argument('--trees', type=int, default=200, help="Trees for the synthetic model")
+    args = parser.parse_args()
+
+    trainer = ChurnModelTrainer()
+    if args.model:
+        data = trainer.load_model(args.model)
+        model_name = data['metadata']['model_name'] if data.get('metadata') else 'model'
+        trainer.models[model_name] = data['model']
+    else:
+        trainer, model_name = _train_synthetic_model(args.samples, args.trees)
+
+    print("=" * 70)
+    print(f"MODEL I/O BENCHMARK - {model_name} ({args.workers} workers per codec)")
+    print("=" * 70)
+    print(f"{'codec':<8}{'size MB':>10}{'load s':>10}{'RSS MB':>10}{'PSS MB':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec in MODEL_CODECS:
+            path = os.path.join(tmp, f'model_{codec}.joblib')
+            try:
+                saved = trainer.save_model(model_name, path, codec=codec)
+            except ValueError:
+                saved = False
+            if not saved:
+                print(f"{codec:<8}{'unavailable':>10}")
+                continue
+
+            mmap_mode = 'r' if codec == 'none' else None
+            results = _load_in_workers(path, mmap_mode, args.workers)
+            n = len(results)
+            print(f"{codec:<8}"
+                  f"{os.path.getsize(path) / 1e6:>10.1f}"
+                  f"{sum(r['load_s'] for r in results) / n:>10.3f}"
+                  f"{sum(r['rss_mb'] for r in results) / n:>10.1f}"
+                  f"{sum(r['pss_mb'] for r in results) / n:>10.1f}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
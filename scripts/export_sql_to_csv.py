@@ -1,88 +1,228 @@
 """
 Script to export data from SQL database to CSV files
+
+All exports share one pooled engine, and independent exports can run
+concurrently on a bounded thread pool; each run ends with a per-query
+latency and row-count summary. Large results are streamed from a
+server-side cursor in chunks and appended to CSV (or written as Parquet
+row groups) by a writer thread, so memory stays bounded by the chunk size.
 """
 
 import pandas as pd
 from sqlalchemy import create_engine
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
+import time
 from datetime import datetime
 import os
+import queue
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 DB_CONFIG = {
-    'type': 'mysql',
+    'type': 'sqlite',  # Options: 'sqlite', 'mysql', 'postgresql', 'sqlserver'
     'host': 'localhost',
     'port': 3306,
-    'database': 'customer_churn_db',
+    'database': '../data/customer_churn.db',  # SQLite: path of the database file
     'username': 'your_username',
     'password': 'your_password'
 }
 
+# Connections kept open by the shared engine; also the default number of concurrent exports
+POOL_SIZE = 4
+
+# Rows fetched per chunk by streaming exports
+STREAM_CHUNKSIZE = 50_000
+
+# Chunks buffered between the fetching and the writing thread
+STREAM_QUEUE_SIZE = 2
+
+_engine = None
+_engine_lock = threading.Lock()
+
 def create_connection_string(config):
     db_type = config['type']
-    if db_type == 'mysql':
+    if db_type == 'sqlite':
+        return f"sqlite:///{config['database']}"
+    elif db_type == 'mysql':
         return f"mysql+pymysql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
     elif db_type == 'postgresql':
         return f"postgresql+psycopg2://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
     elif db_type == 'sqlserver':
         return f"mssql+pyodbc://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}?driver=ODBC+Driver+17+for+SQL+Server"
+    else:
+        raise ValueError(f"Unsupported database type: {db_type}")
 
-def export_query_to_csv(query, output_filepath, description=""):
-    try:
-        logger.info(f"Starting export: {description}")
-        conn_string = create_connection_string(DB_CONFIG)
-        engine = create_engine(conn_string)
+def get_engine():
+    """
+    Shared pooled engine for the whole run, created on first use
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = create_engine(create_connection_string(DB_CONFIG), pool_size=POOL_SIZE,
+                                    max_overflow=0, pool_pre_ping=True)
+            logger.info(f"Created shared database engine (pool size {POOL_SIZE})")
+        return _engine
+
+def dispose_engine():
+    """Close every pooled connection; the next get_engine() call starts a new pool"""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+
+class _ChunkWriter(threading.Thread):
+    """
+    Background thread that writes DataFrame chunks to one CSV or Parquet file
+    
+    Chunks arrive through a bounded queue, so the next chunk is fetched
+    while the previous one is written. After a write error the remaining
+    chunks are drained and dropped so the producer never blocks.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, filepath, parquet=False):
+        super().__init__(daemon=True)
+        self.filepath = filepath
+        self.chunks = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self.error = None
+        self._parquet = parquet
+        self._parquet_writer = None
+        self._schema = None
+        self._header = True
+    
+    def _write(self, chunk):
+        if not self._parquet:
+            chunk.to_csv(self.filepath, mode='w' if self._header else 'a', header=self._header, index=False)
+            self._header = False
+            return
         
-        logger.info("Executing query...")
-        df = pd.read_sql(query, engine)
-        logger.info(f"Query returned {len(df)} rows and {len(df.columns)} columns")
+        import pyarrow as pa
+        import pyarrow.parquet as pq
         
+        if self._parquet_writer is None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            self._schema = table.schema
+            self._parquet_writer = pq.ParquetWriter(self.filepath, self._schema)
+        else:
+            # Cast to the first chunk's schema; a chunk whose column is all NULL would otherwise differ
+            table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+        self._parquet_writer.write_table(table)
+    
+    def run(self):
+        while True:
+            chunk = self.chunks.get()
+            if chunk is self._DONE:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self._write(chunk)
+            except Exception as e:
+                self.error = e
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+def stream_query_to_file(query, output_filepath, engine=None, chunksize=STREAM_CHUNKSIZE):
+    """
+    Stream a query result to CSV or Parquet without holding it in memory
+    
+    Rows come from a server-side cursor (``stream_results``) ``chunksize``
+    at a time; each chunk is appended to the CSV or written as one Parquet
+    row group (chosen by the file extension) on a writer thread. The file
+    is written under a temporary name and renamed once complete.
+    
+    Returns:
+        tuple: (rows, columns, preview DataFrame of the first rows)
+    """
+    tmp_filepath = output_filepath + '.part'
+    writer = _ChunkWriter(tmp_filepath, parquet=output_filepath.endswith('.parquet'))
+    writer.start()
+    rows, columns, preview = 0, 0, None
+    fetched = False
+    try:
+        with (engine or get_engine()).connect() as conn:
+            conn = conn.execution_options(stream_results=True, max_row_buffer=chunksize)
+            for chunk in pd.read_sql(query, conn, chunksize=chunksize):
+                if writer.error is not None:
+                    break
+                if preview is None:
+                    preview, columns = chunk.head(), len(chunk.columns)
+                rows += len(chunk)
+                writer.chunks.put(chunk)
+        fetched = True
+    finally:
+        writer.chunks.put(_ChunkWriter._DONE)
+        writer.join()
+        if (not fetched or writer.error is not None) and os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+    
+    if writer.error is not None:
+        raise writer.error
+    os.replace(tmp_filepath, output_filepath)
+    return rows, columns, preview
+
+def run_export(query, output_filepath, description="", engine=None, chunksize=None):
+    """
+    Run one query on the shared engine and write the result to CSV
+    
+    Args:
+        chunksize: Stream the result in chunks of this many rows
+            (stream_query_to_file) instead of loading it at once; the output
+            is Parquet if ``output_filepath`` ends with .parquet
+    
+    Returns:
+        dict: export, output, status ('ok' or 'failed'), rows, columns,
+        seconds and error
+    """
+    result = {'export': description or output_filepath, 'output': output_filepath,
+              'status': 'failed', 'rows': None, 'columns': None, 'seconds': None, 'error': None}
+    start = time.perf_counter()
+    try:
+        logger.info(f"Starting export: {description}")
         os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
-        
-        logger.info(f"Exporting to {output_filepath}...")
-        df.to_csv(output_filepath, index=False)
+        if chunksize:
+            rows, columns, preview = stream_query_to_file(query, output_filepath, engine, chunksize)
+        else:
+            df = pd.read_sql(query, engine or get_engine())
+            df.to_csv(output_filepath, index=False)
+            rows, columns, preview = len(df), len(df.columns), df.head()
+        logger.info(f"Query returned {rows} rows and {columns} columns")
         logger.info(f"✓ Export successful: {output_filepath}")
         
-        print(f"\nPreview:")
-        print(df.head())
-        
-        engine.dispose()
-        return True
+        result.update(status='ok', rows=rows, columns=columns)
+        result['preview'] = preview
     except Exception as e:
-        logger.error(f"Error: {str(e)}", exc_info=True)
-        return False
+        logger.error(f"Error in export '{description}': {str(e)}")
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def export_query_to_csv(query, output_filepath, description="", chunksize=None):
+    result = run_export(query, output_filepath, description, chunksize=chunksize)
+    if result['status'] == 'ok':
+        print(f"\nPreview:")
+        print(result['preview'])
+    return result['status'] == 'ok'
 
-def export_table_to_csv(table_name, output_filepath):
+def export_table_to_csv(table_name, output_filepath, chunksize=STREAM_CHUNKSIZE):
     query = f"SELECT * FROM {table_name}"
-    return export_query_to_csv(query, output_filepath, f"Exporting table '{table_name}'")
+    return export_query_to_csv(query, output_filepath, f"Exporting table '{table_name}'", chunksize=chunksize)
 
-def main():
-    print("="*70)
-    print("EXPORT SQL DATA TO CSV FILES")
-    print("="*70)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Export 1: Full customer table
-    logger.info("\n--- Export 1: Full Customer Table ---")
-    export1_success = export_table_to_csv(
-        table_name='customers',
-        output_filepath=f'../data/sql_exports/customers_full_{timestamp}.csv'
-    )
+def build_exports(timestamp, export_dir='../data/sql_exports', row_format='csv'):
+    """
+    The standard exports as (description, query, output path, streamed) tuples
     
-    # Export 2: Churned customers
-    logger.info("\n--- Export 2: Churned Customers ---")
+    Row-level exports are streamed and written as ``row_format`` ('csv' or
+    'parquet'); the small aggregate results are always CSV.
+    """
     churn_query = "SELECT * FROM customers WHERE churn = 1 OR churn = 'Yes'"
-    export2_success = export_query_to_csv(
-        query=churn_query,
-        output_filepath=f'../data/sql_exports/churned_customers_{timestamp}.csv',
-        description="Churned customers"
-    )
-    
-    # Export 3: Summary statistics
-    logger.info("\n--- Export 3: Churn Summary ---")
+    
     summary_query = """
     SELECT 
         COUNT(*) AS total_customers,
@@ -90,14 +230,8 @@ def main():
         ROUND(100.0 * SUM(CASE WHEN churn = 1 THEN 1 ELSE 0 END) / COUNT(*), 2) AS churn_rate
     FROM customers
     """
-    export3_success = export_query_to_csv(
-        query=summary_query,
-        output_filepath=f'../data/sql_exports/churn_summary_{timestamp}.csv',
-        description="Summary statistics"
-    )
-    
-    # Export 4: Segment Risk Analysis (from queries/01_segment_risk_analysis.sql)
-    logger.info("\n--- Export 4: Segment Risk Analysis ---")
+    
+    # Segment Risk Analysis (from queries/01_segment_risk_analysis.sql)
     segment_risk_query = """
     SELECT
         tenure_group,
@@ -109,14 +243,8 @@ def main():
     GROUP BY tenure_group, charge_category
     ORDER BY churn_rate DESC;
     """ # This is an example, use your actual query from 01_segment_risk_analysis.sql
-    export4_success = export_query_to_csv(
-        query=segment_risk_query,
-        output_filepath=f'../data/sql_exports/segment_risk_analysis_{timestamp}.csv',
-        description="Segment Risk Analysis"
-    )
-
-    # Export 5: Churn Drivers Summary (from queries/02_churn_drivers.sql)
-    logger.info("\n--- Export 5: Churn Drivers Summary ---")
+    
+    # Churn Drivers Summary (from queries/02_churn_drivers.sql)
     churn_drivers_query = """
     SELECT
         AVG(CASE WHEN Churn = 1 THEN tenure ELSE NULL END) AS avg_tenure_churned,
@@ -127,14 +255,8 @@ def main():
         AVG(CASE WHEN Churn = 0 THEN TotalCharges ELSE NULL END) AS avg_total_revenue_retained
     FROM customers;
     """ # This is an example, use your actual query from 02_churn_drivers.sql
-    export5_success = export_query_to_csv(
-        query=churn_drivers_query,
-        output_filepath=f'../data/sql_exports/churn_drivers_summary_{timestamp}.csv',
-        description="Churn Drivers Summary"
-    )
-
-    # Export 6: Revenue Loss by Contract Type (from queries/04_revenue_loss_analysis.sql)
-    logger.info("\n--- Export 6: Revenue Loss by Contract Type ---")
+    
+    # Revenue Loss by Contract Type (from queries/04_revenue_loss_analysis.sql)
     revenue_loss_query = """
     SELECT
         Contract,
@@ -144,24 +266,86 @@ def main():
     FROM customers
     GROUP BY Contract;
     """ # This is an example, use your actual query from 04_revenue_loss_analysis.sql
-    export6_success = export_query_to_csv(
-        query=revenue_loss_query,
-        output_filepath=f'../data/sql_exports/revenue_loss_by_contract_{timestamp}.csv',
-        description="Revenue Loss by Contract Type"
-    )
     
     # ... Add more exports for other analytical queries as needed ...
+    return [
+        ("Full customer table", "SELECT * FROM customers",
+         f'{export_dir}/customers_full_{timestamp}.{row_format}', True),
+        ("Churned customers", churn_query, f'{export_dir}/churned_customers_{timestamp}.{row_format}', True),
+        ("Summary statistics", summary_query, f'{export_dir}/churn_summary_{timestamp}.csv', False),
+        ("Segment Risk Analysis", segment_risk_query,
+         f'{export_dir}/segment_risk_analysis_{timestamp}.csv', False),
+        ("Churn Drivers Summary", churn_drivers_query,
+         f'{export_dir}/churn_drivers_summary_{timestamp}.csv', False),
+        ("Revenue Loss by Contract Type", revenue_loss_query,
+         f'{export_dir}/revenue_loss_by_contract_{timestamp}.csv', False),
+    ]
 
+def run_exports(exports, concurrent=True, max_workers=POOL_SIZE, chunksize=STREAM_CHUNKSIZE):
+    """
+    Run (description, query, output path, streamed) exports on the shared engine
+    
+    With ``concurrent=True`` independent exports run on a thread pool no
+    larger than the connection pool. Streamed exports are fetched
+    ``chunksize`` rows at a time.
+    
+    Returns:
+        list: run_export results in the order of ``exports``
+    """
+    engine = get_engine()
+    if not concurrent:
+        return [run_export(query, path, description, engine, chunksize if streamed else None)
+                for description, query, path, streamed in exports]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, POOL_SIZE)) as pool:
+        futures = [pool.submit(run_export, query, path, description, engine, chunksize if streamed else None)
+                   for description, query, path, streamed in exports]
+        return [future.result() for future in futures]
+
+def print_export_summary(results, wall_time):
+    """Per-query latency and row counts, plus overall wall time"""
     print("\n" + "="*70)
     print("EXPORT SUMMARY")
     print("="*70)
-    print(f"1. Full table: {'✓' if export1_success else '✗'}")
-    print(f"2. Churned: {'✓' if export2_success else '✗'}")
-    print(f"3. Summary: {'✓' if export3_success else '✗'}")
-    print(f"4. Segment Risk: {'✓' if export4_success else '✗'}")
-    print(f"5. Churn Drivers: {'✓' if export5_success else '✗'}")
-    print(f"6. Revenue Loss: {'✓' if export6_success else '✗'}")
+    print(f"{'#':<3}{'export':<32}{'status':<8}{'rows':>9}{'seconds':>10}")
+    for i, result in enumerate(results, 1):
+        rows = f"{result['rows']:,}" if result['rows'] is not None else '-'
+        print(f"{i:<3}{result['export'][:31]:<32}{result['status']:<8}{rows:>9}{result['seconds']:>10.3f}")
+        if result['error']:
+            print(f"   ✗ {result['error'].splitlines()[0][:100]}")
+    query_time = sum(result['seconds'] for result in results)
+    ok = sum(result['status'] == 'ok' for result in results)
+    print("-"*70)
+    print(f"{ok}/{len(results)} exports succeeded; {query_time:.3f}s of query time in {wall_time:.3f}s wall time")
+    print("="*70)
+
+def main(concurrent=True, max_workers=POOL_SIZE, chunksize=STREAM_CHUNKSIZE, row_format='csv'):
+    print("="*70)
+    print("EXPORT SQL DATA TO CSV FILES")
     print("="*70)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    exports = build_exports(timestamp, row_format=row_format)
+    
+    start = time.perf_counter()
+    try:
+        results = run_exports(exports, concurrent=concurrent, max_workers=max_workers, chunksize=chunksize)
+    finally:
+        dispose_engine()
+    
+    print_export_summary(results, time.perf_counter() - start)
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Export SQL query results to CSV files")
+    parser.add_argument('--sequential', action='store_true', help="Run exports one after another")
+    parser.add_argument('--workers', type=int, default=POOL_SIZE,
+                        help="Concurrent exports (capped at the connection pool size)")
+    parser.add_argument('--chunksize', type=int, default=STREAM_CHUNKSIZE,
+                        help="Rows per chunk for streamed row-level exports (0 loads them at once)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help="File format of the streamed row-level exports")
+    args = parser.parse_args()
+    main(concurrent=not args.sequential, max_workers=args.workers, chunksize=args.chunksize,
+         row_format=args.format)
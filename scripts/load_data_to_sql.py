@@ -1,15 +1,37 @@
 """
 Script to load customer churn data from CSV to SQL database
-Supports MySQL, PostgreSQL, and SQL Server
+Supports SQLite, MySQL, PostgreSQL, and SQL Server
+
+The default bulk loader streams the file into the database's native bulk
+path (COPY for PostgreSQL, LOAD DATA LOCAL INFILE for MySQL, batched
+executemany in one transaction elsewhere; Parquet files are fed to COPY
+and LOAD DATA as CSV one row group at a time) instead of building
+multi-row INSERT statements with pandas. The incremental mode diffs the
+file against the table by customerID and a per-row hash and applies only
+the inserted, changed and removed rows, so indexes and views on the table
+are kept.
 """
 
 import pandas as pd
+import numpy as np
 from sqlalchemy import create_engine
 import sqlalchemy
+import csv
+import hashlib
+import io
 import logging
+import re
+import shutil
+import sys
+import tempfile
+import time
 from datetime import datetime
 import os
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.schema import SQL_SCHEMA
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,21 +41,31 @@ logger = logging.getLogger(__name__)
 
 # Database Configuration
 DB_CONFIG = {
-    'type': 'mysql',  # Options: 'mysql', 'postgresql', 'sqlserver'
+    'type': 'sqlite',  # Options: 'sqlite', 'mysql', 'postgresql', 'sqlserver'
     'host': 'localhost',
     'port': 3306,  # MySQL: 3306, PostgreSQL: 5432, SQL Server: 1433
-    'database': 'customer_churn_db',
+    'database': '../data/customer_churn.db',  # SQLite: path of the database file
     'username': 'your_username',
     'password': 'your_password'
 }
 
+# Rows per executemany batch in the generic bulk loader
+BULK_BATCH_SIZE = 10_000
+# Rows read to infer column types when the loader creates the table
+TYPE_SAMPLE_ROWS = 10_000
+# Key column of the incremental load; {table}_row_hashes stores one hash per key
+INCREMENTAL_KEY = 'customerID'
+ROW_HASH_TABLE_SUFFIX = '_row_hashes'
+
 def create_connection_string(config):
     """
     Create SQLAlchemy connection string based on database type
     """
     db_type = config['type']
     
-    if db_type == 'mysql':
+    if db_type == 'sqlite':
+        conn_string = f"sqlite:///{config['database']}"
+    elif db_type == 'mysql':
         conn_string = f"mysql+pymysql://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
     elif db_type == 'postgresql':
         conn_string = f"postgresql+psycopg2://{config['username']}:{config['password']}@{config['host']}:{config['port']}/{config['database']}"
@@ -44,10 +76,390 @@ def create_connection_string(config):
     
     return conn_string
 
-def load_csv_to_sql(csv_filepath, table_name, if_exists='replace'):
+def create_db_engine(config):
+    """
+    Create an engine for the configured database
+    
+    MySQL connections enable LOCAL INFILE so the bulk loader can stream files.
+    """
+    connect_args = {'local_infile': True} if config['type'] == 'mysql' else {}
+    return create_engine(create_connection_string(config), connect_args=connect_args)
+
+def _is_parquet(filepath):
+    return str(filepath).endswith(('.parquet', '.pq'))
+
+def _read_sample(filepath, nrows=TYPE_SAMPLE_ROWS):
+    """First rows of a CSV or Parquet file, used to create the table"""
+    if _is_parquet(filepath):
+        import pyarrow.parquet as pq
+        batch = next(pq.ParquetFile(filepath).iter_batches(batch_size=nrows), None)
+        return batch.to_pandas() if batch is not None else pd.DataFrame()
+    return pd.read_csv(filepath, nrows=nrows)
+
+def _decimal_scale(column_name):
+    """Digits after the point of a DECIMAL column in sql/01_schema_setup.sql, else None"""
+    match = re.match(r'DECIMAL\(\s*\d+\s*,\s*(\d+)\s*\)', SQL_SCHEMA.get(column_name, ''), re.IGNORECASE)
+    return int(match.group(1)) if match else None
+
+def _arrow_column_values(name, column):
+    """
+    Python values of one Parquet column
+    
+    float32 columns (money is stored as float32) are widened through their
+    shortest decimal form, so 1413.6 is sent as 1413.6 rather than
+    1413.5999755859375, and rounded to the DECIMAL scale of the schema.
+    """
+    import pyarrow as pa
+    
+    if not pa.types.is_float32(column.type):
+        return column.to_pylist()
+    values = column.to_numpy(zero_copy_only=False).astype(str).astype(np.float64)
+    scale = _decimal_scale(name)
+    if scale is not None:
+        values = np.round(values, scale)
+    nulls = column.is_null().to_numpy(zero_copy_only=False)
+    return [None if null else value for value, null in zip(values.tolist(), nulls)]
+
+def _iter_row_batches(filepath, batch_size=BULK_BATCH_SIZE):
+    """
+    Yield lists of row tuples straight from the file, never holding the whole file
+    
+    Empty CSV fields become NULL.
+    """
+    if _is_parquet(filepath):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(filepath).iter_batches(batch_size=batch_size):
+            yield list(zip(*(_arrow_column_values(name, column)
+                             for name, column in zip(batch.schema.names, batch.columns))))
+        return
+    
+    with open(filepath, newline='') as f:
+        reader = csv.reader(f)
+        next(reader)  # header
+        batch = []
+        for row in reader:
+            batch.append(tuple(value if value != '' else None for value in row))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+class _ParquetCsvReader:
+    """
+    Read-only text file serving a Parquet file's rows as headerless CSV
+    
+    Rows are converted one batch at a time as the reader is consumed, so
+    COPY and LOAD DATA can take a Parquet file without it being loaded or
+    converted up front. NULLs become empty fields, as in the CSV exports.
+    """
+    
+    def __init__(self, filepath, batch_size=BULK_BATCH_SIZE):
+        self._batches = _iter_row_batches(filepath, batch_size)
+        self._buffer = io.StringIO()
+    
+    def read(self, size=-1):
+        while True:
+            chunk = self._buffer.read(size)
+            if chunk or self._batches is None:
+                return chunk
+            batch = next(self._batches, None)
+            if batch is None:
+                self._batches = None
+                return ''
+            self._buffer = io.StringIO()
+            csv.writer(self._buffer, lineterminator='\n').writerows(batch)
+            self._buffer.seek(0)
+
+def _prepare_table(engine, filepath, table_name, if_exists):
+    """
+    Create (or keep) the target table and return the file's column names
+    
+    Column types are inferred by pandas from a sample of the file. The
+    table's row hashes no longer describe its contents after a full load,
+    so they are dropped and the next incremental load rebuilds them.
+    """
+    sample = _read_sample(filepath)
+    exists = sqlalchemy.inspect(engine).has_table(table_name)
+    if exists and if_exists == 'fail':
+        raise ValueError(f"Table '{table_name}' already exists")
+    if not exists or if_exists == 'replace':
+        sample.head(0).to_sql(table_name, engine, if_exists='replace', index=False)
+    _drop_row_hashes(engine, table_name)
+    return list(sample.columns)
+
+def _row_hash_table(table_name, key):
+    """Companion table holding one hash per key of ``table_name``"""
+    return sqlalchemy.Table(
+        f'{table_name}{ROW_HASH_TABLE_SUFFIX}', sqlalchemy.MetaData(),
+        sqlalchemy.Column(key, sqlalchemy.String(255), primary_key=True),
+        sqlalchemy.Column('row_hash', sqlalchemy.String(32), nullable=False),
+    )
+
+def _drop_row_hashes(engine, table_name):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            f"DROP TABLE IF EXISTS {engine.dialect.identifier_preparer.quote(table_name + ROW_HASH_TABLE_SUFFIX)}")
+
+def _row_hash(row):
+    """MD5 of a row's values as read from the file (NULL distinct from the empty string)"""
+    text = '\x1f'.join('\\N' if value is None else str(value) for value in row)
+    return hashlib.md5(text.encode()).hexdigest()
+
+def _copy_postgresql(engine, filepath, table_name, columns):
+    """COPY ... FROM STDIN, streamed from the CSV or Parquet file by psycopg2"""
+    quote = engine.dialect.identifier_preparer.quote
+    parquet = _is_parquet(filepath)
+    copy_sql = (f"COPY {quote(table_name)} ({', '.join(quote(c) for c in columns)}) "
+                f"FROM STDIN WITH (FORMAT csv, HEADER {'false' if parquet else 'true'}, NULL '')")
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            if parquet:
+                cursor.copy_expert(copy_sql, _ParquetCsvReader(filepath))
+            else:
+                with open(filepath, newline='') as f:
+                    cursor.copy_expert(copy_sql, f)
+        raw.commit()
+    finally:
+        raw.close()
+
+def _load_data_infile_mysql(engine, filepath, table_name, columns):
+    """LOAD DATA LOCAL INFILE, as in sql/02_data_import.sql, with empty fields as NULL"""
+    quote = engine.dialect.identifier_preparer.quote
+    with open(filepath, 'rb') as f:
+        line_end = '\\r\\n' if f.readline().endswith(b'\r\n') else '\\n'
+    variables = [f'@v{i}' for i in range(len(columns))]
+    assignments = ', '.join(f"{quote(c)} = NULLIF({v}, '')" for c, v in zip(columns, variables))
+    path = os.path.abspath(filepath).replace('\\', '/')
+    load_sql = (f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {quote(table_name)} "
+                f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                f"LINES TERMINATED BY '{line_end}' IGNORE 1 ROWS "
+                f"({', '.join(variables)}) SET {assignments}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(load_sql)
+
+def _load_parquet_infile_mysql(engine, filepath, table_name, columns):
+    """
+    LOAD DATA LOCAL INFILE of a Parquet file
+    
+    The MySQL drivers only read LOCAL INFILE data from a path, so the row
+    batches are streamed to a temporary CSV file first.
+    """
+    with tempfile.NamedTemporaryFile('w', newline='', suffix='.csv', delete=False) as f:
+        csv_path = f.name
+        try:
+            csv.writer(f, lineterminator='\n').writerow(columns)
+            shutil.copyfileobj(_ParquetCsvReader(filepath), f)
+        except BaseException:
+            f.close()
+            os.remove(csv_path)
+            raise
+    try:
+        _load_data_infile_mysql(engine, csv_path, table_name, columns)
+    finally:
+        os.remove(csv_path)
+
+def _executemany_load(engine, filepath, table_name, columns, batch_size=BULK_BATCH_SIZE):
+    """Batched executemany inside a single transaction"""
+    if engine.dialect.name == 'sqlite':
+        # Plain DB-API tuples skip SQLAlchemy's per-row parameter processing
+        quote = engine.dialect.identifier_preparer.quote
+        insert_sql = (f"INSERT INTO {quote(table_name)} ({', '.join(quote(c) for c in columns)}) "
+                      f"VALUES ({', '.join('?' * len(columns))})")
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            for batch in _iter_row_batches(filepath, batch_size):
+                cursor.executemany(insert_sql, batch)
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+        return
+    
+    insert = sqlalchemy.Table(table_name, sqlalchemy.MetaData(), autoload_with=engine).insert()
+    with engine.begin() as conn:
+        for batch in _iter_row_batches(filepath, batch_size):
+            conn.execute(insert, [dict(zip(columns, row)) for row in batch])
+
+def bulk_load_file(engine, filepath, table_name, if_exists='replace', batch_size=BULK_BATCH_SIZE):
+    """
+    Load a CSV or Parquet file through the database's native bulk path
+    
+    PostgreSQL uses COPY FROM STDIN and MySQL LOAD DATA LOCAL INFILE (for
+    Parquet files the rows are converted to CSV batch by batch on the way);
+    other databases get row batches through executemany in one
+    transaction. The file is never read into a full DataFrame.
+    
+    Returns:
+        str: Name of the load method used
+    """
+    columns = _prepare_table(engine, filepath, table_name, if_exists)
+    dialect = engine.dialect.name
+    
+    if dialect == 'postgresql':
+        _copy_postgresql(engine, filepath, table_name, columns)
+        return 'COPY FROM STDIN'
+    if dialect == 'mysql':
+        if _is_parquet(filepath):
+            _load_parquet_infile_mysql(engine, filepath, table_name, columns)
+        else:
+            _load_data_infile_mysql(engine, filepath, table_name, columns)
+        return 'LOAD DATA LOCAL INFILE'
+    _executemany_load(engine, filepath, table_name, columns, batch_size)
+    return 'executemany'
+
+def incremental_load_file(engine, filepath, table_name, key=INCREMENTAL_KEY, batch_size=BULK_BATCH_SIZE):
+    """
+    Apply only the rows of a file that differ from the table
+    
+    Each row is hashed and compared with ``{table}_row_hashes``: new keys
+    are inserted, keys whose hash changed are updated, and keys missing
+    from the file are deleted, in batched statements inside one
+    transaction. The table is never dropped, so its indexes, views and
+    grants survive. Without a hash table (first run, or after a full load)
+    the table's rows are deleted and reinserted once to build it. Repeated
+    keys in the file keep their first row.
+    
+    Returns:
+        dict: Row counts for inserted, updated, deleted, unchanged and duplicates
+    """
+    if not sqlalchemy.inspect(engine).has_table(table_name):
+        _prepare_table(engine, filepath, table_name, 'replace')
+    
+    columns = list(_read_sample(filepath, nrows=1).columns)
+    if key not in columns:
+        raise ValueError(f"Key column '{key}' not found in {filepath}")
+    table = sqlalchemy.Table(table_name, sqlalchemy.MetaData(), autoload_with=engine)
+    missing = [c for c in columns if c not in table.c]
+    if missing:
+        raise ValueError(f"Columns {missing} are not in table '{table_name}'; run a full load instead")
+    
+    hashes = _row_hash_table(table_name, key)
+    rebuild = not sqlalchemy.inspect(engine).has_table(hashes.name)
+    hashes.create(engine, checkfirst=True)
+    
+    key_index = columns.index(key)
+    # Bind names must not clash with column names in UPDATE ... SET
+    update_rows = table.update().where(table.c[key] == sqlalchemy.bindparam('b_key')).values(
+        {c: sqlalchemy.bindparam(f'b_{c}') for c in columns if c != key})
+    update_hashes = hashes.update().where(hashes.c[key] == sqlalchemy.bindparam('b_key')).values(
+        row_hash=sqlalchemy.bindparam('b_hash'))
+    
+    stats = dict.fromkeys(['inserted', 'updated', 'deleted', 'unchanged', 'duplicates'], 0)
+    inserts, updates = [], []
+    
+    def flush(conn):
+        if inserts:
+            conn.execute(table.insert(), [dict(zip(columns, row)) for row, _ in inserts])
+            conn.execute(hashes.insert(), [{key: row[key_index], 'row_hash': h} for row, h in inserts])
+            stats['inserted'] += len(inserts)
+        if updates:
+            conn.execute(update_rows, [{'b_key': row[key_index],
+                                        **{f'b_{c}': v for c, v in zip(columns, row) if c != key}}
+                                       for row, _ in updates])
+            conn.execute(update_hashes, [{'b_key': row[key_index], 'b_hash': h} for row, h in updates])
+            stats['updated'] += len(updates)
+        inserts.clear()
+        updates.clear()
+    
+    with engine.begin() as conn:
+        if rebuild:
+            logger.info(f"No row hashes for '{table_name}' yet; reloading its rows once to build them")
+            conn.execute(table.delete())
+            existing = {}
+        else:
+            existing = dict(conn.execute(sqlalchemy.select(hashes.c[key], hashes.c.row_hash)).all())
+        
+        seen = set()
+        for batch in _iter_row_batches(filepath, batch_size):
+            for row in batch:
+                row_key = row[key_index]
+                if row_key in seen:
+                    stats['duplicates'] += 1
+                    continue
+                seen.add(row_key)
+                row_hash = _row_hash(row)
+                old_hash = existing.get(row_key)
+                if old_hash == row_hash:
+                    stats['unchanged'] += 1
+                elif old_hash is None:
+                    inserts.append((row, row_hash))
+                else:
+                    updates.append((row, row_hash))
+            if len(inserts) + len(updates) >= batch_size:
+                flush(conn)
+        flush(conn)
+        
+        removed = [k for k in existing if k not in seen]
+        for start in range(0, len(removed), batch_size):
+            batch_keys = removed[start:start + batch_size]
+            conn.execute(table.delete().where(table.c[key].in_(batch_keys)))
+            conn.execute(hashes.delete().where(hashes.c[key].in_(batch_keys)))
+        stats['deleted'] = len(removed)
+    
+    if stats['duplicates']:
+        logger.warning(f"Skipped {stats['duplicates']} rows with a repeated {key} in {filepath}")
+    return stats
+
+def incremental_load_csv_to_sql(csv_filepath, table_name, key=INCREMENTAL_KEY):
+    """
+    Incrementally load a CSV or Parquet file keyed by ``key`` and log the changes
+    
+    A file without the key column is an error: the table is left untouched
+    rather than silently replaced.
+    """
+    try:
+        logger.info(f"Starting incremental load from {csv_filepath} to table '{table_name}'")
+        
+        if not os.path.exists(csv_filepath):
+            logger.error(f"CSV file not found: {csv_filepath}")
+            return False
+        if key not in _read_sample(csv_filepath, nrows=1).columns:
+            logger.error(f"Incremental load needs key column '{key}', which {csv_filepath} does not have; "
+                         f"rerun the analysis pipeline to regenerate it or use --method bulk")
+            return False
+        
+        engine = create_db_engine(DB_CONFIG)
+        
+        start_time = time.perf_counter()
+        stats = incremental_load_file(engine, csv_filepath, table_name, key=key)
+        duration = time.perf_counter() - start_time
+        
+        changed = stats['inserted'] + stats['updated'] + stats['deleted']
+        total = changed + stats['unchanged']
+        logger.info(f"Incremental load finished in {duration:.2f} seconds: "
+                    f"{stats['inserted']} inserted, {stats['updated']} updated, "
+                    f"{stats['deleted']} deleted, {stats['unchanged']} unchanged "
+                    f"({100 * changed / max(total, 1):.1f}% of rows changed)")
+        
+        engine.dispose()
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error loading data to SQL: {str(e)}", exc_info=True)
+        return False
+
+def load_csv_to_sql(csv_filepath, table_name, if_exists='replace', method='bulk'):
     """
     Load data from CSV file to SQL database
+    
+    Args:
+        csv_filepath: CSV or Parquet file to load
+        table_name: Target table
+        if_exists: 'replace', 'append' or 'fail'
+        method: 'bulk' for the native bulk loaders, 'to_sql' for pandas
+            multi-row INSERTs, 'incremental' to apply only changed rows
+            (``if_exists`` is ignored)
     """
+    if method == 'bulk':
+        return bulk_load_csv_to_sql(csv_filepath, table_name, if_exists)
+    if method == 'incremental':
+        return incremental_load_csv_to_sql(csv_filepath, table_name)
+    
     try:
         logger.info(f"Starting data load from {csv_filepath} to table '{table_name}'")
         
@@ -55,16 +467,19 @@ def load_csv_to_sql(csv_filepath, table_name, if_exists='replace'):
             logger.error(f"CSV file not found: {csv_filepath}")
             return False
         
-        logger.info("Reading CSV file...")
-        df = pd.read_csv(csv_filepath)
+        if csv_filepath.endswith(('.parquet', '.pq')):
+            logger.info("Reading Parquet file...")
+            df = pd.read_parquet(csv_filepath, engine='pyarrow')
+        else:
+            logger.info("Reading CSV file...")
+            df = pd.read_csv(csv_filepath)
         logger.info(f"Loaded {len(df)} rows and {len(df.columns)} columns")
         
         print(df.head())
         print(f"\nData types:\n{df.dtypes}")
         
         logger.info("Connecting to database...")
-        conn_string = create_connection_string(DB_CONFIG)
-        engine = create_engine(conn_string)
+        engine = create_db_engine(DB_CONFIG)
         
         with engine.connect() as conn:
             logger.info("Database connection successful")
@@ -80,11 +495,13 @@ def load_csv_to_sql(csv_filepath, table_name, if_exists='replace'):
             chunksize=1000,
             method='multi'
         )
+        _drop_row_hashes(engine, table_name)
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
-        logger.info(f"Data loaded successfully in {duration:.2f} seconds")
+        logger.info(f"Data loaded successfully in {duration:.2f} seconds "
+                    f"({len(df) / max(duration, 1e-9):,.0f} rows/sec)")
         logger.info(f"Total rows inserted: {len(df)}")
         
         # Verify data load
@@ -101,26 +518,62 @@ def load_csv_to_sql(csv_filepath, table_name, if_exists='replace'):
         logger.error(f"Error loading data to SQL: {str(e)}", exc_info=True)
         return False
 
-def main():
+def bulk_load_csv_to_sql(csv_filepath, table_name, if_exists='replace'):
+    """
+    Bulk-load a CSV or Parquet file and log the achieved rows/sec
+    """
+    try:
+        logger.info(f"Starting bulk load from {csv_filepath} to table '{table_name}'")
+        
+        if not os.path.exists(csv_filepath):
+            logger.error(f"CSV file not found: {csv_filepath}")
+            return False
+        
+        engine = create_db_engine(DB_CONFIG)
+        
+        start_time = time.perf_counter()
+        load_method = bulk_load_file(engine, csv_filepath, table_name, if_exists=if_exists)
+        duration = time.perf_counter() - start_time
+        
+        with engine.connect() as conn:
+            quote = engine.dialect.identifier_preparer.quote
+            count = conn.execute(sqlalchemy.text(f"SELECT COUNT(*) FROM {quote(table_name)}")).scalar()
+        
+        logger.info(f"Data loaded with {load_method} in {duration:.2f} seconds "
+                    f"({count / max(duration, 1e-9):,.0f} rows/sec)")
+        logger.info(f"Verified: {count} rows in table '{table_name}'")
+        
+        engine.dispose()
+        return True
+        
+    except Exception as e:
+        logger.error(f"Error loading data to SQL: {str(e)}", exc_info=True)
+        return False
+
+def main(method='bulk'):
     print("="*70)
     print("LOAD CSV DATA TO SQL DATABASE")
     print("="*70)
     
     raw_data_path = '../data/raw/customer_churn_raw.csv'
-    processed_data_path = '../data/processed/customer_churn_cleaned.csv'
+    processed_data_path = '../data/processed/customer_churn_cleaned.parquet'
+    if not os.path.exists(processed_data_path):
+        processed_data_path = '../data/processed/customer_churn_cleaned.csv'
     
     logger.info("\n--- Loading RAW data ---")
     success_raw = load_csv_to_sql(
         csv_filepath=raw_data_path,
         table_name='customers_raw',
-        if_exists='replace'
+        if_exists='replace',
+        method=method
     )
     
     logger.info("\n--- Loading PROCESSED data ---")
     success_processed = load_csv_to_sql(
         csv_filepath=processed_data_path,
         table_name='customers',
-        if_exists='replace'
+        if_exists='replace',
+        method=method
     )
     
     print("\n" + "="*70)
@@ -131,4 +584,11 @@ def main():
     print("="*70)
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Load customer churn data into the SQL database")
+    parser.add_argument('--method', choices=['bulk', 'to_sql', 'incremental'], default='bulk',
+                        help="Native bulk loader (default), pandas to_sql multi-row INSERTs, or "
+                             "an incremental load that applies only changed rows")
+    args = parser.parse_args()
+    main(method=args.method)
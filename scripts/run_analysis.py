@@ -4,6 +4,7 @@ Executes: Data Loading → Cleaning → EDA → Model Training → Evaluation
 """
 import sys 
 import os
+import argparse
 import logging
 import numpy as np
 from datetime import datetime
@@ -14,7 +15,14 @@ from src.data_preprocessing import ChurnDataPreprocessor
 from src.feature_engineering import ChurnFeatureEngineer
 from src.model_training import ChurnModelTrainer
 from src.visualization import ChurnVisualizer
+from src.model_evaluation import evaluate_models
+from src.rendering import BackgroundRenderer, is_headless, set_headless
 from src.utils import load_dataframe, save_dataframe
+from src.streaming import run_streaming_pipeline
+from src.stage_cache import StageCache
+from src.pipeline import PipelineExecutor
+from src.instrumentation import enable_profiling, reset_run_report, write_run_report
+from src import data_preprocessing, feature_engineering, model_training, schema, utils
 
 # Get base directory path (project root)
 base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -37,75 +45,165 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def main():
+def eda_chart_specs(charts_dir):
+    """
+    Chart specs for ChurnVisualizer.render_charts matching the EDA notebook's charts
+    """
+    def path(name):
+        return os.path.join(charts_dir, name)
+
+    return [
+        {'chart': 'correlation_heatmap', 'save_path': path('correlation_heatmap.png')},
+        {'chart': 'churn_rate_by_category', 'category_col': 'Contract',
+         'save_path': path('churn_by_contract.png')},
+        {'chart': 'churn_rate_by_category', 'category_col': 'InternetService',
+         'save_path': path('churn_by_internet_service.png')},
+        {'chart': 'churn_rate_by_category', 'category_col': 'PaymentMethod',
+         'save_path': path('churn_by_payment_method.png')},
+        {'chart': 'feature_distributions', 'features': ['tenure', 'MonthlyCharges'],
+         'save_path': path('numerical_features_distribution.png')},
+        {'chart': 'feature_distributions', 'features': ['gender', 'Partner', 'Dependents', 'PhoneService'],
+         'save_path': path('categorical_features_distribution.png')},
+        {'chart': 'tenure_segments', 'save_path': path('churn_by_tenure_segments.png')},
+        {'chart': 'revenue_impact', 'save_path': path('revenue_impact_analysis.png')},
+    ]
+
+def main(headless=False, use_cache=True, max_workers=None, profile=False, gb_engine='exact'):
     """
     Main execution function for the entire analysis pipeline
+    
+    The pipeline is a graph of stages run by PipelineExecutor: stages start
+    as soon as their inputs are ready, so plots, file exports,
+    cross-validation and test-set evaluation overlap. Per-stage times and
+    the critical path are logged at the end.
+    
+    With ``headless=True`` charts are rendered with the Agg backend, never
+    shown, and confusion matrices are drawn by background workers.
+    Loading, cleaning, feature engineering, training and cross-validation
+    are cached in data/cache/stages unless ``use_cache=False``; evaluation
+    and plots always run.
+    
+    Wall time, CPU time, peak-memory growth and row counts of every stage
+    are written to reports/metrics/run_report_<timestamp>.json/.csv; with
+    ``profile=True`` a cProfile dump per stage goes to reports/profiles.
+    
+    ``gb_engine='hist'`` trains HistGradientBoostingClassifier with the
+    label-encoded columns as native categorical features.
     """
+    if headless:
+        set_headless(True)
     
     # Get base directory path (project root)
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     
+    reset_run_report()
+    if profile:
+        enable_profiling(os.path.join(base_dir, 'reports', 'profiles'))
+    
     print("="*70)
     print("CUSTOMER CHURN ANALYSIS - AUTOMATED PIPELINE")
     print("="*70)
     
-    try:
-        # Step 1: Load Data
+    # Stages whose inputs, parameters and code are unchanged are reused from the cache
+    cache = StageCache(os.path.join(base_dir, 'data', 'cache', 'stages'), enabled=use_cache)
+    raw_path = os.path.join(base_dir, 'data', 'raw', 'customer_churn_raw.csv')
+    charts_dir = os.path.join(base_dir, 'visualizations', 'charts')
+    split_params = {'test_size': 0.2, 'random_state': 42}
+    # pyplot is not thread-safe: in-process plotting stays on the main thread
+    visualizer = ChurnVisualizer()
+    # One render pool for the whole run, started before any stage thread exists
+    renderer = BackgroundRenderer().start() if is_headless() else None
+    
+    def load():
         logger.info("Step 1: Loading raw data...")
-        df = load_dataframe(os.path.join(base_dir, 'data', 'raw', 'customer_churn_raw.csv'))
+        df, load_key = cache.run('load', lambda: load_dataframe(raw_path, use_schema=True),
+                                 files=[raw_path], code=[schema, utils])
         if df is None:
-            logger.error("Failed to load data. Exiting.")
-            return
-        
+            raise RuntimeError(f"Failed to load data from {raw_path}")
         logger.info(f"Loaded {len(df)} records")
-        
-        # Step 2: Preprocess Data
+        return df, load_key
+    
+    def clean(load):
         logger.info("Step 2: Preprocessing data...")
-        preprocessor = ChurnDataPreprocessor()
-        df_clean = preprocessor.clean_data(df.copy())
-        
-        # Save cleaned data
-        save_dataframe(df_clean, os.path.join(base_dir, 'data', 'processed', 'customer_churn_cleaned.csv'),
+        df, load_key = load
+        def run():
+            preprocessor = ChurnDataPreprocessor()
+            # customerID stays in the cleaned export as the key of incremental SQL loads
+            return preprocessor.clean_data(df.copy(), keep_id=True), preprocessor
+        (df_clean, preprocessor), clean_key = cache.run('clean', run, inputs=[load_key],
+                                                        code=[data_preprocessing])
+        if 'Churn' not in df_clean.columns:
+            raise RuntimeError("Target variable 'Churn' not found")
+        return df_clean, preprocessor, clean_key
+    
+    def save_clean(clean):
+        # Parquet keeps dtypes for Python consumers, CSV is kept for SQL imports and Power BI
+        df_clean = clean[0]
+        processed_dir = os.path.join(base_dir, 'data', 'processed')
+        os.makedirs(processed_dir, exist_ok=True)
+        save_dataframe(df_clean, os.path.join(processed_dir, 'customer_churn_cleaned.parquet'),
+                      'Cleaned dataset (Parquet)')
+        save_dataframe(df_clean, os.path.join(processed_dir, 'customer_churn_cleaned.csv'),
                       'Cleaned dataset')
-        
-        # Step 3: Feature Engineering
-        logger.info("Step 3: Engineering features...")
-        engineer = ChurnFeatureEngineer()
-        df_engineered = engineer.engineer_features(df_clean.copy())
-        
-        # Step 4: Prepare for modeling
-        logger.info("Step 4: Preparing data for modeling...")
-        if 'Churn' not in df_engineered.columns:
-            logger.error("Target variable 'Churn' not found")
-            return
+    
+    def eda_charts(clean):
+        # Aggregated in this thread, drawn in worker processes
+        return visualizer.render_charts(clean[0], eda_chart_specs(charts_dir), renderer=renderer)
+    
+    def features(clean):
+        df_clean, preprocessor, clean_key = clean
+        def run():
+            logger.info("Step 3: Engineering features...")
+            df_engineered = ChurnFeatureEngineer().engineer_features(df_clean.copy())
             
-        # Print Churn distribution before preprocessing
-        logger.info(f"Churn distribution before preprocessing: \n{df_engineered['Churn'].value_counts()}")
-        
-        X_scaled, y = preprocessor.preprocess_pipeline(df_engineered, target_col='Churn', fit=True)
-        
-        # Split data
-        from sklearn.model_selection import train_test_split
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_scaled, y, test_size=0.2, random_state=42, stratify=y
+            logger.info("Step 4: Preparing data for modeling...")
+            # Print Churn distribution before preprocessing
+            logger.info(f"Churn distribution before preprocessing: \n{df_engineered['Churn'].value_counts()}")
+            X_scaled, y = preprocessor.preprocess_pipeline(df_engineered, target_col='Churn', fit=True)
+            return X_scaled, y, preprocessor
+        (X_scaled, y, fitted_preprocessor), features_key = cache.run(
+            'features', run, inputs=[clean_key], params={'target_col': 'Churn'},
+            code=[feature_engineering, data_preprocessing])
+        return X_scaled, y, fitted_preprocessor, features_key
+    
+    def churn_distribution(features):
+        visualizer.plot_churn_distribution(
+            features[1],
+            save_path=os.path.join(charts_dir, 'churn_distribution.png')
         )
-        
+    
+    def split(features):
+        from sklearn.model_selection import train_test_split
+        X_scaled, y = features[0], features[1]
+        X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, stratify=y, **split_params)
         logger.info(f"Train size: {len(X_train)}, Test size: {len(X_test)}")
-        
-        # Step 5: Train Models
+        return X_train, X_test, y_train, y_test
+    
+    def train(features, split):
         logger.info("Step 5: Training machine learning models...")
-        trainer = ChurnModelTrainer()
-        models = trainer.train_all_models(X_train, y_train, balance_data=True)
-        
-        logger.info(f"Trained {len(models)} models successfully")
-        
-        # Step 6: Cross-validation
+        X_train, y_train = split[0], split[2]
+        def run():
+            trainer = ChurnModelTrainer()
+            trainer.train_all_models(X_train, y_train, balance_data=True, gb_engine=gb_engine,
+                                     preprocessor=features[2])
+            return trainer
+        trainer, train_key = cache.run('train', run, inputs=[features[3]],
+                                       params={**split_params, 'balance_data': True, 'gb_engine': gb_engine},
+                                       code=[model_training])
+        logger.info(f"Trained {len(trainer.models)} models successfully")
+        return trainer, train_key
+    
+    def cross_validation(split, train):
         logger.info("Step 6: Running cross-validation...")
-        cv_results = trainer.cross_validate(X_train, y_train, cv=5)
-        
-        # Step 7: Evaluate on test set
+        trainer, train_key = train
+        cv_results, _ = cache.run('cv', lambda: trainer.cross_validate(split[0], split[2], cv=5),
+                                  inputs=[train_key], params={'cv': 5}, code=[model_training])
+        return cv_results
+    
+    def evaluate(split, train):
         logger.info("Step 7: Evaluating models on test set...")
-        from sklearn.metrics import accuracy_score, roc_auc_score
+        X_test, y_test = split[1], split[3]
+        trainer = train[0]
         
         # Handle missing values in test set
         if isinstance(X_test, np.ndarray):
@@ -113,74 +211,130 @@ def main():
         else:
             X_test = X_test.fillna(X_test.mean())
         
-        results = []
-        for model_name, model in models.items():
-            try:
-                y_pred = model.predict(X_test)
-                y_pred_proba = model.predict_proba(X_test)[:, 1]
-                
-                accuracy = accuracy_score(y_test, y_pred)
-                roc_auc = roc_auc_score(y_test, y_pred_proba)
-                
-                results.append({
-                    'Model': model_name,
-                    'Accuracy': accuracy,
-                    'ROC-AUC': roc_auc
-                })
-                
-                logger.info(f"{model_name}: Accuracy={accuracy:.4f}, ROC-AUC={roc_auc:.4f}")
-            except Exception as e:
-                logger.error(f"Error evaluating {model_name}: {str(e)}")
-                continue
+        # Models were fitted on data passed through the trainer's scaler
+        if trainer.scaler is not None:
+            X_test = trainer.scaler.transform(X_test)
         
-        # Save best model
-        best_model_name = max(results, key=lambda x: x['ROC-AUC'])['Model']
-        logger.info(f"Best model: {best_model_name}")
+        # One predict_proba pass per model; probabilities are reused for plots
+        results, probabilities = evaluate_models(trainer.models, X_test, y_test, threshold=0.5,
+                                                 renderer=renderer)
+        for result in results:
+            logger.info(f"{result['Model']}: Accuracy={result['Accuracy']:.4f}, ROC-AUC={result['ROC_AUC']:.4f}")
         
+        best_model_name = max(results, key=lambda x: x['ROC_AUC'])['Model']
+        logger.info(f"Best model: {best_model_name}")
+        return results, probabilities, best_model_name
+    
+    def save_models(features, train, evaluate):
+        trainer, best_model_name = train[0], evaluate[2]
         trainer.save_model(best_model_name, os.path.join(base_dir, 'models', 'best_model.pkl'))
-        
-        # Step 8: Generate visualizations
-        logger.info("Step 8: Generating visualizations...")
-        visualizer = ChurnVisualizer()
-        
-        # Churn distribution
-        visualizer.plot_churn_distribution(
-            y, 
-            save_path=os.path.join(base_dir, 'visualizations', 'charts', 'churn_distribution.png')
-        )
-        
-        # ROC curve for best model
-        best_model = models[best_model_name]
-        y_pred_proba = best_model.predict_proba(X_test)[:, 1]
+        trainer.save_pipeline(best_model_name, os.path.join(base_dir, 'models', 'churn_scoring_pipeline.joblib'),
+                              features[2])
+    
+    def roc_curve(split, evaluate):
+        _, probabilities, best_model_name = evaluate
         visualizer.plot_roc_curve(
-            y_test, 
-            y_pred_proba, 
+            split[3],
+            probabilities[best_model_name],
             model_name=best_model_name,
-            save_path=os.path.join(base_dir, 'visualizations', 'charts', f'roc_curve_{best_model_name.lower().replace(" ", "_")}.png')
+            save_path=os.path.join(charts_dir, f'roc_curve_{best_model_name.lower().replace(" ", "_")}.png')
         )
-        
-        logger.info("Visualizations saved successfully")
-        
-        # Step 9: Save results summary
+    
+    def save_results(evaluate):
         import pandas as pd
-        results_df = pd.DataFrame(results)
+        results_df = pd.DataFrame(evaluate[0])
         results_df.to_csv(os.path.join(base_dir, 'reports', 'metrics', 'model_comparison.csv'), index=False)
-        
         logger.info("Results summary saved")
-        
-        # Final summary
-        print("\n" + "="*70)
-        print("ANALYSIS COMPLETE!")
-        print("="*70)
-        print(f"\nBest Model: {best_model_name}")
-        print(f"ROC-AUC Score: {max(results, key=lambda x: x['ROC-AUC'])['ROC-AUC']:.4f}")
-        print(f"\nResults saved to: reports/metrics/model_comparison.csv")
-        print(f"Model saved to: models/best_model.pkl")
-        print("="*70)
-        
+    
+    executor = PipelineExecutor(max_workers=max_workers)
+    executor.add_stage('load', load)
+    executor.add_stage('clean', clean, deps=['load'])
+    executor.add_stage('save_clean', save_clean, deps=['clean'])
+    executor.add_stage('eda_charts', eda_charts, deps=['clean'])
+    executor.add_stage('features', features, deps=['clean'])
+    executor.add_stage('churn_distribution', churn_distribution, deps=['features'], main_thread=True)
+    executor.add_stage('split', split, deps=['features'])
+    executor.add_stage('train', train, deps=['features', 'split'])
+    executor.add_stage('cross_validation', cross_validation, deps=['split', 'train'])
+    # Without a background renderer evaluate_models draws with pyplot in-process
+    executor.add_stage('evaluate', evaluate, deps=['split', 'train'], main_thread=renderer is None)
+    executor.add_stage('save_models', save_models, deps=['features', 'train', 'evaluate'])
+    executor.add_stage('roc_curve', roc_curve, deps=['split', 'evaluate'], main_thread=True)
+    executor.add_stage('save_results', save_results, deps=['evaluate'])
+    
+    try:
+        outputs = executor.run()
     except Exception as e:
         logger.error(f"Pipeline failed with error: {str(e)}", exc_info=True)
         raise
+    finally:
+        if renderer is not None:
+            renderer.shutdown()
+        write_run_report(os.path.join(base_dir, 'reports', 'metrics'))
+    
+    logger.info("Visualizations saved successfully")
+    executor.log_report()
+    
+    results, _, best_model_name = outputs['evaluate']
+    
+    # Final summary
+    print("\n" + "="*70)
+    print("ANALYSIS COMPLETE!")
+    print("="*70)
+    print(f"\nBest Model: {best_model_name}")
+    print(f"ROC-AUC Score: {max(results, key=lambda x: x['ROC_AUC'])['ROC_AUC']:.4f}")
+    critical_path, critical_time = executor.critical_path()
+    print(f"Wall time: {executor.wall_time:.1f}s (critical path {critical_time:.1f}s: {' -> '.join(critical_path)})")
+    print(f"\nResults saved to: reports/metrics/model_comparison.csv")
+    print(f"Model saved to: models/best_model.pkl")
+    print(f"Scoring pipeline saved to: models/churn_scoring_pipeline.joblib")
+    print("="*70)
+
+def main_streaming(chunksize=100_000):
+    """
+    Clean and engineer the raw data chunk by chunk without loading it all at once
+    """
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    processed_dir = os.path.join(base_dir, 'data', 'processed')
+    os.makedirs(processed_dir, exist_ok=True)
+
+    print("="*70)
+    print("CUSTOMER CHURN ANALYSIS - STREAMING PREPROCESSING")
+    print("="*70)
+
+    rows = run_streaming_pipeline(
+        os.path.join(base_dir, 'data', 'raw', 'customer_churn_raw.csv'),
+        os.path.join(processed_dir, 'customer_churn_engineered.parquet'),
+        chunksize=chunksize,
+    )
+    print(f"\nEngineered rows written: {rows:,}")
+    print("Output saved to: data/processed/customer_churn_engineered.parquet")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run the customer churn analysis pipeline")
+    parser.add_argument('--stream', action='store_true',
+                        help="Only clean and engineer the raw data in bounded-memory chunks")
+    parser.add_argument('--chunksize', type=int, default=100_000,
+                        help="Rows per chunk in --stream mode")
+    parser.add_argument('--headless', action='store_true',
+                        help="Save charts without opening windows (for servers and batch runs)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Recompute every stage instead of reusing cached outputs")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Threads running independent pipeline stages concurrently")
+    parser.add_argument('--profile', action='store_true',
+                        help="Write a cProfile dump per pipeline stage to reports/profiles")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="Delete cached stage outputs before running")
+    parser.add_argument('--gb-engine', choices=['exact', 'hist'], default='exact',
+                        help="Gradient boosting engine; 'hist' uses native categorical features")
+    args = parser.parse_args()
+    
+    if args.clear_cache:
+        StageCache(os.path.join(base_dir, 'data', 'cache', 'stages')).clear()
+
+    if args.stream:
+        main_streaming(chunksize=args.chunksize)
+    else:
+        main(headless=args.headless, use_cache=not args.no_cache, max_workers=args.workers,
+             profile=args.profile, gb_engine=args.gb_engine)
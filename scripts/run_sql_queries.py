@@ -0,0 +1,437 @@
+"""
+Run the analytical SQL in sql/queries against the database
+
+Discovers sql/queries/*.sql and sql/queries/advanced/*.sql, splits each
+file into statements and runs the SELECTs through one pooled connection,
+recording execution time, row counts and the EXPLAIN plan of every
+statement. Results are cached keyed on the statement text and the version
+of the tables it reads, so rerunning unchanged dashboards against
+unchanged tables does not query the database at all.
+
+Usage (from the scripts directory, like the other SQL scripts):
+    python run_sql_queries.py
+    python run_sql_queries.py --pattern "0[1-4]*" --no-cache
+"""
+
+import argparse
+import fnmatch
+import logging
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+import sqlalchemy
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from export_sql_to_csv import DB_CONFIG, dispose_engine, get_engine
+from src.stage_cache import StageCache
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+QUERY_DIRS = [
+    os.path.join(base_dir, 'sql', 'queries'),
+    os.path.join(base_dir, 'sql', 'queries', 'advanced'),
+]
+CACHE_DIR = os.path.join(base_dir, 'data', 'cache', 'sql_queries')
+RESULTS_DIR = os.path.join(base_dir, 'data', 'sql_exports', 'queries')
+REPORT_DIR = os.path.join(base_dir, 'reports', 'metrics')
+
+# Only read-only statements are run; anything else in a query file is skipped
+_READ_ONLY = re.compile(r'^\s*(SELECT|WITH)\b', re.IGNORECASE)
+_WRITES_FILE = re.compile(r'\bINTO\s+(OUTFILE|DUMPFILE)\b', re.IGNORECASE)
+_TOKEN = re.compile(r"`[^`]*`|\"[^\"]*\"|\[[^\]]*\]|'(?:[^']|'')*'|[A-Za-z_][\w$]*|\d[\w.]*|\S")
+_CTE_NAME = re.compile(r'(?:\bWITH(?:\s+RECURSIVE)?|,)\s*([A-Za-z_][\w$]*)\s*(?:\([^()]*\))?\s+AS\s*\(',
+                       re.IGNORECASE)
+# FROM is part of these functions' syntax, e.g. EXTRACT(YEAR FROM signup_date)
+_FROM_FUNCTIONS = {'EXTRACT', 'TRIM', 'SUBSTRING', 'POSITION', 'OVERLAY'}
+# Keywords ending a FROM clause's comma-separated table list
+_END_OF_FROM = {'WHERE', 'GROUP', 'HAVING', 'ORDER', 'LIMIT', 'OFFSET', 'FETCH', 'UNION', 'EXCEPT',
+                'INTERSECT', 'WINDOW', 'QUALIFY', 'ON', 'USING', 'SELECT', 'INTO'}
+
+
+def discover_query_files(query_dirs=QUERY_DIRS, pattern='*'):
+    """Sorted .sql files of each query directory whose name matches ``pattern``"""
+    files = []
+    for directory in query_dirs:
+        if not os.path.isdir(directory):
+            continue
+        files.extend(os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                     if name.endswith('.sql') and fnmatch.fnmatch(name, pattern))
+    return files
+
+
+def split_statements(sql_text):
+    """
+    Split a SQL script into statements, dropping comments
+
+    Semicolons and comment markers inside quoted strings or identifiers are
+    left alone.
+    """
+    statements, current = [], []
+    i, n = 0, len(sql_text)
+    quote = None
+    while i < n:
+        char = sql_text[i]
+        if quote:
+            current.append(char)
+            if char == quote:
+                quote = None
+        elif char in ("'", '"', '`'):
+            quote = char
+            current.append(char)
+        elif sql_text.startswith('--', i) or char == '#':
+            end = sql_text.find('\n', i)
+            i = n if end == -1 else end
+            continue
+        elif sql_text.startswith('/*', i):
+            end = sql_text.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            current.append(' ')
+            continue
+        elif char == ';':
+            statements.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statements.append(''.join(current).strip())
+    return [statement for statement in statements if statement]
+
+
+def _table_references(statement):
+    """
+    Every name read after FROM or JOIN, as a list of its dotted parts
+
+    Comma-separated FROM lists and qualified names (schema.table) are
+    followed; derived tables are skipped here and their own FROM clauses
+    picked up as the scan reaches them.
+    """
+    tokens = [token.strip('`"[]') if token[0] in '`"[' else token for token in _TOKEN.findall(statement)]
+    references = []
+    # Per parenthesis level: whether the scan is inside a FROM list, and the
+    # token before the opening parenthesis
+    in_from, openers = [False], [None]
+    expect_table = False
+    i = 0
+    while i < len(tokens):
+        token, upper = tokens[i], tokens[i].upper()
+        previous = tokens[i - 1].upper() if i else None
+        if token == '(':
+            in_from.append(False)
+            openers.append(previous)
+            expect_table = False
+        elif token == ')':
+            if len(in_from) > 1:
+                in_from.pop()
+                openers.pop()
+        elif upper in ('FROM', 'JOIN'):
+            if upper == 'FROM' and (openers[-1] in _FROM_FUNCTIONS or previous == 'DISTINCT'):
+                pass
+            else:
+                in_from[-1] = expect_table = True
+        elif expect_table and upper != 'LATERAL':
+            expect_table = False
+            parts = [token]
+            while i + 2 < len(tokens) and tokens[i + 1] == '.':
+                parts.append(tokens[i + 2])
+                i += 2
+            if re.match(r'[A-Za-z_]', parts[0]):
+                references.append(parts)
+        elif token == ',' and in_from[-1]:
+            expect_table = True
+        elif upper in _END_OF_FROM:
+            in_from[-1] = False
+        i += 1
+    return references
+
+
+def referenced_tables(statement, table_names, default_schema=None):
+    """
+    Database tables a statement reads
+
+    CTE names are not tables and drop out. A name qualified with a schema
+    other than ``default_schema`` is not among ``table_names``.
+
+    Returns:
+        list or None: Sorted table names; None when the statement reads
+        something that is neither one of ``table_names`` nor a CTE (a table
+        function, another schema's table, ...), whose version is unknown
+    """
+    lookup = {name.lower(): name for name in table_names}
+    ctes = {name.lower() for name in _CTE_NAME.findall(statement)}
+    tables = set()
+    for parts in _table_references(statement):
+        name = parts[-1].lower()
+        if len(parts) == 1 and name in ctes:
+            continue
+        qualified_here = len(parts) == 2 and default_schema and parts[0].lower() == default_schema.lower()
+        if name not in lookup or not (len(parts) == 1 or qualified_here):
+            return None
+        tables.add(lookup[name])
+    return sorted(tables)
+
+
+def table_version(conn, table_name, full_checksum=False):
+    """
+    Cheap value that changes whenever a table's contents change
+
+    Read from metadata, never from the rows: MySQL uses the table's
+    information_schema create and update times, SQL Server the last user
+    update recorded in sys.dm_db_index_usage_stats plus the server start
+    time (the statistics are reset on restart); PostgreSQL uses the table's
+    write counters and file node (rewritten by TRUNCATE or a reload);
+    SQLite, where the whole database is one file, uses the header's file
+    change counter plus the size and modification time of the database and
+    its write-ahead log.
+
+    Args:
+        conn: Open connection
+        table_name: Table to version
+        full_checksum: On MySQL and SQL Server, checksum every row instead
+            (CHECKSUM TABLE / CHECKSUM_AGG); exact but reads the whole table
+
+    Returns:
+        str or None: None when the dialect offers no version, which disables
+        caching of queries reading the table
+    """
+    dialect = conn.dialect.name
+    quoted = conn.dialect.identifier_preparer.quote(table_name)
+    if dialect == 'mysql':
+        if full_checksum:
+            row = conn.exec_driver_sql(f"CHECKSUM TABLE {quoted}").fetchone()
+            return str(row[1])
+        row = conn.execute(sqlalchemy.text(
+            "SELECT CREATE_TIME, UPDATE_TIME FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"), {'name': table_name}).fetchone()
+        # UPDATE_TIME is not persisted across restarts; without it the table
+        # may have changed unnoticed
+        if row is None or row[1] is None:
+            return None
+        return '-'.join(map(str, row))
+    if dialect == 'mssql':
+        if full_checksum:
+            row = conn.exec_driver_sql(
+                f"SELECT COUNT_BIG(*), CHECKSUM_AGG(BINARY_CHECKSUM(*)) FROM {quoted}").fetchone()
+            return '-'.join(map(str, row))
+        row = conn.execute(sqlalchemy.text(
+            "SELECT (SELECT sqlserver_start_time FROM sys.dm_os_sys_info), o.modify_date, "
+            "(SELECT MAX(last_user_update) FROM sys.dm_db_index_usage_stats "
+            " WHERE database_id = DB_ID() AND object_id = o.object_id) "
+            "FROM sys.objects o WHERE o.object_id = OBJECT_ID(:name)"), {'name': table_name}).fetchone()
+        return '-'.join(map(str, row)) if row else None
+    if dialect == 'postgresql':
+        row = conn.execute(sqlalchemy.text(
+            "SELECT n_tup_ins, n_tup_upd, n_tup_del, pg_relation_filenode(relid) "
+            "FROM pg_stat_user_tables WHERE relname = :name"), {'name': table_name}).fetchone()
+        return '-'.join(map(str, row)) if row else None
+    if dialect == 'sqlite':
+        database = conn.engine.url.database
+        if database and database != ':memory:' and os.path.exists(database):
+            with open(database, 'rb') as f:
+                change_counter = int.from_bytes(f.read(28)[24:28], 'big')
+            stats = [os.stat(path) for path in (database, database + '-wal') if os.path.exists(path)]
+            return '-'.join([str(change_counter)] + [f'{st.st_size}.{st.st_mtime_ns}' for st in stats])
+    return None
+
+
+def explain_plan(conn, statement):
+    """
+    Text of the database's EXPLAIN output for a statement
+
+    Returns:
+        pd.DataFrame or None: One row per plan line; None if the dialect has
+        no EXPLAIN this runner understands or the EXPLAIN failed
+    """
+    prefix = {
+        'sqlite': 'EXPLAIN QUERY PLAN ',
+        'mysql': 'EXPLAIN ',
+        'postgresql': 'EXPLAIN ',
+    }.get(conn.dialect.name)
+    if prefix is None:
+        return None
+    try:
+        result = conn.exec_driver_sql(prefix + statement)
+        return pd.DataFrame(result.fetchall(), columns=list(result.keys())).astype(str)
+    except Exception as e:
+        logger.warning(f"EXPLAIN failed: {str(e).splitlines()[0]}")
+        return None
+
+
+def _query_name(filepath, index, count):
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    return f'{name}_{index}' if count > 1 else name
+
+
+def run_sql_queries(query_files, engine=None, cache=None, results_dir=RESULTS_DIR, full_checksum=False):
+    """
+    Run every read-only statement of ``query_files`` on one pooled connection
+
+    Each statement's result and EXPLAIN plan are cached in ``cache`` under a
+    key of its text plus the versions of the tables it reads; a hit returns
+    the stored result without touching the database. Results are written
+    to ``results_dir`` as CSV. ``full_checksum`` versions tables by their
+    rows instead of metadata (see table_version).
+
+    Returns:
+        list: One record per statement with query, file, status ('ok',
+        'cached', 'failed' or 'skipped'), rows, columns, seconds, tables,
+        plan and error
+    """
+    engine = engine or get_engine()
+    records = []
+    os.makedirs(results_dir, exist_ok=True)
+
+    with engine.connect() as conn:
+        if conn.dialect.name == 'mysql' and not full_checksum:
+            # MySQL 8 otherwise serves UPDATE_TIME from a cache up to a day old
+            try:
+                conn.exec_driver_sql("SET SESSION information_schema_stats_expiry = 0")
+            except Exception:
+                conn.rollback()
+        inspector = sqlalchemy.inspect(conn)
+        table_names = inspector.get_table_names()
+        default_schema = inspector.default_schema_name
+        versions = {}
+
+        for filepath in query_files:
+            with open(filepath, encoding='utf-8') as f:
+                statements = split_statements(f.read())
+
+            for index, statement in enumerate(statements, 1):
+                name = _query_name(filepath, index, len(statements))
+                record = {'query': name, 'file': os.path.relpath(filepath, base_dir), 'status': 'failed',
+                          'rows': None, 'columns': None, 'seconds': None, 'tables': None,
+                          'plan': None, 'error': None}
+                records.append(record)
+                if not _READ_ONLY.match(statement) or _WRITES_FILE.search(statement):
+                    record['status'] = 'skipped'
+                    logger.warning(f"Skipping {name}: not a plain SELECT")
+                    continue
+
+                tables = referenced_tables(statement, table_names, default_schema)
+                if tables is None:
+                    logger.info(f"Not caching {name}: it reads objects whose version is unknown")
+                else:
+                    record['tables'] = ', '.join(tables)
+                start = time.perf_counter()
+                try:
+                    for table in tables or ():
+                        if table not in versions:
+                            versions[table] = table_version(conn, table, full_checksum)
+                    table_versions = {table: versions[table] for table in tables or ()}
+
+                    def execute():
+                        result = pd.read_sql(statement, conn)
+                        plan = explain_plan(conn, statement)
+                        output = {'result': result}
+                        if plan is not None:
+                            output['plan'] = plan
+                        return output
+
+                    # Without a version for every table the cache could serve stale results
+                    use_cache = cache is not None and tables and None not in table_versions.values()
+                    if use_cache:
+                        hits = len(cache.hits)
+                        output, _ = cache.run(name, execute, inputs=[statement],
+                                              params={'dialect': conn.dialect.name, 'tables': table_versions})
+                        cached = len(cache.hits) > hits
+                    else:
+                        output, cached = execute(), False
+                    # A failed query rolls back the connection's implicit transaction
+                    conn.rollback()
+
+                    result = output['result']
+                    result.to_csv(os.path.join(results_dir, f'{name}.csv'), index=False)
+                    plan = output.get('plan')
+                    record.update(status='cached' if cached else 'ok', rows=len(result),
+                                  columns=len(result.columns),
+                                  plan=None if plan is None else '\n'.join(
+                                      ' | '.join(row) for row in plan.itertuples(index=False)))
+                except Exception as e:
+                    conn.rollback()
+                    record['error'] = str(e).splitlines()[0]
+                    logger.error(f"Query {name} failed: {record['error']}")
+                record['seconds'] = time.perf_counter() - start
+
+    return records
+
+
+def print_query_summary(records, wall_time):
+    """Per-statement status, row counts and latency"""
+    print("\n" + "="*78)
+    print("SQL QUERY SUMMARY")
+    print("="*78)
+    print(f"{'query':<40}{'status':<9}{'rows':>9}{'seconds':>10}")
+    for record in records:
+        rows = f"{record['rows']:,}" if record['rows'] is not None else '-'
+        seconds = f"{record['seconds']:.3f}" if record['seconds'] is not None else '-'
+        print(f"{record['query'][:39]:<40}{record['status']:<9}{rows:>9}{seconds:>10}")
+        if record['error']:
+            print(f"   ✗ {record['error'][:100]}")
+    counts = pd.Series([record['status'] for record in records]).value_counts().to_dict()
+    print("-"*78)
+    print(', '.join(f"{count} {status}" for status, count in counts.items()) + f" in {wall_time:.3f}s")
+    print("="*78)
+
+
+def write_query_report(records, directory=REPORT_DIR, run_id=None):
+    """
+    Save the per-statement records (including EXPLAIN plans) as JSON and CSV
+
+    Returns:
+        tuple: (json_path, csv_path), or None if the report could not be written
+    """
+    run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+    try:
+        os.makedirs(directory, exist_ok=True)
+        report = pd.DataFrame(records)
+        json_path = os.path.join(directory, f'sql_query_report_{run_id}.json')
+        csv_path = os.path.join(directory, f'sql_query_report_{run_id}.csv')
+        report.to_json(json_path, orient='records', indent=2)
+        report.drop(columns='plan').to_csv(csv_path, index=False)
+        logger.info(f"✅ Query report saved to {json_path}")
+        return json_path, csv_path
+    except Exception as e:
+        logger.error(f"❌ Failed to write query report: {str(e)}")
+        return None
+
+
+def main(pattern='*', use_cache=True, full_checksum=False):
+    print("="*78)
+    print("RUN ANALYTICAL SQL QUERIES")
+    print("="*78)
+
+    query_files = discover_query_files(pattern=pattern)
+    logger.info(f"Found {len(query_files)} query files ({DB_CONFIG['type']} database)")
+
+    cache = StageCache(CACHE_DIR, enabled=use_cache, mmap=False)
+    start = time.perf_counter()
+    try:
+        records = run_sql_queries(query_files, cache=cache, full_checksum=full_checksum)
+    finally:
+        dispose_engine()
+
+    print_query_summary(records, time.perf_counter() - start)
+    write_query_report(records)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the analytical SQL queries in sql/queries")
+    parser.add_argument('--pattern', default='*', help="Only run query files matching this glob")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Query the database even when the cached result is current")
+    parser.add_argument('--clear-cache', action='store_true', help="Delete cached query results first")
+    parser.add_argument('--full-checksum', action='store_true',
+                        help="Version tables by checksumming their rows (MySQL/SQL Server) instead of metadata")
+    args = parser.parse_args()
+
+    if args.clear_cache:
+        StageCache(CACHE_DIR).clear()
+    main(pattern=args.pattern, use_cache=not args.no_cache, full_checksum=args.full_checksum)
@@ -1,29 +1,45 @@
 """
 Customer Churn Analysis Package
+
+Submodules are imported on first attribute access, so ``from src import
+ChurnDataPreprocessor`` does not pay for scikit-learn model code,
+matplotlib or seaborn.
 """
 
+import importlib
+
 __version__ = '1.0.0'
 __author__ = 'Your Name'
 
 
-from src.data_preprocessing import ChurnDataPreprocessor
-from src.feature_engineering import (create_engineered_features, encode_categorical_variables, 
-    handle_missing_values,print_feature_engineering_summary)
-from src.model_training import ChurnModelTrainer
-from src.visualization import ChurnVisualizer
-from src.utils import load_dataframe, save_dataframe
-from src.model_evaluation import evaluate_model
-
-__all__ = [
-    "ChurnDataPreprocessor",
-    "create_engineered_features", 
-    "encode_categorical_variables",
-    "handle_missing_values",
-    "print_feature_engineering_summary",
-    "ChurnModelTrainer",
-    "ChurnVisualizer",
-	"load_dataframe",
-	"save_dataframe",
-	"evaluate_model",
-]
-    
\ No newline at end of file
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "ChurnDataPreprocessor": "src.data_preprocessing",
+    "create_engineered_features": "src.feature_engineering",
+    "encode_categorical_variables": "src.feature_engineering",
+    "handle_missing_values": "src.feature_engineering",
+    "print_feature_engineering_summary": "src.feature_engineering",
+    "ChurnModelTrainer": "src.model_training",
+    "ChurnVisualizer": "src.visualization",
+    "load_dataframe": "src.utils",
+    "save_dataframe": "src.utils",
+    "evaluate_model": "src.model_evaluation",
+    "evaluate_models": "src.model_evaluation",
+    "ChurnScorer": "src.scoring",
+    "load_scorer": "src.scoring",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
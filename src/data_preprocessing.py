@@ -7,6 +7,8 @@ import numpy as np
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 import logging
 
+from src.instrumentation import instrumented
+
 logger = logging.getLogger(__name__)
 
 class ChurnDataPreprocessor:
@@ -14,13 +16,27 @@ class ChurnDataPreprocessor:
     Comprehensive data preprocessing for churn analysis
     """
     
+    # Code assigned to categories not seen when the encoders were fitted
+    UNKNOWN_CODE = -1
+    
     def __init__(self):
         self.label_encoders = {}
         self.scaler = StandardScaler()
+        self.total_charges_median = None
+        self.feature_columns = None
+        self.categorical_columns = []
         
-    def clean_data(self, df):
+    @instrumented()
+    def clean_data(self, df, fit=True, drop_duplicates=True, keep_id=False):
         """
         Clean raw data: handle missing values, duplicates, and data types
+
+        With ``fit=False`` missing ``TotalCharges`` are filled with the median
+        learned on an earlier call instead of the median of ``df``, so that
+        chunks of a larger file are cleaned consistently. Scoring passes
+        ``drop_duplicates=False`` so every input row gets a prediction.
+        ``keep_id=True`` keeps ``customerID`` (the key of incremental SQL
+        loads) in the cleaned export; it is never a model feature.
         """
         logger.info("Starting data cleaning...")
         
@@ -28,39 +44,49 @@ class ChurnDataPreprocessor:
         df = df.copy()
         
         # Remove duplicates
-        initial_rows = len(df)
-        df = df.drop_duplicates()
-        logger.info(f"Removed {initial_rows - len(df)} duplicate rows")
+        if drop_duplicates:
+            initial_rows = len(df)
+            df = df.drop_duplicates()
+            logger.info(f"Removed {initial_rows - len(df)} duplicate rows")
         
         # Handle TotalCharges if exists
         if 'TotalCharges' in df.columns:
-            df.loc[:, 'TotalCharges'] = pd.to_numeric(df['TotalCharges'], errors='coerce')
-            median_value = df['TotalCharges'].median()
-            df.loc[:, 'TotalCharges'] = df['TotalCharges'].fillna(median_value)
+            # Whole-column assignment: .loc[:, col] would keep the object dtype of text input
+            df['TotalCharges'] = pd.to_numeric(df['TotalCharges'], errors='coerce')
+            if fit or self.total_charges_median is None:
+                self.total_charges_median = df['TotalCharges'].median()
+            df['TotalCharges'] = df['TotalCharges'].fillna(self.total_charges_median)
         
         # Handle binary columns if present
         binary_cols = ['Churn'] if 'Churn' in df.columns else []
         for col in binary_cols:
             if df[col].dtype == 'object':
                 df.loc[:, col] = df[col].map({'Yes': 1, 'No': 0})
+            elif isinstance(df[col].dtype, pd.CategoricalDtype):
+                # Schema-typed loads keep Yes/No flags as categories
+                df[col] = df[col].map({'Yes': 1, 'No': 0}).astype('Int8')
         
         # Remove customer ID if present
-        if 'customerID' in df.columns:
+        if 'customerID' in df.columns and not keep_id:
             df = df.drop('customerID', axis=1)
         
         logger.info(f"Data cleaning completed. Final shape: {df.shape}")
         return df
     
+    @instrumented()
     def encode_categorical(self, df, fit=True):
         """
         Encode categorical variables
         """
         logger.info("Encoding categorical variables...")
         
-        # Handle categorical columns (including tenure_group which might be categorical)
-        categorical_cols = list(df.select_dtypes(include=['object']).columns)
-        if 'tenure_group' in df.columns and df['tenure_group'].dtype != 'object':
-            categorical_cols.append('tenure_group')
+        # Handle categorical columns (object text plus category dtypes such as
+        # tenure_group/charge_category or schema-typed loads)
+        categorical_cols = list(df.select_dtypes(include=['object', 'category']).columns)
+        if fit:
+            # Integer-coded columns, e.g. for native categorical support in
+            # HistGradientBoostingClassifier
+            self.categorical_columns = [col for col in categorical_cols if col != 'Churn']
         
         for col in categorical_cols:
             if col == 'Churn':
@@ -72,13 +98,46 @@ class ChurnDataPreprocessor:
                 self.label_encoders[col] = le
             else:
                 if col in self.label_encoders:
-                    le = self.label_encoders[col]
-                    df[col] = df[col].map(lambda x: le.transform([str(x)]) 
-                                          if str(x) in le.classes_ else -1)
+                    df[col] = self._transform_with_encoder(df[col], self.label_encoders[col])
         
         logger.info(f"Encoded {len(categorical_cols)} categorical columns")
         return df
     
+    def _transform_with_encoder(self, series, le):
+        """
+        Encode a whole column with a fitted LabelEncoder in one vectorized lookup.
+
+        Values unseen during fitting get ``UNKNOWN_CODE``. Categorical columns
+        are looked up once per category and expanded through their codes.
+        """
+        lookup = pd.Index(le.classes_)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            category_codes = lookup.get_indexer(series.cat.categories.astype(str))
+            # Missing values were fitted as the string 'nan'
+            missing_code = lookup.get_indexer(['nan'])[0]
+            # Code -1 (missing) picks the appended last entry, which also covers
+            # a column with no categories at all
+            category_codes = np.append(category_codes, missing_code)
+            encoded = category_codes[series.cat.codes.to_numpy()]
+        else:
+            encoded = lookup.get_indexer(series.astype(str))
+        encoded = np.where(encoded >= 0, encoded, self.UNKNOWN_CODE).astype(np.int64)
+        return pd.Series(encoded, index=series.index, name=series.name)
+    
+    def categorical_feature_indices(self):
+        """
+        Positions of the label-encoded categorical columns in ``feature_columns``
+        
+        Returns:
+            list: Column indices into the preprocessed feature matrix (empty
+            before preprocess_pipeline(fit=True) has run)
+        """
+        if self.feature_columns is None:
+            return []
+        return [self.feature_columns.index(col) for col in self.categorical_columns
+                if col in self.feature_columns]
+    
+    @instrumented()
     def scale_features(self, X, fit=True):
         """
         Scale numerical features and handle missing values
@@ -98,6 +157,7 @@ class ChurnDataPreprocessor:
         
         return X_scaled
     
+    @instrumented()
     def preprocess_pipeline(self, df, target_col='Churn', fit=True):
         """
         Complete preprocessing pipeline
@@ -119,7 +179,7 @@ class ChurnDataPreprocessor:
             y = None
             
         # Clean features
-        X = self.clean_data(X)
+        X = self.clean_data(X, fit=fit)
         
         # Update y to match X's index after cleaning
         if y is not None:
@@ -131,11 +191,15 @@ class ChurnDataPreprocessor:
                 y = y.fillna(mode_value)
             y = y.astype(int)  # Ensure target is integer type
             
-        logger.info(f"Target distribution: \n{y.value_counts()}")
+            logger.info(f"Target distribution: \n{y.value_counts()}")
         
         # Encode categorical
         X = self.encode_categorical(X, fit=fit)
         
+        # Remember the feature order the scaler (and models) were fitted on
+        if fit:
+            self.feature_columns = list(X.columns)
+        
         # Scale features
         X_scaled = self.scale_features(X, fit=fit)
         
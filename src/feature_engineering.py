@@ -5,18 +5,50 @@ import numpy as np
 from sklearn.preprocessing import LabelEncoder
 import os
 
-def create_engineered_features(df):
-
-    print("="*70)
-    print("CREATING NEW FEATURES")
-    print("="*70)
+from src.instrumentation import instrumented
+
+# Binning and service settings used by create_engineered_features
+TENURE_BINS = [0, 12, 24, 48, 72]
+TENURE_LABELS = ['0-1 year', '1-2 years', '2-4 years', '4+ years']
+CHARGE_BINS = [0, 35, 70, 120]
+CHARGE_LABELS = ['Low', 'Medium', 'High']
+SERVICE_COLUMNS = ['PhoneService', 'InternetService', 'OnlineSecurity', 
+                   'OnlineBackup', 'DeviceProtection', 'TechSupport', 
+                   'StreamingTV', 'StreamingMovies']
+
+# Snapshot stored with scoring artifacts to detect feature logic drift
+FEATURE_ENGINEERING_CONFIG = {
+    'tenure_bins': TENURE_BINS,
+    'tenure_labels': TENURE_LABELS,
+    'charge_bins': CHARGE_BINS,
+    'charge_labels': CHARGE_LABELS,
+    'service_columns': SERVICE_COLUMNS,
+}
+
+
+def _silent(*args, **kwargs):
+    pass
+
+@instrumented()
+def create_engineered_features(df, verbose=True):
+    """
+    Add tenure, charge, service, contract and demographic features.
+
+    Set ``verbose=False`` to silence the progress printout, e.g. when the
+    function is applied to many chunks of a large file.
+    """
+    echo = print if verbose else _silent
+
+    echo("="*70)
+    echo("CREATING NEW FEATURES")
+    echo("="*70)
     
     df_engineered = df.copy()
     
     # ============================================================
     # DATA TYPE VALIDATION AND CONVERSION
     # ============================================================
-    print("\n[Data Type Validation]")
+    echo("\n[Data Type Validation]")
 
     # Ensure numeric columns are actually numeric
     numeric_columns = ['TotalCharges', 'MonthlyCharges', 'tenure']
@@ -31,74 +63,70 @@ def create_engineered_features(df):
                 if df_engineered[col].isnull().any():
                     fill_value = df_engineered[col].median()
                     df_engineered[col].fillna(fill_value, inplace=True)
-                    print(f"✓ Converted {col}: {original_dtype} → {df_engineered[col].dtype}, filled {df_engineered[col].isnull().sum()} nulls")
+                    echo(f"✓ Converted {col}: {original_dtype} → {df_engineered[col].dtype}, filled {df_engineered[col].isnull().sum()} nulls")
                 else:
-                    print(f"✓ Converted {col}: {original_dtype} → {df_engineered[col].dtype}")
+                    echo(f"✓ Converted {col}: {original_dtype} → {df_engineered[col].dtype}")
             else:
-                print(f"✓ {col} already numeric ({df_engineered[col].dtype})")
+                echo(f"✓ {col} already numeric ({df_engineered[col].dtype})")
     
     # 1. Tenure-based features
     if 'tenure' in df.columns:
         # Tenure groups
         df_engineered['tenure_group'] = pd.cut(
             df_engineered['tenure'], 
-            bins=[0, 12, 24, 48, 72],
-            labels=['0-1 year', '1-2 years', '2-4 years', '4+ years']
+            bins=TENURE_BINS,
+            labels=TENURE_LABELS
         )
-        print("✓ Created: tenure_group")
+        echo("✓ Created: tenure_group")
         
         # Is new customer (tenure < 12 months)
         df_engineered['is_new_customer'] = (df_engineered['tenure'] < 12).astype(int)
-        print("✓ Created: is_new_customer")
+        echo("✓ Created: is_new_customer")
         
         # Is long-term customer (tenure > 48 months)
         df_engineered['is_long_term'] = (df_engineered['tenure'] > 48).astype(int)
-        print("✓ Created: is_long_term")
+        echo("✓ Created: is_long_term")
     
     # 2. Charges-based features
     if 'MonthlyCharges' in df.columns and 'tenure' in df.columns:
         # Total revenue (MonthlyCharges * tenure)
         df_engineered['total_revenue'] = df_engineered['MonthlyCharges'] * df_engineered['tenure']
-        print("✓ Created: total_revenue")
+        echo("✓ Created: total_revenue")
         
         # Average monthly spend category
         df_engineered['charge_category'] = pd.cut(
             df_engineered['MonthlyCharges'],
-            bins=[0, 35, 70, 120],
-            labels=['Low', 'Medium', 'High']
+            bins=CHARGE_BINS,
+            labels=CHARGE_LABELS
         )
-        print("✓ Created: charge_category")
+        echo("✓ Created: charge_category")
     
     if 'TotalCharges' in df.columns and 'MonthlyCharges' in df.columns:
         # Price consistency (TotalCharges / (MonthlyCharges * tenure))
         df_engineered['charge_ratio'] = df_engineered['TotalCharges'] / (
             df_engineered['MonthlyCharges'] * df_engineered['tenure'] + 1
         )
-        print("✓ Created: charge_ratio")
+        echo("✓ Created: charge_ratio")
     
     # 3. Service-based features
-    service_cols = ['PhoneService', 'InternetService', 'OnlineSecurity', 
-                    'OnlineBackup', 'DeviceProtection', 'TechSupport', 
-                    'StreamingTV', 'StreamingMovies']
-    
-    available_services = [col for col in service_cols if col in df.columns]
+    available_services = [col for col in SERVICE_COLUMNS if col in df.columns]
     if available_services:
         # Count number of services
         df_engineered['num_services'] = 0
         for col in available_services:
             df_engineered['num_services'] += (df_engineered[col] == 'Yes').astype(int)
-        print(f"✓ Created: num_services (counted from {len(available_services)} service columns)")
+        echo(f"✓ Created: num_services (counted from {len(available_services)} service columns)")
     
     # 4. Contract and payment features
     if 'Contract' in df.columns:
         # Is month-to-month
         df_engineered['is_monthly_contract'] = (df_engineered['Contract'] == 'Month-to-month').astype(int)
-        print("✓ Created: is_monthly_contract")
+        echo("✓ Created: is_monthly_contract")
     
     if 'PaperlessBilling' in df.columns:
         # Paperless billing binary
         df_engineered['paperless_billing_binary'] = (df_engineered['PaperlessBilling'] == 'Yes').astype(int)
-        print("✓ Created: paperless_billing_binary")
+        echo("✓ Created: paperless_billing_binary")
     
     # 5. Demographics
     if 'SeniorCitizen' in df.columns and 'Partner' in df.columns and 'Dependents' in df.columns:
@@ -107,10 +135,10 @@ def create_engineered_features(df):
             (df_engineered['Partner'] == 'Yes').astype(int) + 
             (df_engineered['Dependents'] == 'Yes').astype(int)
         )
-        print("✓ Created: family_size")
+        echo("✓ Created: family_size")
     
-    print(f"\nNew shape after feature engineering: {df_engineered.shape}")
-    print(f"Added {df_engineered.shape[1] - df.shape[1]} new features")
+    echo(f"\nNew shape after feature engineering: {df_engineered.shape}")
+    echo(f"Added {df_engineered.shape[1] - df.shape[1]} new features")
     
     return df_engineered
 
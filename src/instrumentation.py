@@ -0,0 +1,235 @@
+"""
+Per-stage timing and memory instrumentation
+
+Wrap a stage in ``instrument(name)`` (or decorate a function with
+``@instrumented()``) to record its wall time, CPU time, peak-RSS growth
+and input/output row counts. Records from every thread are collected in
+one run report that write_run_report saves as JSON and CSV. Setting a
+profile directory (enable_profiling or the CHURN_PROFILE_DIR environment
+variable) also dumps a cProfile file for every top-level stage.
+"""
+
+import cProfile
+import functools
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR_ENV_VAR = 'CHURN_PROFILE_DIR'
+
+_records = []
+_records_lock = threading.Lock()
+_local = threading.local()
+_profile_dir = os.environ.get(PROFILE_DIR_ENV_VAR) or None
+_profile_counter = 0
+
+
+def _peak_rss_mb():
+    """Process peak resident set size so far, in MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _current_rss_mb():
+    """Current resident set size in MB (Linux only)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        return None
+
+
+def _row_count(obj):
+    """Rows of a DataFrame, Series or array; the first element of a tuple is used"""
+    if isinstance(obj, tuple) and obj:
+        obj = obj[0]
+    shape = getattr(obj, 'shape', None)
+    if shape:
+        return int(shape[0])
+    return None
+
+
+def enable_profiling(directory):
+    """
+    Dump a cProfile file per top-level stage into ``directory`` (None disables it)
+    """
+    global _profile_dir
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    _profile_dir = directory
+
+
+class StageRecord:
+    """
+    Measurements of one instrumented stage
+
+    ``rows_out`` (and ``rows_in``) may be set inside the ``with`` block when
+    they are not known up front.
+    """
+
+    def __init__(self, name, rows_in=None, parent=None):
+        self.name = name
+        self.parent = parent
+        self.thread = threading.current_thread().name
+        self.started = datetime.now().isoformat(timespec='milliseconds')
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.wall_s = None
+        self.cpu_s = None
+        self.peak_rss_delta_mb = None
+        self.rss_end_mb = None
+        self.profile = None
+        self.error = None
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+@contextmanager
+def instrument(name, rows_in=None):
+    """
+    Measure the enclosed block as one stage
+
+    Wall time uses perf_counter and CPU time the calling thread's
+    thread_time, so concurrent stages do not count each other's work. The
+    peak-RSS delta is how much the process high-water mark grew during the
+    stage; with stages running in parallel it is shared between them.
+
+    Yields:
+        StageRecord: Set ``rows_out`` on it to record the output size
+    """
+    global _profile_counter
+
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    record = StageRecord(name, rows_in=rows_in, parent=stack[-1].name if stack else None)
+
+    profiler = None
+    # Only the outermost stage of a thread is profiled; nested profilers would replace it
+    if _profile_dir and not stack:
+        try:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        except ValueError as e:
+            logger.debug(f"Profiling of stage '{name}' skipped: {str(e)}")
+            profiler = None
+
+    stack.append(record)
+    peak_before = _peak_rss_mb()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield record
+    except BaseException as e:
+        record.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record.cpu_s = time.thread_time() - cpu_start
+        record.wall_s = time.perf_counter() - wall_start
+        peak_after = _peak_rss_mb()
+        if peak_before is not None and peak_after is not None:
+            record.peak_rss_delta_mb = peak_after - peak_before
+        record.rss_end_mb = _current_rss_mb()
+        stack.pop()
+
+        if profiler is not None:
+            profiler.disable()
+            with _records_lock:
+                _profile_counter += 1
+                counter = _profile_counter
+            safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', name)
+            record.profile = os.path.join(_profile_dir, f'{counter:03d}_{safe_name}.prof')
+            profiler.dump_stats(record.profile)
+
+        with _records_lock:
+            _records.append(record)
+
+
+def instrumented(name=None):
+    """
+    Decorator form of instrument()
+
+    Input rows are taken from the first DataFrame/array argument and output
+    rows from the return value (the first element when it is a tuple).
+
+    Args:
+        name: Stage name; the function's qualified name if None
+    """
+    def decorator(func):
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            rows_in = next((rows for rows in map(_row_count, args) if rows is not None), None)
+            with instrument(stage_name, rows_in=rows_in) as record:
+                result = func(*args, **kwargs)
+                record.rows_out = _row_count(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_run_report():
+    """All stage records collected so far, as dictionaries in completion order"""
+    with _records_lock:
+        return [record.to_dict() for record in _records]
+
+
+def reset_run_report():
+    """Discard collected records, e.g. at the start of a run"""
+    with _records_lock:
+        _records.clear()
+
+
+def write_run_report(directory, run_id=None):
+    """
+    Save the collected records as ``run_report_<run_id>.json`` and ``.csv``
+
+    Args:
+        directory: Output directory (created if missing)
+        run_id: Suffix of the file names; a timestamp if None
+
+    Returns:
+        tuple: (json_path, csv_path), or None if the report could not be written
+    """
+    import pandas as pd
+
+    run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+    records = get_run_report()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, f'run_report_{run_id}.json')
+        csv_path = os.path.join(directory, f'run_report_{run_id}.csv')
+        with open(json_path, 'w') as f:
+            json.dump({
+                'run_id': run_id,
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'python': sys.version.split()[0],
+                'profile_dir': _profile_dir,
+                'stages': records,
+            }, f, indent=2)
+        pd.DataFrame(records, columns=list(StageRecord('').to_dict())).to_csv(csv_path, index=False)
+        logger.info(f"✅ Run report saved to {json_path} ({len(records)} stages)")
+        return json_path, csv_path
+    except Exception as e:
+        logger.error(f"❌ Failed to write run report: {str(e)}")
+        return None
@@ -0,0 +1,85 @@
+"""
+Compression codecs for saved models and scoring pipelines
+
+Kept apart from model_training so loading an artifact (src.scoring) does
+not import the training code.
+"""
+import io
+import os
+
+# Codecs accepted by save_model/save_pipeline; 'none' writes an uncompressed
+# file that load_model can memory-map
+MODEL_CODECS = ('none', 'gzip', 'lz4', 'zstd')
+
+# Zstandard frame magic number, used by joblib to detect the codec on load
+_ZSTD_PREFIX = b'\x28\xb5\x2f\xfd'
+
+
+class _ZstdFile(io.BufferedIOBase):
+    """
+    Minimal file object over the zstandard package for joblib's compressor registry
+    """
+    
+    def __init__(self, fileobj, mode='rb', compresslevel=3):
+        import zstandard
+        
+        self._mode = mode
+        # joblib passes a filename when writing and an open file when reading
+        self._owned_file = None
+        if isinstance(fileobj, (str, os.PathLike)):
+            fileobj = self._owned_file = open(fileobj, mode)
+        if mode == 'wb':
+            self._stream = zstandard.ZstdCompressor(level=compresslevel).stream_writer(
+                fileobj, closefd=False)
+        else:
+            self._stream = zstandard.ZstdDecompressor().stream_reader(fileobj, closefd=False)
+    
+    def readable(self):
+        return self._mode == 'rb'
+    
+    def writable(self):
+        return self._mode == 'wb'
+    
+    def read(self, size=-1):
+        return self._stream.read(size)
+    
+    def readinto(self, buffer):
+        return self._stream.readinto(buffer)
+    
+    def write(self, data):
+        return self._stream.write(data)
+    
+    def close(self):
+        if not self.closed:
+            self._stream.close()
+            if self._owned_file is not None:
+                self._owned_file.close()
+        super().close()
+
+
+def _register_zstd():
+    """Register the zstd codec with joblib on first use"""
+    from joblib.compressor import _COMPRESSORS, CompressorWrapper, register_compressor
+    
+    if 'zstd' not in _COMPRESSORS:
+        import zstandard  # noqa: F401 - fail early if the package is missing
+        register_compressor('zstd', CompressorWrapper(_ZstdFile, prefix=_ZSTD_PREFIX,
+                                                      extension='.zst'))
+
+
+def register_codec_for_file(filepath):
+    """Make sure joblib can decode ``filepath`` (zstd is registered lazily)"""
+    with open(filepath, 'rb') as f:
+        if f.read(len(_ZSTD_PREFIX)) == _ZSTD_PREFIX:
+            _register_zstd()
+
+
+def compression_arg(codec, level):
+    """Translate a codec name and level into joblib's ``compress`` argument"""
+    if codec not in MODEL_CODECS:
+        raise ValueError(f"Unsupported codec '{codec}'. Choose from {MODEL_CODECS}")
+    if codec == 'none' or level <= 0:
+        return 0
+    if codec == 'zstd':
+        _register_zstd()
+    return (codec, level)
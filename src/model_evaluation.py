@@ -4,11 +4,9 @@ This module provides functions to evaluate machine learning models
 with comprehensive metrics and visualizations.
 """
 import os
-from typing import Any, Dict, Union, TypedDict, Optional
+from typing import Any, Dict, List, Tuple, Union, TypedDict, Optional
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from sklearn.base import BaseEstimator
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score,
@@ -17,6 +15,9 @@ from sklearn.metrics import (
 import joblib
 import logging
 
+from src.instrumentation import instrumented
+from src.rendering import BackgroundRenderer, finish_figure
+
 logger = logging.getLogger(__name__)
 
 # Get the project root directory
@@ -31,22 +32,100 @@ class ModelMetrics(TypedDict):
     F1_Score: float
     ROC_AUC: float
 
+class ThresholdAnalysis(TypedDict):
+    """Result of threshold_analysis: the full sweep and the chosen operating point."""
+    curve: pd.DataFrame
+    optimal: Dict[str, float]
+
+def _validate_inputs(X_test, y_test) -> None:
+    if len(X_test) != len(y_test):
+        raise ValueError("X_test and y_test must have the same length")
+    if len(X_test) == 0:
+        raise ValueError("Input data cannot be empty")
+
+
+def _positive_proba(model: BaseEstimator, X_test: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+    """Run predict_proba once and return the churn-class column."""
+    if not hasattr(model, 'predict_proba'):
+        raise ValueError("Model must have predict_proba method for ROC-AUC")
+    return np.asarray(model.predict_proba(X_test))[:, 1]
+
+
+def _metrics_from_proba(
+    y_true: Union[np.ndarray, pd.Series],
+    y_proba: np.ndarray,
+    model_name: str,
+    threshold: float = 0.5,
+    save_plots: bool = True,
+    renderer: Optional[BackgroundRenderer] = None
+) -> ModelMetrics:
+    """
+    Compute, print and plot all metrics from one array of churn probabilities.
+    
+    Labels are derived as ``y_proba >= threshold``.
+    """
+    y_pred = (y_proba >= threshold).astype(int)
+    
+    # Calculate metrics
+    accuracy = accuracy_score(y_true, y_pred)
+    precision = precision_score(y_true, y_pred, zero_division=0)  # ← ADD zero_division
+    recall = recall_score(y_true, y_pred, zero_division=0)        # ← ADD zero_division
+    f1 = f1_score(y_true, y_pred, zero_division=0)                # ← ADD zero_division
+    roc_auc = roc_auc_score(y_true, y_proba)
+    
+    # Print metrics
+    print(f"\n{'='*70}")
+    print(f"{model_name} Performance")
+    print('='*70)
+    print(f"Accuracy:  {accuracy:.4f}")
+    print(f"Precision: {precision:.4f}")
+    print(f"Recall:    {recall:.4f}")
+    print(f"F1-Score:  {f1:.4f}")
+    print(f"ROC-AUC:   {roc_auc:.4f}")
+    print("\nClassification Report:")
+    print(classification_report(y_true, y_pred, target_names=['Not Churned', 'Churned']))
+    
+    # Plot confusion matrix
+    _plot_confusion_matrix(
+        y_true=y_true,
+        y_pred=y_pred,
+        model_name=model_name,
+        save_plot=save_plots,
+        renderer=renderer
+    )
+    
+    return {
+        'Model': model_name,
+        'Accuracy': accuracy,
+        'Precision': precision,
+        'Recall': recall,
+        'F1_Score': f1,
+        'ROC_AUC': roc_auc
+    }
+
+
+@instrumented()
 def evaluate_model(
     model: BaseEstimator,
     X_test: Union[np.ndarray, pd.DataFrame],
     y_test: Union[np.ndarray, pd.Series],
     model_name: str,
-    save_plots: bool = True
+    save_plots: bool = True,
+    threshold: float = 0.5,
+    renderer: Optional[BackgroundRenderer] = None
 ) -> ModelMetrics:
     """
     Evaluate a classification model and generate performance metrics and visualizations.
     
     Args:
-        model: Trained scikit-learn classifier with predict and predict_proba methods
+        model: Trained scikit-learn classifier with a predict_proba method
         X_test: Test features (numpy array or pandas DataFrame)
         y_test: True labels for the test set (numpy array or pandas Series)
         model_name: Name of the model for display and file naming
         save_plots: Whether to save the generated plots to disk
+        threshold: Probability cutoff used to derive churn labels
+        renderer: BackgroundRenderer that draws the confusion matrix so the
+            evaluation does not wait on PNG encoding
         
     Returns:
         Dictionary containing evaluation metrics
@@ -56,89 +135,110 @@ def evaluate_model(
         RuntimeError: If model prediction fails
     """
     # Input validation
-    if not hasattr(model, 'predict'):
-        raise ValueError("Model must have a predict method")
     if not hasattr(model, 'predict_proba'):
         raise ValueError("Model must have predict_proba method for ROC-AUC")
-    if len(X_test) != len(y_test):
-        raise ValueError("X_test and y_test must have the same length")
-    if len(X_test) == 0:
-        raise ValueError("Input data cannot be empty")
+    _validate_inputs(X_test, y_test)
     
     try:
-        # Make predictions
-        y_pred = model.predict(X_test)
-        y_pred_proba = model.predict_proba(X_test)[:, 1]
-        
-        # Calculate metrics
-        accuracy = accuracy_score(y_test, y_pred)
-        precision = precision_score(y_test, y_pred, zero_division=0)  # ← ADD zero_division
-        recall = recall_score(y_test, y_pred, zero_division=0)        # ← ADD zero_division
-        f1 = f1_score(y_test, y_pred, zero_division=0)                # ← ADD zero_division
-        roc_auc = roc_auc_score(y_test, y_pred_proba)
-        
-        # Print metrics
-        print(f"\n{'='*70}")
-        print(f"{model_name} Performance")
-        print('='*70)
-        print(f"Accuracy:  {accuracy:.4f}")
-        print(f"Precision: {precision:.4f}")
-        print(f"Recall:    {recall:.4f}")
-        print(f"F1-Score:  {f1:.4f}")
-        print(f"ROC-AUC:   {roc_auc:.4f}")
-        print("\nClassification Report:")
-        print(classification_report(y_test, y_pred, target_names=['Not Churned', 'Churned']))
-        
-        # Plot confusion matrix
-        _plot_confusion_matrix(
-            y_true=y_test,
-            y_pred=y_pred,
-            model_name=model_name,
-            save_plot=save_plots
-        )
-        
-        return {
-            'Model': model_name,
-            'Accuracy': accuracy,
-            'Precision': precision,
-            'Recall': recall,
-            'F1_Score': f1,
-            'ROC_AUC': roc_auc
-        }
+        # Single inference pass; labels come from the probabilities
+        y_pred_proba = _positive_proba(model, X_test)
+        return _metrics_from_proba(y_test, y_pred_proba, model_name, threshold, save_plots, renderer)
     
     except Exception as e:
         logger.error(f"Error during model evaluation: {str(e)}")
         raise RuntimeError(f"Failed to evaluate model: {str(e)}")
 
 
+@instrumented()
+def evaluate_models(
+    models: Dict[str, BaseEstimator],
+    X_test: Union[np.ndarray, pd.DataFrame],
+    y_test: Union[np.ndarray, pd.Series],
+    threshold: float = 0.5,
+    save_plots: bool = True,
+    renderer: Optional[BackgroundRenderer] = None
+) -> Tuple[List[ModelMetrics], Dict[str, np.ndarray]]:
+    """
+    Evaluate several models with exactly one predict_proba call each.
+    
+    Args:
+        models: Mapping of model name to trained classifier
+        X_test: Test features (numpy array or pandas DataFrame)
+        y_test: True labels for the test set (numpy array or pandas Series)
+        threshold: Probability cutoff used to derive churn labels
+        save_plots: Whether to save the confusion matrix plots to disk
+        renderer: BackgroundRenderer that draws the confusion matrices
+        
+    Returns:
+        Tuple of (list of ModelMetrics, dict of model name -> churn
+        probabilities) so callers can reuse the probabilities for ROC plots
+        and comparisons without running inference again. Models that fail
+        are logged and left out of both.
+    """
+    _validate_inputs(X_test, y_test)
+    
+    results: List[ModelMetrics] = []
+    probabilities: Dict[str, np.ndarray] = {}
+    
+    for model_name, model in models.items():
+        try:
+            y_pred_proba = _positive_proba(model, X_test)
+            results.append(_metrics_from_proba(y_test, y_pred_proba, model_name, threshold, save_plots,
+                                               renderer))
+            probabilities[model_name] = y_pred_proba
+        except Exception as e:
+            logger.error(f"Error evaluating {model_name}: {str(e)}")
+            continue
+    
+    return results, probabilities
+
+
 def _plot_confusion_matrix(
     y_true: Union[np.ndarray, pd.Series],
     y_pred: Union[np.ndarray, pd.Series],
     model_name: str,
-    save_plot: bool = True
+    save_plot: bool = True,
+    renderer: Optional[BackgroundRenderer] = None
 ):
+    """
+    Plot the confusion matrix, rendering on ``renderer`` when one is given.
+    
+    Only the 2x2 count matrix is sent to the background worker.
+    """
     try:
         cm = confusion_matrix(y_true, y_pred)
-        plt.figure(figsize=(8, 6))
-        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', cbar=False,
-                    xticklabels=['Not Churned', 'Churned'],
-                    yticklabels=['Not Churned', 'Churned'])
-        plt.xlabel('Predicted')
-        plt.ylabel('Actual')
-        plt.title(f'Confusion Matrix - {model_name}')
-        plt.tight_layout()
-
+        
+        out_path = None
         if save_plot:
             figures_dir = os.path.join(ROOT_DIR, 'reports', 'figures')
             os.makedirs(figures_dir, exist_ok=True)
             out_path = os.path.join(figures_dir, f"{model_name.replace(' ', '_').lower()}_confusion_matrix.png")
-            plt.savefig(out_path, dpi=300, bbox_inches='tight')
-            logger.info(f"Confusion matrix saved to {out_path}")
-
-        plt.show()
+        
+        if renderer is not None:
+            renderer.submit(_render_confusion_matrix, cm, model_name, out_path)
+        else:
+            _render_confusion_matrix(cm, model_name, out_path)
     except Exception as e:
         logger.warning(f"Failed to plot confusion matrix: {str(e)}")
 
+def _render_confusion_matrix(cm: np.ndarray, model_name: str, out_path: Optional[str] = None):
+    # Plotting libraries are only imported when a figure is actually drawn
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    fig = plt.figure(figsize=(8, 6))
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', cbar=False,
+                xticklabels=['Not Churned', 'Churned'],
+                yticklabels=['Not Churned', 'Churned'])
+    plt.xlabel('Predicted')
+    plt.ylabel('Actual')
+    plt.title(f'Confusion Matrix - {model_name}')
+    plt.tight_layout()
+    
+    finish_figure(fig, save_path=out_path)
+    if out_path:
+        logger.info(f"Confusion matrix saved to {out_path}")
+
 def compare_models(evaluation_results: list) -> pd.DataFrame:
     """
     Compare multiple model evaluation results.
@@ -178,3 +278,372 @@ def compare_models(evaluation_results: list) -> pd.DataFrame:
     except Exception as e:
         logger.error(f"Error comparing models: {str(e)}")
         return pd.DataFrame()
+
+
+def threshold_analysis(
+    y_true: Union[np.ndarray, pd.Series],
+    y_score: Union[np.ndarray, pd.Series],
+    customer_value: Optional[Union[np.ndarray, pd.Series]] = None,
+    contact_cost: float = 10.0,
+    retention_rate: float = 0.3,
+    optimize: Optional[str] = None
+) -> ThresholdAnalysis:
+    """
+    Sweep every distinct score threshold in one sort and a few cumulative sums.
+    
+    Customers with ``y_score >= threshold`` are targeted for retention. For
+    each distinct threshold the sweep reports precision, recall, F1,
+    accuracy, TPR/FPR and the expected retention economics:
+    
+    - expected_benefit = retention_rate * value of the churners targeted
+    - expected_cost = contact_cost * customers targeted
+    - net_benefit = expected_benefit - expected_cost
+    
+    The curve starts with a "contact nobody" row (threshold ``inf``, nobody
+    targeted, net benefit 0). It wins ties, so when no threshold has a
+    positive net benefit the reported operating point is to target nobody.
+    
+    Runs in O(n log n), so it scales to millions of scored customers.
+    
+    Args:
+        y_true: True churn labels (0/1)
+        y_score: Churn probabilities or scores
+        customer_value: Value of keeping each customer, e.g.
+            ``df['MonthlyCharges'] * 12`` or ``df['total_revenue']``. If None,
+            the economics columns are left out
+        contact_cost: Cost of one retention contact
+        retention_rate: Share of contacted churners that are retained
+        optimize: Column maximised to pick the operating point; defaults to
+            'net_benefit' when customer_value is given, otherwise 'f1'
+        
+    Returns:
+        ThresholdAnalysis with the per-threshold ``curve`` (sorted by
+        decreasing threshold) and the ``optimal`` row as a dict
+    """
+    y_true = np.asarray(y_true).astype(np.int64)
+    y_score = np.asarray(y_score, dtype=np.float64)
+    if y_true.shape != y_score.shape:
+        raise ValueError("y_true and y_score must have the same length")
+    if len(y_true) == 0:
+        raise ValueError("Input data cannot be empty")
+    
+    # Sort once by decreasing score; the last index of each run of equal
+    # scores is where that threshold's cumulative counts are read
+    order = np.argsort(-y_score, kind='mergesort')
+    sorted_score = y_score[order]
+    sorted_true = y_true[order]
+    cut = np.r_[np.flatnonzero(np.diff(sorted_score)), len(sorted_score) - 1]
+    
+    # Leading zero prepended for the "contact nobody" operating point
+    n_targeted = np.r_[0, cut + 1]
+    tp = np.r_[0, np.cumsum(sorted_true)[cut]]
+    fp = n_targeted - tp
+    positives = sorted_true.sum()
+    negatives = len(sorted_true) - positives
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(n_targeted > 0, tp / np.maximum(n_targeted, 1), 0.0)
+        recall = np.where(positives > 0, tp / max(positives, 1), 0.0)
+        fpr = np.where(negatives > 0, fp / max(negatives, 1), 0.0)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+    
+    curve = pd.DataFrame({
+        'threshold': np.r_[np.inf, sorted_score[cut]],
+        'n_targeted': n_targeted,
+        'true_positives': tp,
+        'false_positives': fp,
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+        'accuracy': (tp + negatives - fp) / len(sorted_true),
+        'tpr': recall,
+        'fpr': fpr,
+    })
+    
+    if customer_value is not None:
+        value = np.asarray(customer_value, dtype=np.float64)
+        if value.shape != y_true.shape:
+            raise ValueError("customer_value must have the same length as y_true")
+        saved_value = np.r_[0.0, np.cumsum(value[order] * sorted_true)[cut]]
+        curve['expected_benefit'] = retention_rate * saved_value
+        curve['expected_cost'] = contact_cost * n_targeted
+        curve['net_benefit'] = curve['expected_benefit'] - curve['expected_cost']
+    
+    if optimize is None:
+        optimize = 'net_benefit' if customer_value is not None else 'f1'
+    if optimize not in curve.columns:
+        raise ValueError(f"Cannot optimize '{optimize}'. Choose one of {list(curve.columns)}")
+    
+    # idxmax keeps the first maximum, so "contact nobody" wins ties
+    optimal = curve.loc[curve[optimize].idxmax()].to_dict()
+    optimal['optimized_for'] = optimize
+    if optimal['n_targeted'] == 0:
+        logger.info(f"No threshold beats contacting nobody by {optimize}; target no customers")
+    logger.info(
+        f"Optimal threshold {optimal['threshold']:.4f} by {optimize}: "
+        f"precision={optimal['precision']:.4f}, recall={optimal['recall']:.4f}, "
+        f"targeted={int(optimal['n_targeted'])}"
+    )
+    
+    return {'curve': curve, 'optimal': optimal}
+
+
+# Metrics reported by the bootstrap helpers, named as in ModelMetrics
+BOOTSTRAP_METRICS = ['Accuracy', 'Precision', 'Recall', 'F1_Score', 'ROC_AUC']
+
+# Upper bound on the memory of one resample chunk
+_BOOTSTRAP_CHUNK_BYTES = 256 * 2**20
+# Most (resamples x n) 8-byte arrays alive at once per chunk: the weights,
+# their score-sorted copy, one weighted product and its tie-group sums
+# (drawing needs three: indices, counts and the float64 weights)
+_BOOTSTRAP_LIVE_ARRAYS = 4
+
+
+def _weighted_metrics(
+    weights: np.ndarray,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    rank_order: np.ndarray,
+    tie_starts: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    All ModelMetrics fields for a batch of resamples given as count weights.
+    
+    ``weights`` has one row per resample holding how often each sample was
+    drawn. Confusion counts are matrix products; ROC-AUC is the weighted
+    Mann-Whitney statistic over score-sorted tie groups, so no resample
+    needs a per-sample sort or an sklearn call.
+    """
+    pos = y_true.astype(np.float64)
+    neg = 1.0 - pos
+    pred = y_pred.astype(np.float64)
+    
+    tp = weights @ (pos * pred)
+    fp = weights @ (neg * pred)
+    fn = weights @ (pos * (1.0 - pred))
+    tn = weights @ (neg * (1.0 - pred))
+    total = tp + fp + fn + tn
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+        recall = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+        
+        # Updated in place so at most _BOOTSTRAP_LIVE_ARRAYS full-size arrays exist
+        sorted_weights = weights[:, rank_order]
+        pos_groups = np.add.reduceat(sorted_weights * pos[rank_order], tie_starts, axis=1)
+        sorted_weights *= neg[rank_order]
+        neg_groups = np.add.reduceat(sorted_weights, tie_starts, axis=1)
+        del sorted_weights
+        pairs = pos_groups.sum(axis=1) * neg_groups.sum(axis=1)
+        # Negatives ranked below each group plus half of those tied with it
+        neg_below = np.cumsum(neg_groups, axis=1)
+        neg_groups *= 0.5
+        neg_below -= neg_groups
+        neg_below *= pos_groups
+        auc = neg_below.sum(axis=1) / pairs
+    
+    return {
+        'Accuracy': (tp + tn) / total,
+        'Precision': precision,
+        'Recall': recall,
+        'F1_Score': f1,
+        'ROC_AUC': auc,
+    }
+
+
+def _bootstrap_distributions(
+    y_true: Union[np.ndarray, pd.Series],
+    probabilities: Dict[str, np.ndarray],
+    n_resamples: int,
+    threshold: float,
+    chunk_size: Optional[int],
+    random_state: Optional[int]
+) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, np.ndarray]]]:
+    """
+    Point estimates and bootstrap distributions for several models.
+    
+    Every model is scored on the same resamples, which are drawn as index
+    matrices one chunk at a time.
+    """
+    y_true = np.asarray(y_true).astype(np.int64)
+    n = len(y_true)
+    if n == 0:
+        raise ValueError("Input data cannot be empty")
+    
+    prepared = {}
+    for name, proba in probabilities.items():
+        proba = np.asarray(proba, dtype=np.float64)
+        if proba.shape != y_true.shape:
+            raise ValueError(f"Probabilities for {name} must have the same length as y_true")
+        order = np.argsort(proba, kind='mergesort')
+        tie_starts = np.r_[0, np.flatnonzero(np.diff(proba[order])) + 1]
+        prepared[name] = ((proba >= threshold).astype(np.int64), order, tie_starts)
+    
+    estimates = {
+        name: {metric: float(values[0]) for metric, values in
+               _weighted_metrics(np.ones((1, n)), y_true, *args).items()}
+        for name, args in prepared.items()
+    }
+    
+    if chunk_size is None:
+        chunk_size = max(1, _BOOTSTRAP_CHUNK_BYTES // (_BOOTSTRAP_LIVE_ARRAYS * n * 8))
+    rng = np.random.default_rng(random_state)
+    
+    collected = {name: {metric: [] for metric in BOOTSTRAP_METRICS} for name in prepared}
+    for start in range(0, n_resamples, chunk_size):
+        rows = min(chunk_size, n_resamples - start)
+        # Index matrix -> per-resample draw counts via one flat bincount
+        indices = rng.integers(0, n, size=(rows, n))
+        indices += (np.arange(rows) * n)[:, None]
+        weights = np.bincount(indices.ravel(), minlength=rows * n).reshape(rows, n).astype(np.float64)
+        del indices
+        
+        for name, args in prepared.items():
+            for metric, values in _weighted_metrics(weights, y_true, *args).items():
+                collected[name][metric].append(values)
+    
+    distributions = {
+        name: {metric: np.concatenate(chunks) for metric, chunks in metrics.items()}
+        for name, metrics in collected.items()
+    }
+    return estimates, distributions
+
+
+def bootstrap_metrics(
+    y_true: Union[np.ndarray, pd.Series],
+    y_proba: Union[np.ndarray, pd.Series],
+    n_resamples: int = 2000,
+    threshold: float = 0.5,
+    confidence: float = 0.95,
+    chunk_size: Optional[int] = None,
+    random_state: Optional[int] = 42
+) -> pd.DataFrame:
+    """
+    Percentile bootstrap confidence intervals for every ModelMetrics field.
+    
+    Args:
+        y_true: True labels
+        y_proba: Churn probabilities from one model
+        n_resamples: Number of bootstrap resamples
+        threshold: Probability cutoff used to derive labels
+        confidence: Confidence level of the intervals
+        chunk_size: Resamples evaluated per batch (sized to ~256 MB if None)
+        random_state: Seed for the resampling
+        
+    Returns:
+        DataFrame with Metric, Estimate, CI_Lower, CI_Upper and Std_Error
+    """
+    estimates, distributions = _bootstrap_distributions(
+        y_true, {'model': y_proba}, n_resamples, threshold, chunk_size, random_state)
+    return _interval_table(estimates['model'], distributions['model'], confidence)
+
+
+def paired_bootstrap_test(
+    y_true: Union[np.ndarray, pd.Series],
+    proba_a: Union[np.ndarray, pd.Series],
+    proba_b: Union[np.ndarray, pd.Series],
+    n_resamples: int = 2000,
+    threshold: float = 0.5,
+    confidence: float = 0.95,
+    chunk_size: Optional[int] = None,
+    random_state: Optional[int] = 42
+) -> pd.DataFrame:
+    """
+    Paired bootstrap test of metric differences (model A - model B).
+    
+    Both models are scored on the same resamples, so the interval and the
+    two-sided p-value reflect the difference rather than each model's own
+    sampling noise.
+    
+    Returns:
+        DataFrame with Metric, Difference, CI_Lower, CI_Upper and P_Value
+    """
+    estimates, distributions = _bootstrap_distributions(
+        y_true, {'a': proba_a, 'b': proba_b}, n_resamples, threshold, chunk_size, random_state)
+    return _difference_table(estimates, distributions, 'a', 'b', confidence)
+
+
+def compare_models_bootstrap(
+    y_true: Union[np.ndarray, pd.Series],
+    probabilities: Dict[str, np.ndarray],
+    n_resamples: int = 2000,
+    threshold: float = 0.5,
+    confidence: float = 0.95,
+    chunk_size: Optional[int] = None,
+    random_state: Optional[int] = 42
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Bootstrap CIs for several models plus paired tests against the best one.
+    
+    Args:
+        y_true: True labels
+        probabilities: Model name -> churn probabilities, e.g. the second
+            value returned by evaluate_models
+        
+    Returns:
+        Tuple of (per-model intervals with a Model column, paired
+        differences of the best model by ROC-AUC against every other model)
+    """
+    estimates, distributions = _bootstrap_distributions(
+        y_true, probabilities, n_resamples, threshold, chunk_size, random_state)
+    
+    intervals = pd.concat(
+        [_interval_table(estimates[name], distributions[name], confidence).assign(Model=name)
+         for name in probabilities],
+        ignore_index=True
+    )[['Model', 'Metric', 'Estimate', 'CI_Lower', 'CI_Upper', 'Std_Error']]
+    
+    best = max(estimates, key=lambda name: estimates[name]['ROC_AUC'])
+    others = [name for name in probabilities if name != best]
+    differences = pd.concat(
+        [_difference_table(estimates, distributions, best, other, confidence)
+         .assign(Model=best, Versus=other) for other in others],
+        ignore_index=True
+    )[['Model', 'Versus', 'Metric', 'Difference', 'CI_Lower', 'CI_Upper', 'P_Value']] if others else pd.DataFrame()
+    
+    return intervals, differences
+
+
+def _interval_table(
+    estimates: Dict[str, float],
+    distributions: Dict[str, np.ndarray],
+    confidence: float
+) -> pd.DataFrame:
+    alpha = 100 * (1 - confidence) / 2
+    rows = []
+    for metric in BOOTSTRAP_METRICS:
+        values = distributions[metric]
+        lower, upper = np.nanpercentile(values, [alpha, 100 - alpha])
+        rows.append({
+            'Metric': metric,
+            'Estimate': estimates[metric],
+            'CI_Lower': lower,
+            'CI_Upper': upper,
+            'Std_Error': np.nanstd(values),
+        })
+    return pd.DataFrame(rows)
+
+
+def _difference_table(
+    estimates: Dict[str, Dict[str, float]],
+    distributions: Dict[str, Dict[str, np.ndarray]],
+    name_a: str,
+    name_b: str,
+    confidence: float
+) -> pd.DataFrame:
+    alpha = 100 * (1 - confidence) / 2
+    rows = []
+    for metric in BOOTSTRAP_METRICS:
+        diff = distributions[name_a][metric] - distributions[name_b][metric]
+        diff = diff[~np.isnan(diff)]
+        lower, upper = np.percentile(diff, [alpha, 100 - alpha])
+        p_value = min(1.0, 2 * min(np.mean(diff <= 0), np.mean(diff >= 0)))
+        rows.append({
+            'Metric': metric,
+            'Difference': estimates[name_a][metric] - estimates[name_b][metric],
+            'CI_Lower': lower,
+            'CI_Upper': upper,
+            'P_Value': p_value,
+        })
+    return pd.DataFrame(rows)
@@ -3,21 +3,115 @@ Model training module for customer churn prediction
 """
 import numpy as np
 import pandas as pd  # ← ADD THIS LINE
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier, HistGradientBoostingClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.tree import DecisionTreeClassifier
-from sklearn.model_selection import cross_val_score,train_test_split
+from sklearn.base import BaseEstimator, TransformerMixin, clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import check_cv, train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.utils import _safe_indexing
 from sklearn.preprocessing import StandardScaler
-from imblearn.over_sampling import SMOTE
 from datetime import datetime
 import json
 from pathlib import Path
 import os
+import time
 import joblib
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
 import logging
 
+from src.instrumentation import instrument, instrumented
+from src.model_codecs import MODEL_CODECS, compression_arg, register_codec_for_file
+
 logger = logging.getLogger(__name__)
 
+
+class _CategoricalCodes(BaseEstimator, TransformerMixin):
+    """
+    Turn scaled label-encoded columns back into integer category codes
+    
+    The trainer's inputs have been through one or more StandardScalers, so
+    a categorical column holds one float per category. Scaling is monotonic,
+    so the k-th distinct value seen in ``fit`` is mapped to code k; values
+    not seen in ``fit`` become -1, which HistGradientBoostingClassifier
+    treats as missing. Other columns pass through unchanged.
+    """
+    
+    def __init__(self, categorical_features=()):
+        self.categorical_features = categorical_features
+    
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype=np.float64)
+        self.categories_ = [np.unique(X[:, col][~np.isnan(X[:, col])]) for col in self.categorical_features]
+        return self
+    
+    def transform(self, X):
+        X = np.array(X, dtype=np.float64)
+        for col, categories in zip(self.categorical_features, self.categories_):
+            values = X[:, col]
+            codes = np.full(len(values), -1)
+            if len(categories):
+                # Nearest fitted category on either side of each value
+                right = np.clip(np.searchsorted(categories, values), 0, len(categories) - 1)
+                left = np.clip(right - 1, 0, len(categories) - 1)
+                nearest = np.where(np.abs(values - categories[left]) < np.abs(values - categories[right]),
+                                   left, right)
+                codes = np.where(np.isclose(values, categories[nearest]), nearest, -1)
+            X[:, col] = codes
+        return X
+
+
+def _fit_and_score(name, fold, model, X_train, y_train, X_test, y_test, n_threads, scoring):
+    """Fit a fresh copy of a model on one CV fold and score it, within n_threads cores"""
+    try:
+        model = clone(model)
+        if 'n_jobs' in model.get_params():
+            model.set_params(n_jobs=n_threads)
+        with threadpool_limits(limits=n_threads):
+            model.fit(X_train, y_train)
+            score = get_scorer(scoring)(model, X_test, y_test)
+        return name, fold, score, None
+    except Exception as e:
+        return name, fold, None, str(e)
+
+
+def _score_cv_fold(name, fold, model, X, y, train_idx, test_idx, n_threads, scoring):
+    """Slice one CV fold out of the full data inside the worker, then fit and score"""
+    return _fit_and_score(name, fold, model,
+                          _safe_indexing(X, train_idx), _safe_indexing(y, train_idx),
+                          _safe_indexing(X, test_idx), _safe_indexing(y, test_idx),
+                          n_threads, scoring)
+
+
+def _prepare_cv_fold(X, y, train_idx, test_idx, scale, balance_data, n_threads, categorical_features=None):
+    """Scale and resample one fold's training set, fitting only on that fold"""
+    with threadpool_limits(limits=n_threads):
+        X_train = np.asarray(_safe_indexing(X, train_idx), dtype=np.float64)
+        X_test = np.asarray(_safe_indexing(X, test_idx), dtype=np.float64)
+        y_train = np.asarray(_safe_indexing(y, train_idx))
+        y_test = np.asarray(_safe_indexing(y, test_idx))
+        
+        if scale:
+            scaler = StandardScaler()
+            X_train = scaler.fit_transform(X_train)
+            X_test = scaler.transform(X_test)
+        if balance_data:
+            X_train, y_train = ChurnModelTrainer().handle_imbalance(
+                X_train, y_train, categorical_features=categorical_features)
+        
+        return np.asarray(X_train), np.asarray(y_train), X_test, y_test
+
+
+def _fit_estimator(name, model, X_train, y_train, n_threads):
+    """Fit one model inside a worker process, capping native thread pools"""
+    with threadpool_limits(limits=n_threads):
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        return name, model, time.perf_counter() - start
+
+
 class ChurnModelTrainer:
     """
     Train and manage churn prediction models
@@ -27,6 +121,10 @@ class ChurnModelTrainer:
         self.models = {}
         self.best_model = None
         self.best_model_name = None
+        self.scaler = None
+        self.fit_times = {}
+        # Positions of integer-coded categorical columns, set by train_all_models for the 'hist' engine
+        self.categorical_features = None
     
     def prepare_data(
         self,
@@ -58,9 +156,13 @@ class ChurnModelTrainer:
         return X_train, X_test, y_train, y_test
 
     
-    def handle_imbalance(self, X_train, y_train, method='smote'):
+    def handle_imbalance(self, X_train, y_train, method='smote', categorical_features=None):
         """
         Handle class imbalance
+        
+        With ``categorical_features`` (column positions) SMOTENC is used, so
+        synthetic rows take an existing category instead of a value
+        interpolated between two category codes.
         """
         # First, handle any missing values
         if isinstance(X_train, np.ndarray):
@@ -70,7 +172,12 @@ class ChurnModelTrainer:
         
         if method == 'smote':
             try:
-                smote = SMOTE(random_state=42)
+                from imblearn.over_sampling import SMOTE, SMOTENC
+
+                if categorical_features:
+                    smote = SMOTENC(categorical_features=list(categorical_features), random_state=42)
+                else:
+                    smote = SMOTE(random_state=42)
                 X_resampled, y_resampled = smote.fit_resample(X_train, y_train)
                 logger.info(f"Applied SMOTE: {len(y_train)} -> {len(y_resampled)} samples")
                 return X_resampled, y_resampled
@@ -81,22 +188,89 @@ class ChurnModelTrainer:
         
         return X_train, y_train
     
-    def train_random_forest(self, X_train, y_train, **kwargs):
+    def build_random_forest(self, n_jobs=-1, **kwargs):
         """
-        Train Random Forest model
+        Create an unfitted Random Forest model
         """
-        logger.info("Training Random Forest...")
         params = {
             'n_estimators': kwargs.get('n_estimators', 100),
             'max_depth': kwargs.get('max_depth', 10),
             'min_samples_split': kwargs.get('min_samples_split', 5),
             'random_state': 42,
-            'n_jobs': -1
+            'n_jobs': n_jobs
         }
+        return RandomForestClassifier(**params)
+    
+    def build_logistic_regression(self, **kwargs):
+        """
+        Create an unfitted Logistic Regression model
+        """
+        return LogisticRegression(random_state=42, max_iter=1000, solver='lbfgs')
+    
+    def build_gradient_boosting(self, engine='exact', **kwargs):
+        """
+        Create an unfitted Gradient Boosting model
         
-        model = RandomForestClassifier(**params)
-        model.fit(X_train, y_train)
-        self.models['Random Forest'] = model
+        Args:
+            engine: 'exact' for GradientBoostingClassifier or 'hist' for the
+                multi-threaded HistGradientBoostingClassifier, which bins
+                features and scales to far larger datasets
+            **kwargs: n_estimators, learning_rate and max_depth apply to both
+                engines (n_estimators becomes max_iter for 'hist'). The 'hist'
+                engine also takes early_stopping, validation_fraction,
+                n_iter_no_change and categorical_features
+        """
+        if engine == 'hist':
+            return self._build_hist_gradient_boosting(**kwargs)
+        if engine != 'exact':
+            raise ValueError(f"Unknown gradient boosting engine '{engine}'. Use 'exact' or 'hist'")
+        
+        params = {
+            'n_estimators': kwargs.get('n_estimators', 100),
+            'learning_rate': kwargs.get('learning_rate', 0.1),
+            'max_depth': kwargs.get('max_depth', 5),
+            'random_state': 42
+        }
+        return GradientBoostingClassifier(**params)
+    
+    def _build_hist_gradient_boosting(self, **kwargs):
+        """
+        Create an unfitted HistGradientBoostingClassifier
+        
+        Native categorical handling: pass categorical_features as column
+        indices/names/mask of integer-coded columns, or train on a DataFrame
+        with category dtypes and keep the default 'from_dtype'. Given column
+        indices, the model is wrapped in a Pipeline whose first step maps
+        those columns back to integer codes, so it can be trained on the same
+        scaled matrices as the other models.
+        """
+        params = {
+            'max_iter': kwargs.get('n_estimators', 100),
+            'learning_rate': kwargs.get('learning_rate', 0.1),
+            'max_depth': kwargs.get('max_depth', 5),
+            'early_stopping': kwargs.get('early_stopping', 'auto'),
+            'validation_fraction': kwargs.get('validation_fraction', 0.1),
+            'n_iter_no_change': kwargs.get('n_iter_no_change', 10),
+            'categorical_features': kwargs.get('categorical_features', 'from_dtype'),
+            'random_state': 42
+        }
+        categorical = params['categorical_features']
+        if isinstance(categorical, (list, tuple, np.ndarray)) and len(categorical) \
+                and all(isinstance(col, (int, np.integer)) for col in categorical):
+            params['categorical_features'] = list(categorical)
+            return Pipeline([
+                ('categorical_codes', _CategoricalCodes(list(categorical))),
+                ('model', HistGradientBoostingClassifier(**params)),
+            ])
+        return HistGradientBoostingClassifier(**params)
+    
+    def train_random_forest(self, X_train, y_train, **kwargs):
+        """
+        Train Random Forest model
+        """
+        logger.info("Training Random Forest...")
+        model = self.build_random_forest(**kwargs)
+        self._fit_and_store('Random Forest', model, X_train, y_train)
         logger.info("✅ Random Forest trained")
         return model
     
@@ -105,31 +279,112 @@ class ChurnModelTrainer:
         Train Logistic Regression model
         """
         logger.info("Training Logistic Regression...")
-        model = LogisticRegression(random_state=42, max_iter=1000, solver='lbfgs')
-        model.fit(X_train, y_train)
-        self.models['Logistic Regression'] = model
+        model = self.build_logistic_regression()
+        self._fit_and_store('Logistic Regression', model, X_train, y_train)
         logger.info("✅ Logistic Regression trained")
         return model
     
-    def train_gradient_boosting(self, X_train, y_train, **kwargs):
+    def train_gradient_boosting(self, X_train, y_train, engine='exact', **kwargs):
         """
         Train Gradient Boosting model
-        """
-        logger.info("Training Gradient Boosting...")
-        params = {
-            'n_estimators': kwargs.get('n_estimators', 100),
-            'learning_rate': kwargs.get('learning_rate', 0.1),
-            'max_depth': kwargs.get('max_depth', 5),
-            'random_state': 42
-        }
         
-        model = GradientBoostingClassifier(**params)
-        model.fit(X_train, y_train)
-        self.models['Gradient Boosting'] = model
+        See build_gradient_boosting for the engine switch and its arguments.
+        """
+        if engine == 'hist' and self.categorical_features and 'categorical_features' not in kwargs:
+            kwargs['categorical_features'] = self.categorical_features
+        logger.info(f"Training Gradient Boosting ({engine} engine)...")
+        model = self.build_gradient_boosting(engine=engine, **kwargs)
+        self._fit_and_store('Gradient Boosting', model, X_train, y_train)
         logger.info("✅ Gradient Boosting trained")
         return model
     
-    def train_all_models(self, X, y, balance_data=True):
+    def _fit_and_store(self, name, model, X_train, y_train):
+        """Fit a model, recording it in self.models and its fit time in self.fit_times"""
+        with instrument(f'{type(self).__name__}.fit[{name}]', rows_in=len(X_train)):
+            start = time.perf_counter()
+            model.fit(X_train, y_train)
+            self.fit_times[name] = time.perf_counter() - start
+        self.models[name] = model
+        return model
+    
+    def default_core_budget(self, n_jobs=None, gb_engine='exact'):
+        """
+        Split a core budget between the models for parallel training
+        
+        Logistic Regression and exact Gradient Boosting fit on a single core,
+        so the Random Forest gets whatever is left. The multi-threaded 'hist'
+        engine shares the remaining cores with the Random Forest.
+        
+        Args:
+            n_jobs: Total cores to use (all available cores if None or -1)
+            gb_engine: Gradient boosting engine ('exact' or 'hist')
+            
+        Returns:
+            dict: Model name -> number of cores
+        """
+        total = os.cpu_count() or 1
+        if n_jobs is not None and n_jobs > 0:
+            total = min(n_jobs, total)
+        if gb_engine == 'hist':
+            shared = max(2, total - 1)
+            return {
+                'Random Forest': max(1, shared - shared // 2),
+                'Logistic Regression': 1,
+                'Gradient Boosting': max(1, shared // 2),
+            }
+        return {
+            'Random Forest': max(1, total - 2),
+            'Logistic Regression': 1,
+            'Gradient Boosting': 1,
+        }
+    
+    def train_models_parallel(self, X_train, y_train, core_budget=None, n_jobs=None, gb_engine='exact'):
+        """
+        Fit the independent models at the same time in a process pool
+        
+        Each model runs in its own worker, limited to its share of the core
+        budget (the Random Forest's n_jobs and every worker's BLAS/OpenMP
+        threads), so the pool does not oversubscribe the machine.
+        
+        Args:
+            X_train: Training features
+            y_train: Training labels
+            core_budget: Model name -> cores; defaults to default_core_budget(n_jobs)
+            n_jobs: Total cores used to build the default budget
+            gb_engine: Gradient boosting engine ('exact' or 'hist')
+            
+        Returns:
+            dict: Dictionary of trained models
+        """
+        budget = self.default_core_budget(n_jobs, gb_engine=gb_engine)
+        if core_budget:
+            budget.update(core_budget)
+        
+        estimators = {
+            'Random Forest': self.build_random_forest(n_jobs=budget['Random Forest']),
+            'Logistic Regression': self.build_logistic_regression(),
+            'Gradient Boosting': self.build_gradient_boosting(
+                engine=gb_engine,
+                **({'categorical_features': self.categorical_features}
+                   if gb_engine == 'hist' and self.categorical_features else {})),
+        }
+        logger.info(f"Training {len(estimators)} models in parallel with core budget {budget}")
+        
+        results = Parallel(n_jobs=len(estimators), backend='loky')(
+            delayed(_fit_estimator)(name, model, X_train, y_train, budget[name])
+            for name, model in estimators.items()
+        )
+        
+        for name, model, fit_time in results:
+            self.models[name] = model
+            self.fit_times[name] = fit_time
+            logger.info(f"✅ {name} trained in {fit_time:.2f}s on {budget[name]} core(s)")
+        
+        return {name: self.models[name] for name in estimators}
+    
+    @instrumented()
+    def train_all_models(self, X, y, balance_data=True, parallel=False, core_budget=None, n_jobs=None,
+                         gb_engine='exact', preprocessor=None):
         """
         Train all models
         
@@ -137,26 +392,141 @@ class ChurnModelTrainer:
             X: Training features (unscaled)
             y: Training labels
             balance_data: Whether to apply SMOTE for class balancing
+            parallel: Fit the models concurrently (see train_models_parallel)
+            core_budget: Model name -> cores used when parallel=True
+            n_jobs: Total cores used when parallel=True
+            gb_engine: Gradient boosting engine, 'exact' or 'hist'
+            preprocessor: Fitted ChurnDataPreprocessor that produced X. With
+                the 'hist' engine its label-encoded columns are treated as
+                native categoricals, and SMOTENC keeps them on real categories
             
         Returns:
-            dict: Dictionary of trained models
+            tuple: X_train, X_test, y_train, y_test; fitted models are in
+            self.models and their fit times in self.fit_times
         """
         logger.info("Training all models...")
+        self.categorical_features = None
+        if gb_engine == 'hist' and preprocessor is not None:
+            self.categorical_features = preprocessor.categorical_feature_indices() or None
+            logger.info(f"Native categorical features for the hist engine: {self.categorical_features}")
+        
         X_train, X_test, y_train, y_test = self.prepare_data(X, y)
         if balance_data:
-            X_train, y_train = self.handle_imbalance(X_train, y_train)
+            X_train, y_train = self.handle_imbalance(X_train, y_train,
+                                                     categorical_features=self.categorical_features)
         
         # Train all models
-        self.train_random_forest(X_train, y_train)
-        self.train_logistic_regression(X_train, y_train)
-        self.train_gradient_boosting(X_train, y_train)
+        if parallel:
+            self.train_models_parallel(X_train, y_train, core_budget=core_budget, n_jobs=n_jobs,
+                                       gb_engine=gb_engine)
+        else:
+            self.train_random_forest(X_train, y_train)
+            self.train_logistic_regression(X_train, y_train)
+            self.train_gradient_boosting(X_train, y_train, engine=gb_engine)
         
         logger.info(f"✅ Trained {len(self.models)} models")
         return X_train, X_test, y_train, y_test
     
-    def cross_validate(self, X, y, cv=5):
+    def split_cv_budget(self, n_tasks, n_jobs=-1):
+        """
+        Split a global core budget between task-level and estimator-level parallelism
+        
+        Args:
+            n_tasks: Number of independent (model, fold) fits
+            n_jobs: Total cores to use (all available cores if None or -1)
+            
+        Returns:
+            tuple: (concurrent tasks, threads per task)
+        """
+        total = os.cpu_count() or 1
+        if n_jobs is not None and n_jobs > 0:
+            total = min(n_jobs, total)
+        outer = max(1, min(total, n_tasks))
+        inner = max(1, total // outer)
+        return outer, inner
+    
+    def prepare_cv_folds(self, X, y, cv=5, scale=True, balance_data=True, cache_dir=None, n_jobs=-1):
+        """
+        Build each fold's scaled and SMOTE-resampled training set once
+        
+        The scaler and SMOTE are fitted on the fold's training part only, so
+        scores computed on the untouched test part do not leak. Folds are
+        prepared in parallel and kept in memory, or with ``cache_dir`` dumped
+        uncompressed and memory-mapped back, keyed by a hash of the inputs so
+        later runs on the same data skip the work.
+        
+        Args:
+            X: Features (unscaled, before SMOTE)
+            y: Labels
+            cv: Number of stratified folds or a scikit-learn CV splitter
+            scale: Fit a StandardScaler per fold
+            balance_data: Apply SMOTE per fold
+            cache_dir: Directory for memory-mapped fold files (in memory if None)
+            n_jobs: Total cores to use (all available cores if None or -1)
+            
+        Returns:
+            list: (X_train, y_train, X_test, y_test) per fold
+        """
+        splitter = check_cv(cv, y, classifier=True)
+        folds = list(splitter.split(X, y))
+        
+        fold_dir = None
+        if cache_dir is not None:
+            key = joblib.hash((X, y, [test_idx for _, test_idx in folds], scale, balance_data,
+                               self.categorical_features))
+            fold_dir = Path(cache_dir) / f'cv_folds_{key}'
+            paths = [fold_dir / f'fold_{i}.joblib' for i in range(len(folds))]
+            if all(path.exists() for path in paths):
+                logger.info(f"Reusing {len(folds)} cached CV folds from {fold_dir}")
+                return [joblib.load(path, mmap_mode='r') for path in paths]
+        
+        outer, inner = self.split_cv_budget(len(folds), n_jobs)
+        logger.info(f"Preparing {len(folds)} CV folds (scale={scale}, SMOTE={balance_data})...")
+        prepared = Parallel(n_jobs=outer, backend='loky')(
+            delayed(_prepare_cv_fold)(X, y, train_idx, test_idx, scale, balance_data, inner,
+                                      self.categorical_features)
+            for train_idx, test_idx in folds
+        )
+        
+        if fold_dir is not None:
+            fold_dir.mkdir(parents=True, exist_ok=True)
+            for path, fold_data in zip(paths, prepared):
+                joblib.dump(fold_data, path)
+            logger.info(f"Cached {len(folds)} CV folds in {fold_dir}")
+            return [joblib.load(path, mmap_mode='r') for path in paths]
+        
+        return prepared
+    
+    @instrumented()
+    def cross_validate(self, X, y, cv=5, n_jobs=-1, scoring='roc_auc', leakage_free=False,
+                       scale=True, balance_data=True, cache_dir=None):
         """
         Perform cross-validation for all models
+        
+        All models x folds run as one batch of tasks. The core budget
+        ``n_jobs`` is split between concurrent tasks and threads inside each
+        task (estimator n_jobs and BLAS/OpenMP pools are capped to the
+        per-task share), so nested parallelism never exceeds the budget.
+        Slowest models (by recorded fit time) are scheduled first.
+        
+        With ``leakage_free=True`` X and y should be the data before scaling
+        and SMOTE: each fold's scaled and resampled training set is built
+        once by prepare_cv_folds and shared by every model, so SMOTE runs
+        once per fold instead of once per fold and model.
+        
+        Args:
+            X: Features
+            y: Labels
+            cv: Number of stratified folds or a scikit-learn CV splitter
+            n_jobs: Total cores to use (all available cores if None or -1)
+            scoring: Scikit-learn scorer name
+            leakage_free: Scale and resample inside each fold
+            scale: Fit a StandardScaler per fold (leakage_free only)
+            balance_data: Apply SMOTE per fold (leakage_free only)
+            cache_dir: Memory-map prepared folds from this directory (leakage_free only)
+            
+        Returns:
+            dict: Model name -> {'mean', 'std', 'scores'}
         """
         logger.info(f"Running {cv}-fold cross-validation...")
         
@@ -166,25 +536,54 @@ class ChurnModelTrainer:
         else:
             X = X.fillna(X.mean())
         
-        results = {}
+        names = sorted(self.models, key=lambda name: self.fit_times.get(name, 0), reverse=True)
         
-        for name, model in self.models.items():
-            try:
-                scores = cross_val_score(model, X, y, cv=cv, scoring='roc_auc', n_jobs=-1)
-                results[name] = {
-                    'mean': scores.mean(),
-                    'std': scores.std(),
-                    'scores': scores.tolist()
-                }
-                logger.info(f"{name}: ROC-AUC = {scores.mean():.4f} (+/- {scores.std():.4f})")
-            
-            except Exception as e:
-                logger.warning(f"Cross-validation failed for {name}: {str(e)}")
+        if leakage_free:
+            prepared = self.prepare_cv_folds(X, y, cv=cv, scale=scale, balance_data=balance_data,
+                                             cache_dir=cache_dir, n_jobs=n_jobs)
+            n_folds = len(prepared)
+            outer, inner = self.split_cv_budget(len(names) * n_folds, n_jobs)
+            jobs = (
+                delayed(_fit_and_score)(name, fold, self.models[name], *fold_data, inner, scoring)
+                for name in names
+                for fold, fold_data in enumerate(prepared)
+            )
+        else:
+            folds = list(check_cv(cv, y, classifier=True).split(X, y))
+            n_folds = len(folds)
+            outer, inner = self.split_cv_budget(len(names) * n_folds, n_jobs)
+            jobs = (
+                delayed(_score_cv_fold)(name, fold, self.models[name], X, y, train_idx, test_idx,
+                                        inner, scoring)
+                for name in names
+                for fold, (train_idx, test_idx) in enumerate(folds)
+            )
+        
+        logger.info(f"Scheduling {len(names) * n_folds} CV fits: {outer} concurrent x {inner} thread(s)")
+        tasks = Parallel(n_jobs=outer, backend='loky')(jobs)
+        
+        fold_scores = {name: [None] * n_folds for name in names}
+        for name, fold, score, error in tasks:
+            fold_scores[name][fold] = score
+            if error is not None:
+                logger.warning(f"Cross-validation failed for {name} (fold {fold}): {error}")
+        
+        results = {}
+        for name in self.models:
+            if any(score is None for score in fold_scores[name]):
                 continue
+            scores = np.array(fold_scores[name])
+            results[name] = {
+                'mean': scores.mean(),
+                'std': scores.std(),
+                'scores': scores.tolist()
+            }
+            logger.info(f"{name}: ROC-AUC = {scores.mean():.4f} (+/- {scores.std():.4f})")
         
         return results
     
-    def save_model(self, model_name: str, filepath: str, compress: int = 3, save_metadata: bool = True) -> bool:
+    def save_model(self, model_name: str, filepath: str, compress: int = 3, save_metadata: bool = True,
+                   codec: str = 'gzip') -> bool:
         """
         Save trained model to disk with directory creation and validation.
         
@@ -193,6 +592,8 @@ class ChurnModelTrainer:
             filepath (str): Full path where to save the model
             compress (int): Compression level (0-9, default=3)
             save_metadata (bool): Whether to save metadata with model
+            codec (str): One of MODEL_CODECS. 'none' writes an uncompressed
+                file that load_model(mmap_mode='r') can memory-map
             
         Returns:
             bool: True if successful, False otherwise
@@ -222,15 +623,16 @@ class ChurnModelTrainer:
                     'model_name': model_name,
                     'saved_at': datetime.now().isoformat(),
                     'model_type': type(self.models[model_name]).__name__,
+                    'codec': codec,
                     'version': '1.0.0'
                 } if save_metadata else None
             }
             
-            # Save with compression
+            # Save with the selected codec
             joblib.dump(
                 model_data,
                 filepath,
-                compress=('gzip', compress) if compress > 0 else 0
+                compress=compression_arg(codec, compress)
             )
             
             logger.info(f"✅ Model '{model_name}' successfully saved to {filepath}")
@@ -243,12 +645,79 @@ class ChurnModelTrainer:
             logger.error(f"❌ Failed to save model '{model_name}': {str(e)}", exc_info=True)
             return False
     
-    def load_model(self, filepath: str) -> dict:
+    def save_pipeline(self, model_name: str, filepath: str, preprocessor, compress: int = 3,
+                      codec: str = 'gzip') -> bool:
+        """
+        Save a model together with everything needed to score raw data.
+        
+        The artifact bundles the fitted ChurnDataPreprocessor (label encoders,
+        scaler, fill values, feature column order), the trainer's own scaler
+        from prepare_data, the feature engineering settings and the model.
+        Load it with src.scoring.load_scorer.
+        
+        Args:
+            model_name (str): Name of the model to save (must exist in self.models)
+            filepath (str): Full path where to save the artifact
+            preprocessor: ChurnDataPreprocessor fitted by preprocess_pipeline
+            compress (int): Compression level (0-9, default=3)
+            codec (str): One of MODEL_CODECS (see save_model)
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        from src.feature_engineering import FEATURE_ENGINEERING_CONFIG
+        from src.scoring import ARTIFACT_TYPE
+        
+        if model_name not in self.models:
+            logger.error(f"Model '{model_name}' not found. Available models: {list(self.models.keys())}")
+            return False
+        if preprocessor.feature_columns is None:
+            logger.error("Preprocessor has not been fitted; run preprocess_pipeline(fit=True) first")
+            return False
+        
+        try:
+            filepath = Path(filepath)
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            
+            artifact = {
+                'artifact_type': ARTIFACT_TYPE,
+                'model': self.models[model_name],
+                'preprocessor': preprocessor,
+                'scaler': self.scaler,
+                'feature_columns': list(preprocessor.feature_columns),
+                'feature_config': FEATURE_ENGINEERING_CONFIG,
+                'metadata': {
+                    'model_name': model_name,
+                    'saved_at': datetime.now().isoformat(),
+                    'model_type': type(self.models[model_name]).__name__,
+                    'n_features': len(preprocessor.feature_columns),
+                    'codec': codec,
+                    'version': '1.0.0'
+                }
+            }
+            
+            joblib.dump(
+                artifact,
+                filepath,
+                compress=compression_arg(codec, compress)
+            )
+            
+            logger.info(f"✅ Scoring pipeline for '{model_name}' saved to {filepath}")
+            return True
+        
+        except Exception as e:
+            logger.error(f"❌ Failed to save scoring pipeline '{model_name}': {str(e)}", exc_info=True)
+            return False
+    
+    def load_model(self, filepath: str, mmap_mode: str = None) -> dict:
         """
         Load trained model with metadata
         
         Args:
             filepath: Path to the saved model file
+            mmap_mode: Passed to joblib.load. With 'r', arrays in files saved
+                with codec='none' are memory-mapped so worker processes share
+                one page-cache copy; compressed files are always read into memory
             
         Returns:
             dict: Dictionary containing 'model' and 'metadata' if available
@@ -260,7 +729,8 @@ class ChurnModelTrainer:
                 logger.error(f"File not found: {filepath}")
                 return None
             
-            model_data = joblib.load(filepath)
+            register_codec_for_file(filepath)
+            model_data = joblib.load(filepath, mmap_mode=mmap_mode)
             logger.info(f"✅ Model loaded from {filepath}")
             
             if isinstance(model_data, dict) and 'model' in model_data:
@@ -0,0 +1,247 @@
+"""
+Dependency-driven stage executor for the analysis pipeline
+
+Stages are declared with the names of the stages they depend on and run
+on a thread pool as soon as their dependencies have finished, so
+independent work (plots, file exports, cross-validation, evaluation)
+overlaps. Per-stage timings and the critical path show where the wall
+time actually goes.
+"""
+
+import functools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from src.instrumentation import instrument
+
+logger = logging.getLogger(__name__)
+
+# Put on the main-thread queue when every stage has finished or one failed
+_DONE = object()
+
+
+class PipelineStage:
+    """
+    One unit of work in a PipelineExecutor
+
+    ``func`` is called with one keyword argument per dependency, named
+    after the dependency and holding its return value.
+    """
+
+    def __init__(self, name, func, deps=(), main_thread=False):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.main_thread = main_thread
+
+
+class PipelineExecutor:
+    """
+    Run declared stages concurrently in dependency order
+
+    Stages must be added after their dependencies, which keeps the graph
+    acyclic. Stages flagged ``main_thread`` (e.g. ones that call
+    matplotlib.pyplot, which is not thread-safe) run on the calling thread
+    while worker stages keep running in the pool.
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        Args:
+            max_workers: Threads running stages concurrently (ThreadPoolExecutor default if None)
+        """
+        self.max_workers = max_workers
+        self.stages = {}
+        self.timings = {}
+        self.wall_time = None
+
+    def add_stage(self, name, func, deps=(), main_thread=False):
+        """
+        Declare a stage
+
+        Args:
+            name: Unique stage name, also the keyword its result is passed as
+            func: Callable taking the results of ``deps`` as keyword arguments
+            deps: Names of stages that must finish first
+            main_thread: Run on the thread that called run()
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' is already defined")
+        unknown = [dep for dep in deps if dep not in self.stages]
+        if unknown:
+            raise ValueError(f"Stage '{name}' depends on undefined stages: {unknown}")
+        self.stages[name] = PipelineStage(name, func, deps, main_thread)
+
+    def _run_stage(self, stage, kwargs, t0):
+        start = time.perf_counter()
+        logger.info(f"Stage '{stage.name}' started")
+        try:
+            with instrument(f'stage:{stage.name}'):
+                result = stage.func(**kwargs)
+        except Exception as e:
+            logger.error(f"Stage '{stage.name}' failed: {str(e)}")
+            raise
+        finally:
+            end = time.perf_counter()
+            self.timings[stage.name] = {
+                'start': start - t0,
+                'end': end - t0,
+                'duration': end - start,
+                'thread': threading.current_thread().name,
+            }
+        logger.info(f"Stage '{stage.name}' finished in {end - start:.2f}s")
+        return result
+
+    def run(self):
+        """
+        Execute every stage
+
+        Worker stages are submitted from the completion callbacks of their
+        dependencies, so the pool keeps being fed while the calling thread
+        is busy with a main-thread stage (or blocked in ``plt.show()``). The
+        calling thread only drains the queue of ready main-thread stages.
+
+        Returns:
+            dict: Stage name -> return value
+
+        Raises:
+            The first exception raised by a stage; stages not yet started are
+            cancelled
+        """
+        self.timings = {}
+        results = {}
+        t0 = time.perf_counter()
+        if not self.stages:
+            self.wall_time = 0.0
+            return results
+
+        dependents = {name: [] for name in self.stages}
+        waiting = {}
+        for name, stage in self.stages.items():
+            waiting[name] = len(stage.deps)
+            for dep in stage.deps:
+                dependents[dep].append(name)
+
+        lock = threading.Lock()
+        main_queue = queue.Queue()
+        errors = []
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='stage')
+
+        def dispatch(stages):
+            for stage in stages:
+                if stage.main_thread:
+                    main_queue.put(stage)
+                    continue
+                kwargs = {dep: results[dep] for dep in stage.deps}
+                try:
+                    future = pool.submit(self._run_stage, stage, kwargs, t0)
+                except RuntimeError:  # pool already shut down after a failure
+                    return
+                future.add_done_callback(functools.partial(on_future_done, stage.name))
+
+        def complete(name, result):
+            with lock:
+                if errors:
+                    return
+                results[name] = result
+                ready = []
+                for dependent in dependents[name]:
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        ready.append(self.stages[dependent])
+                finished = len(results) == len(self.stages)
+            # Submitted outside the lock: a callback may run inline when its future is already done
+            dispatch(ready)
+            if finished:
+                main_queue.put(_DONE)
+
+        def on_future_done(name, future):
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                with lock:
+                    errors.append(error)
+                main_queue.put(_DONE)
+                return
+            complete(name, future.result())
+
+        try:
+            dispatch([stage for stage in self.stages.values() if not stage.deps])
+            while True:
+                stage = main_queue.get()
+                if stage is _DONE:
+                    break
+                with lock:
+                    if errors:
+                        break
+                try:
+                    result = self._run_stage(stage, {dep: results[dep] for dep in stage.deps}, t0)
+                except Exception as e:
+                    with lock:
+                        errors.append(e)
+                    break
+                complete(stage.name, result)
+            if errors:
+                raise errors[0]
+        except Exception:
+            logger.error("Pipeline stopped; cancelling stages that have not started")
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            self.wall_time = time.perf_counter() - t0
+        pool.shutdown(wait=True)
+        return results
+
+    def critical_path(self):
+        """
+        Longest chain of dependent stages by duration
+
+        Returns:
+            tuple: (list of stage names in execution order, total seconds)
+        """
+        finish, previous = {}, {}
+        for name, stage in self.stages.items():
+            if name not in self.timings:
+                continue
+            deps = [dep for dep in stage.deps if dep in finish]
+            longest = max(deps, key=finish.get, default=None)
+            finish[name] = self.timings[name]['duration'] + (finish[longest] if longest else 0.0)
+            previous[name] = longest
+
+        if not finish:
+            return [], 0.0
+        name = max(finish, key=finish.get)
+        total = finish[name]
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        return path[::-1], total
+
+    def timing_report(self):
+        """
+        Per-stage timings as a DataFrame ordered by start time
+        """
+        path, _ = self.critical_path()
+        report = pd.DataFrame([{'stage': name, **timing, 'critical_path': name in path}
+                               for name, timing in self.timings.items()])
+        if report.empty:
+            return report
+        return report.sort_values('start').reset_index(drop=True)
+
+    def log_report(self):
+        """Log per-stage times, the critical path and the overall wall time"""
+        report = self.timing_report()
+        path, path_time = self.critical_path()
+        logger.info("Stage timings:\n" + report.to_string(index=False, float_format=lambda v: f'{v:.2f}'))
+        logger.info(f"Critical path ({path_time:.2f}s): {' -> '.join(path)}")
+        if self.wall_time:
+            busy = report['duration'].sum() if not report.empty else 0.0
+            logger.info(f"Wall time {self.wall_time:.2f}s for {busy:.2f}s of stage work "
+                        f"({busy / self.wall_time:.2f}x overlap)")
@@ -0,0 +1,162 @@
+"""
+Figure rendering helpers for batch and server runs
+
+Headless mode forces matplotlib's non-interactive Agg backend and skips
+plt.show(), so batch runs never block on a window. Every figure is closed
+once it has been saved. BackgroundRenderer moves the PNG rendering itself
+into worker processes so callers do not wait on it.
+"""
+
+import os
+import sys
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Setting this environment variable to 1/true/yes enables headless mode at import
+HEADLESS_ENV_VAR = 'CHURN_HEADLESS'
+
+_headless = os.environ.get(HEADLESS_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+
+def set_headless(enabled=True):
+    """
+    Turn headless rendering on or off
+
+    Enabling it switches matplotlib to the Agg backend, which never opens
+    windows, and makes finish_figure skip plt.show().
+    """
+    global _headless
+    _headless = enabled
+    if enabled:
+        _use_agg()
+        logger.info("Headless rendering enabled (Agg backend)")
+
+
+def is_headless():
+    """Whether figures are saved without being shown"""
+    return _headless
+
+
+def _use_agg():
+    # Before matplotlib is imported the environment variable is enough, so
+    # headless mode does not pull in matplotlib until a figure is drawn
+    if 'matplotlib' in sys.modules:
+        sys.modules['matplotlib'].use('Agg', force=True)
+    else:
+        os.environ['MPLBACKEND'] = 'Agg'
+
+
+if _headless:
+    _use_agg()
+
+
+def finish_figure(fig=None, save_path=None, dpi=300):
+    """
+    Save, show (unless headless) and close a figure
+
+    Args:
+        fig: Figure to finish; the current pyplot figure if None
+        save_path: File to save the figure to, if any
+        dpi: Resolution used when saving
+    """
+    import matplotlib.pyplot as plt
+
+    fig = fig if fig is not None else plt.gcf()
+    try:
+        if save_path:
+            fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        if not _headless:
+            plt.show()
+    finally:
+        plt.close(fig)
+
+
+def _init_render_worker():
+    """Worker processes always render headless"""
+    set_headless(True)
+
+
+class BackgroundRenderer:
+    """
+    Process pool that renders figures off the calling process
+
+    Submit module-level render functions together with the small arrays
+    they plot; the caller carries on while workers draw and save the PNGs.
+    Call wait() (or leave the ``with`` block) to collect the results.
+
+    Workers are spawned rather than forked: a fork taken while another
+    thread holds a matplotlib lock leaves the child waiting on that lock
+    forever.
+    """
+
+    def __init__(self, max_workers=None, start_method='spawn'):
+        """
+        Args:
+            max_workers: Render processes (up to 4, one per CPU, if None)
+            start_method: multiprocessing start method; 'spawn' or
+                'forkserver', as 'fork' can deadlock in threaded callers
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=multiprocessing.get_context(start_method),
+                                             initializer=_init_render_worker)
+        self._futures = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the worker processes now instead of on the first submit"""
+        futures = [self._executor.submit(os.getpid) for _ in range(self.max_workers)]
+        for future in futures:
+            future.result()
+        return self
+
+    def submit(self, func, *args, **kwargs):
+        """Queue func(*args, **kwargs) on a worker and return its future"""
+        future = self._executor.submit(func, *args, **kwargs)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def wait(self, futures=None):
+        """
+        Block until submitted renders finished
+
+        Args:
+            futures: Futures returned by submit() to wait for; every
+                pending render if None. Threads sharing one renderer pass
+                their own futures.
+
+        Returns:
+            list: Results of the awaited calls; failures are logged and
+            returned as None
+        """
+        with self._lock:
+            if futures is None:
+                futures, self._futures = self._futures, []
+            else:
+                futures = list(futures)
+                self._futures = [future for future in self._futures if future not in futures]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"Background render failed: {str(e)}")
+                results.append(None)
+        return results
+
+    def shutdown(self):
+        """Wait for pending renders and stop the workers"""
+        self.wait()
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
@@ -0,0 +1,99 @@
+"""
+Column schema for customer churn datasets
+
+Mirrors the table layout in sql/01_schema_setup.sql so that Python loaders
+and the SQL database agree on column types.
+"""
+
+import pandas as pd
+
+# Column name -> SQL type, in the same order as sql/01_schema_setup.sql
+SQL_SCHEMA = {
+    'customerID': 'VARCHAR(50)',
+    'gender': 'VARCHAR(10)',
+    'SeniorCitizen': 'TINYINT',
+    'Partner': 'TINYINT',
+    'Dependents': 'TINYINT',
+    'tenure': 'INT',
+    'PhoneService': 'VARCHAR(10)',
+    'MultipleLines': 'VARCHAR(20)',
+    'InternetService': 'VARCHAR(20)',
+    'OnlineSecurity': 'VARCHAR(20)',
+    'OnlineBackup': 'VARCHAR(20)',
+    'DeviceProtection': 'VARCHAR(20)',
+    'TechSupport': 'VARCHAR(20)',
+    'StreamingTV': 'VARCHAR(20)',
+    'StreamingMovies': 'VARCHAR(20)',
+    'Contract': 'VARCHAR(30)',
+    'PaperlessBilling': 'TINYINT',
+    'PaymentMethod': 'VARCHAR(50)',
+    'MonthlyCharges': 'DECIMAL(9,2)',
+    'TotalCharges': 'DECIMAL(12,2)',
+    'Churn': 'TINYINT',
+    'tenure_group': 'VARCHAR(30)',
+    'is_new_customer': 'TINYINT',
+    'is_long_term': 'TINYINT',
+    'total_revenue': 'DECIMAL(12,2)',
+    'charge_category': 'VARCHAR(20)',
+    'charge_ratio': 'DECIMAL(9,6)',
+    'num_services': 'TINYINT',
+    'is_monthly_contract': 'TINYINT',
+    'paperless_billing_binary': 'TINYINT',
+    'family_size': 'TINYINT',
+}
+
+# High-cardinality text columns that should stay as plain strings
+ID_COLUMNS = ['customerID']
+
+# Values treated as missing when reading (raw Telco data uses ' ' for TotalCharges)
+NA_VALUES = ['', ' ']
+
+
+def sql_type_to_dtype(sql_type):
+    """
+    Map a SQL column type to the compact pandas dtype used when reading CSVs
+    """
+    base = sql_type.split('(')[0].upper()
+    if base == 'VARCHAR':
+        return 'category'
+    if base == 'TINYINT':
+        # Flags may be stored as 0/1 or as Yes/No depending on the extract,
+        # so they are read as categories and narrowed after loading
+        return 'category'
+    if base == 'INT':
+        return 'int32'
+    if base == 'DECIMAL':
+        return 'float32'
+    return 'object'
+
+
+def get_read_dtypes(columns):
+    """
+    Build a ``dtype`` mapping for ``pd.read_csv`` covering the given columns
+    """
+    dtypes = {}
+    for col in columns:
+        if col in ID_COLUMNS or col not in SQL_SCHEMA:
+            continue
+        dtypes[col] = sql_type_to_dtype(SQL_SCHEMA[col])
+    return dtypes
+
+
+def narrow_flag_columns(df):
+    """
+    Convert TINYINT columns holding only 0/1 values to int8 in place.
+
+    Flags stored as Yes/No text are left as categories so that the
+    existing ``== 'Yes'`` comparisons keep working.
+    """
+    for col, sql_type in SQL_SCHEMA.items():
+        if col not in df.columns or not sql_type.upper().startswith('TINYINT'):
+            continue
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            continue
+        categories = df[col].cat.categories
+        numeric = pd.to_numeric(categories, errors='coerce')
+        if numeric.isna().any() or df[col].isna().any():
+            continue
+        df[col] = df[col].cat.rename_categories(numeric.astype('int64')).astype('int8')
+    return df
@@ -0,0 +1,128 @@
+"""
+Scoring utilities for customer churn prediction
+
+Rebuilds a ready-to-call scorer from a single artifact saved with
+ChurnModelTrainer.save_pipeline, so scoring jobs reuse the fitted
+preprocessing instead of refitting it on every start.
+"""
+
+from pathlib import Path
+import logging
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.feature_engineering import FEATURE_ENGINEERING_CONFIG, create_engineered_features
+from src.model_codecs import register_codec_for_file
+
+logger = logging.getLogger(__name__)
+
+# Marker stored in bundled artifacts to tell them apart from save_model files
+ARTIFACT_TYPE = 'churn_scoring_pipeline'
+
+
+class ChurnScorer:
+    """
+    Apply the fitted preprocessing and model to raw customer records
+    """
+
+    def __init__(self, model, preprocessor, scaler=None, feature_columns=None,
+                 feature_config=None, metadata=None, target_col='Churn'):
+        self.model = model
+        self.preprocessor = preprocessor
+        self.scaler = scaler
+        self.feature_columns = feature_columns or preprocessor.feature_columns
+        self.feature_config = feature_config
+        self.metadata = metadata
+        self.target_col = target_col
+
+        if feature_config is not None and feature_config != FEATURE_ENGINEERING_CONFIG:
+            logger.warning("Feature engineering settings differ from those the model was trained with")
+
+    @classmethod
+    def from_artifact(cls, artifact):
+        """
+        Build a scorer from a loaded pipeline artifact dictionary
+        """
+        if not isinstance(artifact, dict) or artifact.get('artifact_type') != ARTIFACT_TYPE:
+            raise ValueError("Not a churn scoring pipeline artifact")
+        return cls(
+            model=artifact['model'],
+            preprocessor=artifact['preprocessor'],
+            scaler=artifact.get('scaler'),
+            feature_columns=artifact.get('feature_columns'),
+            feature_config=artifact.get('feature_config'),
+            metadata=artifact.get('metadata'),
+        )
+
+    def transform(self, df):
+        """
+        Turn raw customer records into the model's feature matrix
+        """
+        df = self.preprocessor.clean_data(df, fit=False, drop_duplicates=False)
+        df = create_engineered_features(df, verbose=False)
+        if self.target_col in df.columns:
+            df = df.drop(self.target_col, axis=1)
+
+        X = self.preprocessor.encode_categorical(df, fit=False)
+        missing = [col for col in self.feature_columns if col not in X.columns]
+        if missing:
+            raise ValueError(f"Input is missing feature columns: {missing}")
+        X = X[self.feature_columns]
+
+        X_scaled = self.preprocessor.scale_features(X, fit=False)
+        if self.scaler is not None:
+            X_scaled = self.scaler.transform(X_scaled)
+        return X_scaled
+
+    def predict_proba(self, df):
+        """
+        Churn probability for every input row
+        """
+        return self.model.predict_proba(self.transform(df))[:, 1]
+
+    def predict(self, df, threshold=0.5):
+        """
+        Churn label (1 = churn) for every input row at the given threshold
+        """
+        return (self.predict_proba(df) >= threshold).astype(int)
+
+    def score(self, df, threshold=0.5):
+        """
+        Score raw records, returning probability and label indexed by customerID when present
+        """
+        proba = self.predict_proba(df)
+        index = df['customerID'] if 'customerID' in df.columns else df.index
+        return pd.DataFrame({
+            'churn_probability': proba,
+            'churn_prediction': (proba >= threshold).astype(np.int8),
+        }, index=pd.Index(index, name='customerID' if 'customerID' in df.columns else None))
+
+
+def load_scorer(filepath, mmap_mode=None):
+    """
+    Load a bundled pipeline artifact and return a ready-to-call ChurnScorer
+
+    Args:
+        filepath: Path written by ChurnModelTrainer.save_pipeline
+        mmap_mode: Passed to joblib.load; use 'r' with artifacts saved with
+            codec='none' to share model arrays between worker processes
+
+    Returns:
+        ChurnScorer, or None if the file cannot be loaded
+    """
+    try:
+        filepath = Path(filepath)
+        if not filepath.exists():
+            logger.error(f"File not found: {filepath}")
+            return None
+
+        register_codec_for_file(filepath)
+        scorer = ChurnScorer.from_artifact(joblib.load(filepath, mmap_mode=mmap_mode))
+        logger.info(f"✅ Scoring pipeline loaded from {filepath}")
+        return scorer
+
+    except Exception as e:
+        logger.error(f"❌ Failed to load scoring pipeline from {filepath}: {str(e)}", exc_info=True)
+        return None
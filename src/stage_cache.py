@@ -0,0 +1,232 @@
+"""
+Content-addressed cache for pipeline stage outputs
+
+A stage's cache key is a hash of its inputs (file contents, upstream
+stage keys or in-memory objects), its parameters and the source code of
+the modules that implement it, so editing either the data or the code
+invalidates exactly the stages that depend on it. Outputs are stored per
+type - DataFrames and Series as Parquet, NumPy arrays as .npy, anything
+else with joblib - and arrays are memory-mapped back in on a hit.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every existing entry when the storage layout changes
+CACHE_FORMAT_VERSION = 1
+
+_MANIFEST = 'manifest.json'
+
+
+def hash_file(filepath, block_size=1 << 20):
+    """SHA-256 of a file's contents, read in blocks"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_code(*objects):
+    """
+    Hash the source code of modules, classes or functions
+
+    Used as the code version of a stage: any edit to the listed source
+    changes the key.
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode())
+    return digest.hexdigest()
+
+
+def _write_item(value, directory, name):
+    """Store one output value and return its manifest entry"""
+    if isinstance(value, pd.DataFrame):
+        filename = f'{name}.parquet'
+        value.to_parquet(directory / filename, engine='pyarrow')
+        return {'kind': 'dataframe', 'file': filename}
+    if isinstance(value, pd.Series):
+        filename = f'{name}.parquet'
+        value.to_frame(name=value.name if value.name is not None else '__series__').to_parquet(
+            directory / filename, engine='pyarrow')
+        return {'kind': 'series', 'file': filename, 'unnamed': value.name is None}
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        filename = f'{name}.npy'
+        np.save(directory / filename, value, allow_pickle=False)
+        return {'kind': 'ndarray', 'file': filename}
+
+    filename = f'{name}.joblib'
+    # Uncompressed so the arrays inside can be memory-mapped on load
+    joblib.dump(value, directory / filename, compress=0)
+    return {'kind': 'joblib', 'file': filename}
+
+
+def _read_item(entry, directory, mmap):
+    path = directory / entry['file']
+    if entry['kind'] == 'dataframe':
+        return pd.read_parquet(path, engine='pyarrow', memory_map=mmap)
+    if entry['kind'] == 'series':
+        series = pd.read_parquet(path, engine='pyarrow', memory_map=mmap).iloc[:, 0]
+        return series.rename(None) if entry.get('unnamed') else series
+    if entry['kind'] == 'ndarray':
+        return np.load(path, mmap_mode='r' if mmap else None, allow_pickle=False)
+    return joblib.load(path, mmap_mode='r' if mmap else None)
+
+
+class StageCache:
+    """
+    Skip pipeline stages whose inputs, parameters and code are unchanged
+
+    Entries live in ``cache_dir/<stage>/<key>/`` together with a manifest,
+    and are written to a temporary directory first so an interrupted run
+    never leaves a half-written entry behind.
+    """
+
+    def __init__(self, cache_dir, enabled=True, mmap=True):
+        """
+        Args:
+            cache_dir: Root directory of the cache
+            enabled: When False every stage runs and nothing is stored
+            mmap: Memory-map arrays (and Parquet files) of cached outputs
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.mmap = mmap
+        self.hits = []
+        self.misses = []
+
+    def stage_key(self, stage, inputs=(), files=(), params=None, code=()):
+        """
+        Cache key of a stage
+
+        Args:
+            stage: Stage name
+            inputs: Objects the stage reads, typically upstream stage keys;
+                hashed with joblib.hash
+            files: Input file paths, hashed by content
+            params: JSON-serializable stage parameters
+            code: Modules, classes or functions implementing the stage
+        """
+        payload = {
+            'format': CACHE_FORMAT_VERSION,
+            'stage': stage,
+            'inputs': [joblib.hash(obj) for obj in inputs],
+            'files': [hash_file(path) for path in files],
+            'params': json.dumps(params or {}, sort_keys=True, default=str),
+            'code': hash_code(*code) if code else '',
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:32]
+
+    def _entry_dir(self, stage, key):
+        return self.cache_dir / stage / key
+
+    def load(self, stage, key):
+        """
+        Cached output of a stage
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) on a miss or when
+            the entry cannot be read
+        """
+        entry_dir = self._entry_dir(stage, key)
+        manifest_path = entry_dir / _MANIFEST
+        if not self.enabled or not manifest_path.exists():
+            return False, None
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            items = {name: _read_item(entry, entry_dir, self.mmap)
+                     for name, entry in manifest['items'].items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {entry_dir}: {str(e)}")
+            return False, None
+
+        if manifest['structure'] == 'tuple':
+            return True, tuple(items[str(i)] for i in range(len(items)))
+        if manifest['structure'] == 'dict':
+            return True, items
+        return True, items['value']
+
+    def save(self, stage, key, value):
+        """
+        Store a stage's output; tuples and dicts are stored item by item
+
+        Returns:
+            bool: True if the entry was written
+        """
+        if not self.enabled:
+            return False
+
+        if isinstance(value, tuple):
+            structure, items = 'tuple', {str(i): item for i, item in enumerate(value)}
+        elif isinstance(value, dict) and all(isinstance(k, str) for k in value):
+            structure, items = 'dict', value
+        else:
+            structure, items = 'value', {'value': value}
+
+        entry_dir = self._entry_dir(stage, key)
+        tmp_dir = None
+        try:
+            entry_dir.parent.mkdir(parents=True, exist_ok=True)
+            tmp_dir = Path(tempfile.mkdtemp(dir=entry_dir.parent, prefix='.tmp-'))
+            manifest = {
+                'stage': stage,
+                'structure': structure,
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'items': {name: _write_item(item, tmp_dir, f'item_{i}')
+                          for i, (name, item) in enumerate(items.items())},
+            }
+            (tmp_dir / _MANIFEST).write_text(json.dumps(manifest, indent=2))
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir)
+            os.replace(tmp_dir, entry_dir)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not cache stage '{stage}': {str(e)}")
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+
+    def run(self, stage, func, inputs=(), files=(), params=None, code=()):
+        """
+        Return a stage's cached output, or run ``func()`` and cache its result
+
+        Returns:
+            tuple: (output, key); pass ``key`` as an input of downstream stages
+        """
+        key = self.stage_key(stage, inputs=inputs, files=files, params=params, code=code)
+        start = time.perf_counter()
+
+        hit, value = self.load(stage, key)
+        if hit:
+            self.hits.append(stage)
+            logger.info(f"Stage '{stage}': cache hit ({key[:12]}, {time.perf_counter() - start:.2f}s)")
+            return value, key
+
+        value = func()
+        elapsed = time.perf_counter() - start
+        self.misses.append(stage)
+        # None signals a failed stage; never cache it
+        if value is not None and self.save(stage, key, value):
+            logger.info(f"Stage '{stage}': computed in {elapsed:.2f}s and cached ({key[:12]})")
+        else:
+            logger.info(f"Stage '{stage}': computed in {elapsed:.2f}s")
+        return value, key
+
+    def clear(self, stage=None):
+        """Delete every entry, or only those of one stage"""
+        target = self.cache_dir / stage if stage else self.cache_dir
+        shutil.rmtree(target, ignore_errors=True)
@@ -4,38 +4,153 @@ Utility functions for customer churn analysis project
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import logging
+import os
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from src.schema import NA_VALUES, get_read_dtypes, narrow_flag_columns
 
 logger = logging.getLogger(__name__)
 
-def save_dataframe(df, filepath, description=""):
-    """Save DataFrame to CSV with logging"""
+# File suffix -> storage format understood by save_dataframe/load_dataframe
+FILE_FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+}
+
+def _resolve_format(filepath, file_format=None):
+    """Pick the storage format from an explicit name or the file suffix"""
+    if file_format is not None:
+        if file_format not in FILE_FORMATS.values():
+            raise ValueError(f"Unsupported file format: {file_format}")
+        return file_format
+    suffix = os.path.splitext(str(filepath))[1].lower()
+    return FILE_FORMATS.get(suffix, 'csv')
+
+def save_dataframe(df, filepath, description="", file_format=None):
+    """
+    Save DataFrame with logging
+
+    The format follows the file suffix (``.csv``, ``.parquet``, ``.feather``)
+    unless ``file_format`` is given. Parquet (pyarrow) and Feather keep
+    dtypes, including categoricals such as ``tenure_group``.
+    """
     try:
-        df.to_csv(filepath, index=False)
+        file_format = _resolve_format(filepath, file_format)
+        if file_format == 'parquet':
+            df.to_parquet(filepath, engine='pyarrow', index=False)
+        elif file_format == 'feather':
+            # Feather only stores a default RangeIndex
+            df.reset_index(drop=True).to_feather(filepath)
+        else:
+            df.to_csv(filepath, index=False)
         logger.info(f"{description} saved to {filepath}")
         return True
     except Exception as e:
         logger.error(f"Error saving {description}: {str(e)}")
         return False
 
-def load_dataframe(filepath):
-    """Load DataFrame from CSV with error handling"""
+def load_dataframe(filepath, use_schema=False, columns=None, file_format=None):
+    """
+    Load DataFrame with error handling
+
+    The format follows the file suffix unless ``file_format`` is given.
+    ``columns`` limits the read to a subset of columns; for Parquet and
+    Feather only those columns are read from disk.
+
+    With ``use_schema=True`` CSV columns are typed from the table layout in
+    sql/01_schema_setup.sql: text columns become ``category``, 0/1 flags
+    ``int8``, money ``float32``, and blank ``TotalCharges`` are read as NaN.
+    Columnar files already carry their dtypes.
+    """
     try:
-        df = pd.read_csv(filepath)
+        file_format = _resolve_format(filepath, file_format)
+        if file_format == 'parquet':
+            df = pd.read_parquet(filepath, engine='pyarrow', columns=columns)
+        elif file_format == 'feather':
+            df = pd.read_feather(filepath, columns=columns)
+        elif use_schema:
+            header = pd.read_csv(filepath, nrows=0).columns
+            df = pd.read_csv(
+                filepath,
+                usecols=columns,
+                dtype=get_read_dtypes(columns if columns is not None else header),
+                na_values=NA_VALUES,
+                keep_default_na=True,
+            )
+            df = narrow_flag_columns(df)
+        else:
+            df = pd.read_csv(filepath, usecols=columns)
         logger.info(f"Loaded data from {filepath} - Shape: {df.shape}")
         return df
     except Exception as e:
         logger.error(f"Error loading data from {filepath}: {str(e)}")
         return None
 
+def iter_dataframe_chunks(filepath, chunksize=100_000, use_schema=False, columns=None):
+    """
+    Yield a CSV file as DataFrames of at most ``chunksize`` rows
+
+    Typing with ``use_schema`` matches :func:`load_dataframe`.
+    """
+    read_kwargs = {'chunksize': chunksize, 'usecols': columns}
+    if use_schema:
+        header = pd.read_csv(filepath, nrows=0).columns
+        read_kwargs['dtype'] = get_read_dtypes(columns if columns is not None else header)
+        read_kwargs['na_values'] = NA_VALUES
+    with pd.read_csv(filepath, **read_kwargs) as reader:
+        for chunk in reader:
+            if use_schema:
+                chunk = narrow_flag_columns(chunk)
+            yield chunk
+
+class DataFrameChunkWriter:
+    """
+    Append DataFrame chunks to a single CSV or Parquet file
+
+    CSV chunks are appended with the header written once; Parquet chunks
+    become row groups cast to the schema of the first chunk. Use as a
+    context manager so the file is closed when the stream ends.
+    """
+
+    def __init__(self, filepath, file_format=None):
+        self.filepath = filepath
+        self.file_format = _resolve_format(filepath, file_format)
+        if self.file_format == 'feather':
+            raise ValueError("Feather files cannot be written incrementally; use CSV or Parquet")
+        self.rows_written = 0
+        self._writer = None
+        self._schema = None
+
+    def write(self, df):
+        if self.file_format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            if self._writer is None:
+                self._schema = table.schema
+                self._writer = pq.ParquetWriter(self.filepath, self._schema)
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.filepath, mode='a' if self.rows_written else 'w',
+                      header=not self.rows_written, index=False)
+        self.rows_written += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
 def check_missing_values(df):
     """Check and report missing values"""
     missing = df.isnull().sum()
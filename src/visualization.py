@@ -6,14 +6,415 @@ import logging
 from typing import List, Tuple, Union
 from sklearn.base import BaseEstimator
 
+from src.rendering import BackgroundRenderer, finish_figure, set_headless
+
 logger = logging.getLogger(__name__)
 
+TENURE_SEGMENT_BINS = [0, 12, 24, 48, 72]
+TENURE_SEGMENT_LABELS = ['0-1 year', '1-2 years', '2-4 years', '4+ years']
+
+# Above this many rows feature distributions switch from box plots to fixed-bin histograms
+AGGREGATE_ROW_THRESHOLD = 1_000_000
+DEFAULT_HIST_BINS = 50
+
+
+# ---------------------------------------------------------------------------
+# Aggregation: runs in the calling process and reduces the DataFrame to the
+# handful of numbers each chart draws
+# ---------------------------------------------------------------------------
+
+def _is_numeric_feature(series):
+    return pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def _aggregate_churn_distribution(y):
+    counts = pd.Series(pd.to_numeric(y)).value_counts().sort_index()
+    return {'labels': counts.index.to_numpy(), 'counts': counts.to_numpy(), 'total': int(len(y))}
+
+
+def _aggregate_target_distribution(df, target='Churn'):
+    return _aggregate_churn_distribution(df[target])
+
+
+def _aggregate_churn_rate_by_category(df, category_col, target='Churn'):
+    rates = df.groupby(category_col, observed=True)[target].mean().sort_values(ascending=False)
+    return {'category_col': category_col, 'labels': rates.index.astype(str).tolist(),
+            'rates': rates.to_numpy(dtype=float) * 100, 'overall': float(df[target].mean()) * 100}
+
+
+def _aggregate_tenure_segments(df, tenure_col='tenure', target='Churn'):
+    segments = pd.cut(df[tenure_col].fillna(0), bins=TENURE_SEGMENT_BINS,
+                      labels=TENURE_SEGMENT_LABELS, include_lowest=True)
+    rates = df[target].groupby(segments, observed=False).mean().reindex(TENURE_SEGMENT_LABELS)
+    return {'labels': TENURE_SEGMENT_LABELS, 'rates': rates.to_numpy(dtype=float) * 100}
+
+
+def _class_labels(series):
+    """Target as float (0/1, NaN when missing) for bincount-based splits"""
+    return pd.to_numeric(series).to_numpy(dtype=float, na_value=np.nan)
+
+
+def _bin_index(values, edges):
+    """Fixed-bin index of every value with np.histogram semantics; -1 outside the edges or NaN"""
+    idx = np.searchsorted(edges, values, side='right') - 1
+    idx[values == edges[-1]] = len(edges) - 2
+    idx[~((values >= edges[0]) & (values <= edges[-1]))] = -1
+    return idx
+
+
+def _bin_edges(series, feature, bins, value_ranges, streaming):
+    if feature in value_ranges:
+        low, high = value_ranges[feature]
+    elif streaming:
+        raise ValueError(f"value_ranges must give a (min, max) for '{feature}' when aggregating chunks")
+    else:
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        low, high = np.nanmin(values), np.nanmax(values)
+    if high <= low:
+        high = low + 1
+    return np.linspace(low, high, bins + 1)
+
+
+def compute_feature_histograms(data, features, target='Churn', bins=DEFAULT_HIST_BINS, value_ranges=None):
+    """
+    Per-class histograms of features in one pass over a DataFrame or a stream of chunks
+
+    Numeric features are counted into fixed bins with a single np.bincount
+    per chunk (bin index x churn class); categorical features into
+    per-category counts. Only these counts are kept, so memory does not grow
+    with the number of rows.
+
+    Args:
+        data: DataFrame, or an iterable of DataFrame chunks with a numeric
+            0/1 target (e.g. from src.streaming.stream_engineered_chunks)
+        features: Columns to aggregate
+        target: Churn column
+        bins: Number of fixed-width bins for numeric features
+        value_ranges: Optional ``{feature: (min, max)}`` bin ranges; required
+            for numeric features when ``data`` is a chunk stream
+
+    Returns:
+        dict: ``{'panels': [...]}`` in feature order, as rendered by
+        plot_feature_distributions
+    """
+    streaming = not isinstance(data, pd.DataFrame)
+    chunks = data if streaming else [data]
+    value_ranges = dict(value_ranges or {})
+    edges, hist_counts, category_counts = {}, {}, {}
+
+    for chunk in chunks:
+        y = _class_labels(chunk[target])
+        valid = (y == 0) | (y == 1)
+        y_int = np.where(valid, y, 0).astype(np.intp)
+
+        for feature in features:
+            series = chunk[feature]
+            if feature in edges or (feature not in category_counts and _is_numeric_feature(series)):
+                if feature not in edges:
+                    edges[feature] = _bin_edges(series, feature, bins, value_ranges, streaming)
+                    hist_counts[feature] = np.zeros((2, bins), dtype=np.int64)
+                idx = _bin_index(series.to_numpy(dtype=float, na_value=np.nan), edges[feature])
+                keep = valid & (idx >= 0)
+                counts = np.bincount(idx[keep] * 2 + y_int[keep], minlength=2 * bins)
+                hist_counts[feature] += counts.reshape(bins, 2).T
+            else:
+                counts = pd.crosstab(series[valid].to_numpy(), y_int[valid])
+                counts = counts.reindex(columns=[0, 1], fill_value=0)
+                previous = category_counts.get(feature)
+                category_counts[feature] = counts if previous is None else previous.add(counts, fill_value=0)
+
+    panels = []
+    for feature in features:
+        if feature in edges:
+            panels.append({'feature': feature, 'kind': 'hist', 'edges': edges[feature],
+                           'counts': hist_counts[feature]})
+        elif feature in category_counts:
+            counts = category_counts[feature]
+            counts = counts.loc[counts.sum(axis=1).sort_values(ascending=False, kind='stable').index]
+            panels.append({'feature': feature, 'kind': 'bar', 'categories': counts.index.astype(str).tolist(),
+                           'not_churned': counts[0].to_numpy(dtype=np.int64),
+                           'churned': counts[1].to_numpy(dtype=np.int64)})
+    return {'panels': panels}
+
+
+def _aggregate_feature_distributions(df, features, target='Churn', bins=None, value_ranges=None):
+    from matplotlib.cbook import boxplot_stats
+
+    if bins is not None or not isinstance(df, pd.DataFrame) or len(df) > AGGREGATE_ROW_THRESHOLD:
+        return compute_feature_histograms(df, features, target, bins or DEFAULT_HIST_BINS, value_ranges)
+
+    panels = []
+    for feature in features:
+        if _is_numeric_feature(df[feature]):
+            stats = [boxplot_stats(df.loc[df[target] == cls, feature].dropna().to_numpy(dtype=float))[0]
+                     for cls in (0, 1)]
+            panels.append({'feature': feature, 'kind': 'box', 'stats': stats})
+        else:
+            counts = pd.crosstab(df[feature], df[target])
+            categories = df[feature].value_counts().index
+            counts = counts.reindex(index=categories, columns=[0, 1], fill_value=0)
+            panels.append({'feature': feature, 'kind': 'bar', 'categories': categories.astype(str).tolist(),
+                           'not_churned': counts[0].to_numpy(), 'churned': counts[1].to_numpy()})
+    return {'panels': panels}
+
+
+def _aggregate_correlation_heatmap(df):
+    numerical_cols = df.select_dtypes(include=[np.number]).columns
+    return {'columns': list(numerical_cols), 'matrix': df[numerical_cols].corr().to_numpy()}
+
+
+def compute_revenue_aggregates(data, monthly_charges_col='MonthlyCharges', target='Churn',
+                               tenure_col='tenure', bins=(24, 24), value_ranges=None):
+    """
+    Revenue totals, averages and a binned churned-revenue grid in one pass
+
+    Per-class sums and counts come from np.bincount weighted by the monthly
+    charge. When ``tenure_col`` is present, churned customers' charges are
+    also summed on a fixed tenure x monthly-charge grid, which is drawn as a
+    2-D density in place of a per-customer scatter.
+
+    Args:
+        data: DataFrame or an iterable of DataFrame chunks
+        monthly_charges_col: Monthly charge column
+        target: Churn column (numeric 0/1)
+        tenure_col: Tenure column for the density grid; None to skip it
+        bins: (tenure bins, charge bins) of the grid
+        value_ranges: Optional ``{column: (min, max)}`` grid ranges; required
+            when ``data`` is a chunk stream and the grid is computed
+
+    Returns:
+        dict: ``sums`` and ``means`` per class (retained, churned) and, when
+        computed, ``density`` with the grid edges and churned revenue per cell
+    """
+    streaming = not isinstance(data, pd.DataFrame)
+    chunks = data if streaming else [data]
+    value_ranges = dict(value_ranges or {})
+    sums = np.zeros(2)
+    counts = np.zeros(2, dtype=np.int64)
+    tenure_edges = charge_edges = grid = None
+
+    for chunk in chunks:
+        y = _class_labels(chunk[target])
+        charges = chunk[monthly_charges_col].to_numpy(dtype=float, na_value=np.nan)
+        ok = ((y == 0) | (y == 1)) & ~np.isnan(charges)
+        y_int = y[ok].astype(np.intp)
+        sums += np.bincount(y_int, weights=charges[ok], minlength=2)
+        counts += np.bincount(y_int, minlength=2)
+
+        if tenure_col is not None and tenure_col in chunk.columns:
+            if grid is None:
+                tenure_edges = _bin_edges(chunk[tenure_col], tenure_col, bins[0], value_ranges, streaming)
+                charge_edges = _bin_edges(chunk[monthly_charges_col], monthly_charges_col, bins[1],
+                                          value_ranges, streaming)
+                grid = np.zeros(bins[0] * bins[1])
+            t_idx = _bin_index(chunk[tenure_col].to_numpy(dtype=float, na_value=np.nan), tenure_edges)
+            c_idx = _bin_index(charges, charge_edges)
+            churned = ok & (y == 1) & (t_idx >= 0) & (c_idx >= 0)
+            grid += np.bincount(t_idx[churned] * bins[1] + c_idx[churned], weights=charges[churned],
+                                minlength=bins[0] * bins[1])
+
+    agg = {'sums': sums, 'means': np.divide(sums, counts, out=np.full(2, np.nan), where=counts > 0)}
+    if grid is not None:
+        agg['density'] = {'tenure_col': tenure_col, 'charges_col': monthly_charges_col,
+                          'tenure_edges': tenure_edges, 'charge_edges': charge_edges,
+                          'churned_revenue': grid.reshape(bins)}
+    return agg
+
+
+# ---------------------------------------------------------------------------
+# Rendering: module-level so they can run in BackgroundRenderer workers
+# ---------------------------------------------------------------------------
+
+def _render_churn_distribution(agg, save_path=None):
+    plt.figure(figsize=(8, 6))
+    colors = ['steelblue', 'salmon']
+    bars = plt.bar(agg['labels'], agg['counts'], color=colors, edgecolor='black')
+    plt.title('Churn Distribution', fontsize=16, fontweight='bold')
+    plt.xlabel('Churn (0=No, 1=Yes)', fontsize=12)
+    plt.ylabel('Count', fontsize=12)
+
+    for v, bar in zip(agg['counts'], bars):
+        percentage = (v / agg['total']) * 100
+        plt.text(bar.get_x() + bar.get_width()/2, v + 50,
+                 f'{v}\n({percentage:.1f}%)', ha='center', fontsize=12, fontweight='bold')
+
+    finish_figure(save_path=save_path)
+    return save_path
+
+
+def _render_churn_rate_by_category(agg, save_path=None):
+    plt.figure(figsize=(10, 6))
+    bars = plt.bar(agg['labels'], agg['rates'], color='salmon', edgecolor='black')
+
+    # Add value labels on top of bars
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height + 1,
+                 f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
+
+    category_col = agg['category_col']
+    plt.title(f'Churn Rate by {category_col}', fontsize=14, fontweight='bold')
+    plt.xlabel(category_col, fontsize=12)
+    plt.ylabel('Churn Rate (%)', fontsize=12)
+    plt.xticks(rotation=45, ha='right')
+    plt.grid(axis='y', alpha=0.3)
+
+    # Add horizontal line for overall churn rate
+    plt.axhline(y=agg['overall'], color='red', linestyle='--',
+                label=f"Overall Churn Rate: {agg['overall']:.1f}%")
+
+    plt.legend()
+    plt.tight_layout()
+    finish_figure(save_path=save_path)
+    return save_path
+
+
+def _render_tenure_segments(agg, save_path=None):
+    plt.figure(figsize=(10, 6))
+    bars = plt.bar(agg['labels'], agg['rates'], color='salmon', edgecolor='black')
+    for bar in bars:
+        h = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., h + 1, f'{h:.1f}%', ha='center', va='bottom', fontweight='bold')
+    plt.title('Churn Rate by Tenure Segments', fontsize=14, fontweight='bold')
+    plt.xlabel('Tenure Segment', fontsize=12)
+    plt.ylabel('Churn Rate (%)', fontsize=12)
+    plt.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    finish_figure(save_path=save_path)
+    return save_path
+
+
+def _render_feature_distributions(agg, save_path=None):
+    panels = agg['panels']
+    n_features = len(panels)
+    fig, axes = plt.subplots(nrows=(n_features+1)//2, ncols=2, figsize=(14, 5*((n_features+1)//2)))
+    axes = np.atleast_1d(axes).flatten()
+
+    for ax, panel in zip(axes, panels):
+        feature = panel['feature']
+        if panel['kind'] == 'box':
+            stats = [dict(s, label=label) for s, label in zip(panel['stats'], ['No', 'Yes'])]
+            bp = ax.bxp(stats, patch_artist=True)
+            bp['boxes'][0].set_facecolor('steelblue')
+            bp['boxes'][1].set_facecolor('salmon')
+            ax.set_ylabel(feature, fontsize=11)
+        elif panel['kind'] == 'hist':
+            edges, counts = panel['edges'], panel['counts']
+            widths = np.diff(edges)
+            for cls, color, label in ((0, 'steelblue', 'No'), (1, 'salmon', 'Yes')):
+                total = counts[cls].sum()
+                density = counts[cls] / (total * widths) if total else counts[cls].astype(float)
+                ax.stairs(density, edges, fill=True, alpha=0.5, color=color, label=label)
+            ax.set_xlabel(feature, fontsize=11)
+            ax.set_ylabel('Density', fontsize=11)
+            ax.legend(title='Churn')
+        else:
+            width = 0.35
+            x = np.arange(len(panel['categories']))
+            ax.bar(x - width/2, panel['not_churned'], width, color='steelblue', label='Not Churned', edgecolor='black')
+            ax.bar(x + width/2, panel['churned'], width, color='salmon', label='Churned', edgecolor='black')
+            ax.set_xticks(x)
+            ax.set_xticklabels(panel['categories'], rotation=45, ha='right')
+            ax.legend()
+
+        ax.set_title(f'{feature} vs Churn', fontsize=12, fontweight='bold')
+        ax.grid(alpha=0.3)
+
+    for idx in range(n_features, len(axes)):
+        fig.delaxes(axes[idx])
+
+    plt.tight_layout()
+    finish_figure(fig, save_path=save_path)
+    return save_path
+
+
+def _render_correlation_heatmap(agg, save_path=None):
+    columns, matrix = agg['columns'], agg['matrix']
+
+    plt.figure(figsize=(12, 10))
+    im = plt.imshow(matrix, cmap='coolwarm', aspect='auto', vmin=-1, vmax=1)
+    plt.title('Feature Correlation Heatmap', fontsize=16, fontweight='bold')
+    plt.xticks(range(len(columns)), columns, rotation=45, ha='right')
+    plt.yticks(range(len(columns)), columns)
+    plt.colorbar(im, shrink=0.8)
+
+    for i in range(len(columns)):
+        for j in range(len(columns)):
+            color = 'white' if abs(matrix[i, j]) > 0.5 else 'black'
+            plt.text(j, i, f"{matrix[i, j]:.2f}",
+                     ha='center', va='center', color=color, fontsize=9)
+
+    plt.tight_layout()
+    finish_figure(save_path=save_path)
+    return save_path
+
+
+def _render_revenue_impact(agg, save_path=None):
+    retained_revenue, churned_revenue = agg['sums']
+    avg_charges_retained, avg_charges_churned = agg['means']
+
+    density = agg.get('density')
+    if density is None:
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    else:
+        fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(21, 5))
+
+    # Revenue distribution
+    data = [retained_revenue, churned_revenue]
+    colors = ['steelblue', 'salmon']
+    labels = ['Retained Customers', 'Churned Customers']
+    ax1.pie(data, labels=labels, colors=colors, autopct='%1.1f%%',
+            startangle=90, textprops={'fontsize': 11, 'fontweight': 'bold'})
+    ax1.set_title('Revenue Distribution by Churn Status', fontsize=14, fontweight='bold')
+
+    # Average charges comparison
+    ax2.bar(['Retained', 'Churned'], [avg_charges_retained, avg_charges_churned],
+            color=['steelblue', 'salmon'], edgecolor='black')
+    ax2.set_title('Average Monthly Charges', fontsize=14, fontweight='bold')
+    ax2.set_ylabel('Charges ($)', fontsize=11)
+    ax2.grid(axis='y', alpha=0.3)
+
+    for i, v in enumerate([avg_charges_retained, avg_charges_churned]):
+        ax2.text(i, v + 1, f'${v:.2f}', ha='center', fontweight='bold')
+
+    # Churned revenue on a tenure x charges grid (binned, never per customer)
+    if density is not None:
+        revenue = np.ma.masked_equal(density['churned_revenue'], 0)
+        mesh = ax3.pcolormesh(density['charge_edges'], density['tenure_edges'], revenue, cmap='Reds')
+        fig.colorbar(mesh, ax=ax3, label='Churned monthly revenue ($)')
+        ax3.set_title('Churned Revenue by Tenure and Charges', fontsize=14, fontweight='bold')
+        ax3.set_xlabel(density['charges_col'], fontsize=11)
+        ax3.set_ylabel(density['tenure_col'], fontsize=11)
+
+    plt.tight_layout()
+    finish_figure(fig, save_path=save_path)
+    return save_path
+
+
+# Chart type -> (aggregate(df, **options), render(agg, save_path))
+CHART_TYPES = {
+    'churn_distribution': (_aggregate_target_distribution, _render_churn_distribution),
+    'churn_rate_by_category': (_aggregate_churn_rate_by_category, _render_churn_rate_by_category),
+    'tenure_segments': (_aggregate_tenure_segments, _render_tenure_segments),
+    'feature_distributions': (_aggregate_feature_distributions, _render_feature_distributions),
+    'correlation_heatmap': (_aggregate_correlation_heatmap, _render_correlation_heatmap),
+    'revenue_impact': (compute_revenue_aggregates, _render_revenue_impact),
+}
+
+
 class ChurnVisualizer:
     """
     Create comprehensive visualizations for churn analysis using matplotlib only
     """
 
-    def __init__(self):
+    def __init__(self, headless=False):
+        """
+        Args:
+            headless: Render with the non-interactive Agg backend and never
+                call plt.show(), for batch runs on servers
+        """
+        if headless:
+            set_headless(True)
         plt.rcParams['figure.figsize'] = (10, 6)
         plt.rcParams['font.size'] = 10
 
@@ -21,47 +422,12 @@ class ChurnVisualizer:
         """
         Plot churn distribution with percentages
         """
-        plt.figure(figsize=(8, 6))
-        # Convert y to numeric type and get value counts
-        y_numeric = pd.to_numeric(y)
-        churn_counts = pd.Series(y_numeric).value_counts().sort_index()
-        colors = ['steelblue', 'salmon']
-        bars = plt.bar(churn_counts.index, churn_counts.values, color=colors, edgecolor='black')
-        plt.title('Churn Distribution', fontsize=16, fontweight='bold')
-        plt.xlabel('Churn (0=No, 1=Yes)', fontsize=12)
-        plt.ylabel('Count', fontsize=12)
-
-        total = len(y)
-        for i, (v, bar) in enumerate(zip(churn_counts.values, bars)):
-            percentage = (v / total) * 100
-            plt.text(bar.get_x() + bar.get_width()/2, v + 50, 
-                     f'{v}\n({percentage:.1f}%)', ha='center', fontsize=12, fontweight='bold')
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        _render_churn_distribution(_aggregate_churn_distribution(y), save_path)
 
     def plot_tenure_segments_churn(self, df, tenure_col='tenure', target='Churn', save_path=None):
-        plt.figure(figsize=(10, 6))
-        df_local = df.copy()
-        if tenure_col not in df_local.columns or target not in df_local.columns:
+        if tenure_col not in df.columns or target not in df.columns:
             return
-        bins = [0, 12, 24, 48, 72]
-        labels = ['0-1 year', '1-2 years', '2-4 years', '4+ years']
-        df_local['__tenure_segment'] = pd.cut(df_local[tenure_col].fillna(0), bins=bins, labels=labels, include_lowest=True)
-        churn_rates = df_local.groupby('__tenure_segment')[target].mean().reindex(labels)
-        bars = plt.bar(churn_rates.index.astype(str), churn_rates.values * 100, color='salmon', edgecolor='black')
-        for bar in bars:
-            h = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., h + 1, f'{h:.1f}%', ha='center', va='bottom', fontweight='bold')
-        plt.title('Churn Rate by Tenure Segments', fontsize=14, fontweight='bold')
-        plt.xlabel('Tenure Segment', fontsize=12)
-        plt.ylabel('Churn Rate (%)', fontsize=12)
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        _render_tenure_segments(_aggregate_tenure_segments(df, tenure_col, target), save_path)
 
     def plot_roc_curve(self, y_true, y_pred_proba, model_name='Model', save_path=None):
         fpr, tpr, _ = roc_curve(y_true, y_pred_proba)
@@ -77,81 +443,31 @@ class ChurnVisualizer:
         plt.legend(loc='lower right')
         plt.grid(alpha=0.3)
         plt.tight_layout()
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        finish_figure(save_path=save_path)
 
-    def plot_feature_distributions(self, df, features, target='Churn', save_path=None):
+    def plot_feature_distributions(self, df, features, target='Churn', save_path=None,
+                                   bins=None, value_ranges=None):
         """
         Plot feature distributions by churn status using matplotlib
-        """
-        n_features = len(features)
-        fig, axes = plt.subplots(nrows=(n_features+1)//2, ncols=2, figsize=(14, 5*((n_features+1)//2)))
-        axes = axes.flatten()
-
-        for idx, feature in enumerate(features):
-            ax = axes[idx]
-            if df[feature].dtype in ['int64', 'float64']:
-                churn_groups = [df[df[target] == 0][feature].dropna(), 
-                                df[df[target] == 1][feature].dropna()]
-                bp = ax.boxplot(churn_groups, labels=['No', 'Yes'], patch_artist=True)
-                bp['boxes'][0].set_facecolor('steelblue')
-                bp['boxes'][1].set_facecolor('salmon')
-                ax.set_ylabel(feature, fontsize=11)
-            else:
-                categories = df[feature].value_counts().index
-                width = 0.35
-                churned = [len(df[(df[target] == 1) & (df[feature] == cat)]) for cat in categories]
-                not_churned = [len(df[(df[target] == 0) & (df[feature] == cat)]) for cat in categories]
-                x = np.arange(len(categories))
-                ax.bar(x - width/2, not_churned, width, color='steelblue', label='Not Churned', edgecolor='black')
-                ax.bar(x + width/2, churned, width, color='salmon', label='Churned', edgecolor='black')
-                ax.set_xticks(x)
-                ax.set_xticklabels(categories, rotation=45, ha='right')
-                ax.legend()
-
-            ax.set_title(f'{feature} vs Churn', fontsize=12, fontweight='bold')
-            ax.grid(alpha=0.3)
-
-        for idx in range(n_features, len(axes)):
-            fig.delaxes(axes[idx])
 
-        plt.tight_layout()
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        Small DataFrames get box plots. With ``bins`` set, more than
+        AGGREGATE_ROW_THRESHOLD rows, or an iterable of chunks as ``df``,
+        numeric features are drawn from per-class fixed-bin histograms (see
+        compute_feature_histograms) so matplotlib only receives bin counts.
+        """
+        _render_feature_distributions(
+            _aggregate_feature_distributions(df, features, target, bins, value_ranges), save_path)
 
     def plot_correlation_heatmap(self, df, save_path=None):
         """
         Plot correlation heatmap for numerical features
         """
-        numerical_cols = df.select_dtypes(include=[np.number]).columns
-        correlation_matrix = df[numerical_cols].corr()
-
-        plt.figure(figsize=(12, 10))
-        im = plt.imshow(correlation_matrix, cmap='coolwarm', aspect='auto', vmin=-1, vmax=1)
-        plt.title('Feature Correlation Heatmap', fontsize=16, fontweight='bold')
-        plt.xticks(range(len(numerical_cols)), numerical_cols, rotation=45, ha='right')
-        plt.yticks(range(len(numerical_cols)), numerical_cols)
-        plt.colorbar(im, shrink=0.8)
-
-        for i in range(len(numerical_cols)):
-            for j in range(len(numerical_cols)):
-                color = 'white' if abs(correlation_matrix.iloc[i, j]) > 0.5 else 'black'
-                plt.text(j, i, f"{correlation_matrix.iloc[i, j]:.2f}",
-                         ha='center', va='center', color=color, fontsize=9)
-
-        plt.tight_layout()
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
-
-
+        _render_correlation_heatmap(_aggregate_correlation_heatmap(df), save_path)
 
     def plot_multiple_roc_curves(self, y_true, models_dict, save_path=None):
         """
         Plot multiple ROC curves for model comparison
-        
+
         Parameters:
         -----------
         y_true : array-like
@@ -161,14 +477,14 @@ class ChurnVisualizer:
         """
         plt.figure(figsize=(10, 8))
         colors = ['darkorange', 'green', 'red', 'purple', 'brown']
-        
+
         for i, (model_name, y_pred_proba) in enumerate(models_dict.items()):
             fpr, tpr, _ = roc_curve(y_true, y_pred_proba)
             roc_auc = auc(fpr, tpr)
             plt.plot(fpr, tpr, lw=2, color=colors[i % len(colors)],
                      label=f'{model_name} (AUC = {roc_auc:.3f})')
-        
-        plt.plot([0, 1], [0, 1], color='navy', lw=2, linestyle='--', 
+
+        plt.plot([0, 1], [0, 1], color='navy', lw=2, linestyle='--',
                  label='Random Classifier')
         plt.xlim([0.0, 1.0])
         plt.ylim([0.0, 1.05])
@@ -177,79 +493,72 @@ class ChurnVisualizer:
         plt.title('ROC Curves - Model Comparison', fontsize=14, fontweight='bold')
         plt.legend(loc='lower right', fontsize=10)
         plt.grid(alpha=0.3)
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
 
+        finish_figure(save_path=save_path)
 
     def plot_churn_rate_by_category(self, df, category_col, target='Churn', save_path=None):
+        _render_churn_rate_by_category(_aggregate_churn_rate_by_category(df, category_col, target),
+                                       save_path)
 
-        plt.figure(figsize=(10, 6))
-        
-        # Calculate churn rates
-        churn_rates = df.groupby(category_col)[target].mean().sort_values(ascending=False)
-        
-        # Create bar plot
-        bars = plt.bar(churn_rates.index.astype(str), churn_rates.values * 100,
-                      color='salmon', edgecolor='black')
-        
-        # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 1,
-                    f'{height:.1f}%', ha='center', va='bottom', fontweight='bold')
-        
-        plt.title(f'Churn Rate by {category_col}', fontsize=14, fontweight='bold')
-        plt.xlabel(category_col, fontsize=12)
-        plt.ylabel('Churn Rate (%)', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(axis='y', alpha=0.3)
-        
-        # Add horizontal line for overall churn rate
-        overall_churn = df[target].mean() * 100
-        plt.axhline(y=overall_churn, color='red', linestyle='--', 
-                   label=f'Overall Churn Rate: {overall_churn:.1f}%')
-        
-        plt.legend()
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
-
-    def plot_revenue_impact(self, df, monthly_charges_col='MonthlyCharges', 
-                           target='Churn', save_path=None):
+    def plot_revenue_impact(self, df, monthly_charges_col='MonthlyCharges',
+                           target='Churn', save_path=None, tenure_col='tenure',
+                           bins=(24, 24), value_ranges=None):
         """
         Plot revenue impact analysis
+
+        ``df`` may be a DataFrame or an iterable of chunks; everything is
+        aggregated by compute_revenue_aggregates before plotting.
         """
-        churned_revenue = df[df[target] == 1][monthly_charges_col].sum()
-        retained_revenue = df[df[target] == 0][monthly_charges_col].sum()
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-        
-        # Revenue distribution
-        data = [retained_revenue, churned_revenue]
-        colors = ['steelblue', 'salmon']
-        labels = ['Retained Customers', 'Churned Customers']
-        wedges, texts, autotexts = ax1.pie(data, labels=labels, colors=colors, autopct='%1.1f%%',
-                                            startangle=90, textprops={'fontsize': 11, 'fontweight': 'bold'})
-        ax1.set_title('Revenue Distribution by Churn Status', fontsize=14, fontweight='bold')
-        
-        # Average charges comparison
-        avg_charges_retained = df[df[target] == 0][monthly_charges_col].mean()
-        avg_charges_churned = df[df[target] == 1][monthly_charges_col].mean()
-        
-        ax2.bar(['Retained', 'Churned'], [avg_charges_retained, avg_charges_churned], 
-                color=['steelblue', 'salmon'], edgecolor='black')
-        ax2.set_title('Average Monthly Charges', fontsize=14, fontweight='bold')
-        ax2.set_ylabel('Charges ($)', fontsize=11)
-        ax2.grid(axis='y', alpha=0.3)
-        
-        for i, v in enumerate([avg_charges_retained, avg_charges_churned]):
-            ax2.text(i, v + 1, f'${v:.2f}', ha='center', fontweight='bold')
-        
-        plt.tight_layout()
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        _render_revenue_impact(compute_revenue_aggregates(df, monthly_charges_col, target, tenure_col,
+                                                          bins, value_ranges), save_path)
+
+    def render_charts(self, df, specs, max_workers=None, renderer=None):
+        """
+        Render a batch of independent charts in parallel worker processes
+
+        Each chart's data is aggregated here (counts, rates, quartiles, a
+        correlation matrix); only those aggregates are sent to the workers,
+        which draw and save the figures headless.
+
+        Args:
+            df: DataFrame the charts are computed from
+            specs: List of dicts with a ``chart`` key (one of CHART_TYPES), a
+                ``save_path`` and any keyword options of the matching plot_*
+                method, e.g.
+                ``{'chart': 'churn_rate_by_category', 'category_col': 'Contract',
+                'save_path': 'charts/churn_by_contract.png'}``
+            max_workers: Number of render processes (BackgroundRenderer default if None)
+            renderer: Shared BackgroundRenderer to draw on; a private one
+                is started and shut down here if None
+
+        Returns:
+            list: Saved paths in spec order; None for charts that failed
+        """
+        jobs = []
+        for spec in specs:
+            options = dict(spec)
+            chart = options.pop('chart')
+            save_path = options.pop('save_path', None)
+            if chart not in CHART_TYPES:
+                raise ValueError(f"Unknown chart type '{chart}'. Choose from {sorted(CHART_TYPES)}")
+
+            aggregate, render = CHART_TYPES[chart]
+            try:
+                jobs.append((render, aggregate(df, **options), save_path))
+            except Exception as e:
+                logger.warning(f"Skipping chart '{chart}': {str(e)}")
+                jobs.append(None)
+
+        own_renderer = renderer is None
+        if own_renderer:
+            renderer = BackgroundRenderer(max_workers=max_workers)
+        try:
+            futures = [renderer.submit(*job) for job in jobs if job is not None]
+            results = iter(renderer.wait(futures))
+        finally:
+            if own_renderer:
+                renderer.shutdown()
+
+        saved = [next(results) if job is not None else None for job in jobs]
+        logger.info(f"Rendered {sum(path is not None for path in saved)}/{len(specs)} charts")
+        return saved
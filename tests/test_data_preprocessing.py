@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+from src.data_preprocessing import ChurnDataPreprocessor
+
+
+def test_transform_with_encoder_handles_categorical_without_categories():
+    preprocessor = ChurnDataPreprocessor()
+    encoder = LabelEncoder().fit(['No', 'Yes', 'nan'])
+    series = pd.Series([np.nan, np.nan], dtype='category')
+
+    encoded = preprocessor._transform_with_encoder(series, encoder)
+
+    assert encoded.tolist() == [2, 2]
+
+
+def test_transform_with_encoder_maps_categories_missing_and_unseen():
+    preprocessor = ChurnDataPreprocessor()
+    encoder = LabelEncoder().fit(['No', 'Yes'])
+    series = pd.Series(['Yes', None, 'Maybe', 'No'], dtype='category')
+
+    encoded = preprocessor._transform_with_encoder(series, encoder)
+
+    assert encoded.tolist() == [1, ChurnDataPreprocessor.UNKNOWN_CODE, ChurnDataPreprocessor.UNKNOWN_CODE, 0]
@@ -0,0 +1,72 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import export_sql_to_csv
+from export_sql_to_csv import run_exports, stream_query_to_file
+
+
+def _database(tmp_path, rows=120):
+    path = tmp_path / 'churn.db'
+    engine = create_engine(f'sqlite:///{path}')
+    pd.DataFrame({'customerID': [f'C{i}' for i in range(rows)], 'Churn': [int(i % 3 == 0) for i in range(rows)],
+                  'TotalCharges': [i * 1.5 for i in range(rows)]}).to_sql('customers', engine, index=False)
+    return engine, path
+
+
+def test_run_exports_shares_one_engine_and_isolates_failures(tmp_path, monkeypatch):
+    engine, path = _database(tmp_path)
+    monkeypatch.setitem(export_sql_to_csv.DB_CONFIG, 'database', str(path))
+    export_sql_to_csv.dispose_engine()
+    exports = [
+        ('All', 'SELECT * FROM customers', str(tmp_path / 'out' / 'all.csv'), True),
+        ('Broken', 'SELECT * FROM missing_table', str(tmp_path / 'out' / 'broken.csv'), False),
+        ('Count', 'SELECT COUNT(*) AS n FROM customers', str(tmp_path / 'out' / 'count.csv'), False),
+    ]
+    try:
+        results = run_exports(exports, concurrent=True, max_workers=3, chunksize=50)
+        sequential = run_exports(exports, concurrent=False, chunksize=50)
+        assert export_sql_to_csv.get_engine() is export_sql_to_csv.get_engine()
+    finally:
+        export_sql_to_csv.dispose_engine()
+
+    for batch in (results, sequential):
+        assert [result['status'] for result in batch] == ['ok', 'failed', 'ok']
+        assert [result['rows'] for result in batch] == [120, None, 1]
+    assert 'missing_table' in results[1]['error']
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / 'out' / 'all.csv'),
+                                  pd.read_sql('SELECT * FROM customers', engine))
+
+
+@pytest.mark.parametrize('suffix', ['.csv', '.parquet'])
+def test_stream_query_to_file_writes_every_chunk(tmp_path, suffix):
+    engine, _ = _database(tmp_path)
+    output = str(tmp_path / f'customers{suffix}')
+
+    rows, columns, preview = stream_query_to_file('SELECT * FROM customers', output, engine, chunksize=25)
+
+    written = pd.read_csv(output) if suffix == '.csv' else pd.read_parquet(output)
+    assert (rows, columns, len(preview)) == (120, 3, 5)
+    assert written['customerID'].tolist() == [f'C{i}' for i in range(120)]
+    assert not os.path.exists(output + '.part')
+
+
+def test_failed_stream_removes_the_part_file_and_keeps_the_old_output(tmp_path):
+    engine, _ = _database(tmp_path)
+    output = tmp_path / 'customers.csv'
+    output.write_text('previous export\n')
+
+    with pytest.raises(Exception, match='no_such_column'):
+        stream_query_to_file('SELECT no_such_column FROM customers', str(output), engine, chunksize=25)
+    with pytest.raises(OSError):
+        stream_query_to_file('SELECT * FROM customers', str(tmp_path / 'missing' / 'out.csv'), engine,
+                             chunksize=25)
+
+    assert output.read_text() == 'previous export\n'
+    assert not os.path.exists(str(output) + '.part')
+    assert not (tmp_path / 'missing').exists()
@@ -0,0 +1,45 @@
+import json
+
+import pandas as pd
+import pytest
+
+from src.instrumentation import (get_run_report, instrument, instrumented, reset_run_report,
+                                 write_run_report)
+
+
+@instrumented('double')
+def _double(df):
+    return df * 2
+
+
+def test_nested_stages_record_rows_parent_and_errors():
+    reset_run_report()
+    with instrument('pipeline') as record:
+        _double(pd.DataFrame({'x': range(5)}))
+        record.rows_out = 5
+    with pytest.raises(ValueError):
+        with instrument('broken'):
+            raise ValueError('bad input')
+
+    stages = {stage['name']: stage for stage in get_run_report()}
+
+    assert [stage['name'] for stage in get_run_report()] == ['double', 'pipeline', 'broken']
+    assert stages['double']['parent'] == 'pipeline'
+    assert (stages['double']['rows_in'], stages['double']['rows_out']) == (5, 5)
+    assert stages['pipeline']['rows_out'] == 5 and stages['pipeline']['wall_s'] >= 0
+    assert stages['broken']['error'] == 'ValueError: bad input'
+
+
+def test_write_run_report_saves_json_and_csv(tmp_path):
+    reset_run_report()
+    with instrument('load', rows_in=3) as record:
+        record.rows_out = 3
+
+    json_path, csv_path = write_run_report(str(tmp_path), run_id='test')
+
+    report = json.loads(open(json_path).read())
+    assert report['run_id'] == 'test'
+    assert [stage['name'] for stage in report['stages']] == ['load']
+    table = pd.read_csv(csv_path)
+    assert table[['name', 'rows_in', 'rows_out']].values.tolist() == [['load', 3, 3]]
+    assert {'wall_s', 'cpu_s', 'peak_rss_delta_mb', 'thread'} <= set(table.columns)
@@ -0,0 +1,64 @@
+import csv
+import io
+import os
+import sys
+
+import pandas as pd
+import sqlalchemy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from load_data_to_sql import _ParquetCsvReader, bulk_load_file, incremental_load_file
+
+
+def test_parquet_csv_reader_streams_rows_with_rounded_money_and_nulls(tmp_path):
+    path = tmp_path / 'customers.parquet'
+    pd.DataFrame({
+        'customerID': ['A', 'B', 'C'],
+        'tenure': [1, 2, 3],
+        'TotalCharges': pd.Series([1413.6, None, 20.05], dtype='float32'),
+    }).to_parquet(path, index=False)
+
+    reader = _ParquetCsvReader(str(path), batch_size=2)
+    text = ''.join(iter(lambda: reader.read(5), ''))
+
+    assert list(csv.reader(io.StringIO(text))) == [['A', '1', '1413.6'], ['B', '2', ''], ['C', '3', '20.05']]
+
+
+def _write_customers(path, rows):
+    pd.DataFrame(rows, columns=['customerID', 'tenure', 'MonthlyCharges']).to_csv(path, index=False)
+
+
+def test_incremental_load_inserts_updates_and_deletes_changed_rows(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'churn.db'}")
+    path = tmp_path / 'customers.csv'
+    _write_customers(path, [('A', 1, 29.85), ('B', 34, 56.95), ('C', 2, 53.85)])
+    first = incremental_load_file(engine, str(path), 'customers')
+    assert first['inserted'] == 3 and first['unchanged'] == 0
+
+    # B changes, C disappears, D is new and A is repeated
+    _write_customers(path, [('A', 1, 29.85), ('B', 35, 56.95), ('D', 5, 70.7), ('A', 9, 99.9)])
+    stats = incremental_load_file(engine, str(path), 'customers', batch_size=2)
+
+    assert stats == {'inserted': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1, 'duplicates': 1}
+    table = pd.read_sql('SELECT * FROM customers ORDER BY customerID', engine)
+    assert table.values.tolist() == [['A', 1, 29.85], ['B', 35, 56.95], ['D', 5, 70.7]]
+    hashes = pd.read_sql('SELECT customerID FROM customers_row_hashes ORDER BY customerID', engine)
+    assert hashes['customerID'].tolist() == ['A', 'B', 'D']
+
+    rerun = incremental_load_file(engine, str(path), 'customers')
+    assert rerun == {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 3, 'duplicates': 1}
+
+
+def test_incremental_load_rebuilds_hashes_after_a_full_load(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'churn.db'}")
+    path = tmp_path / 'customers.csv'
+    _write_customers(path, [('A', 1, 29.85), ('B', 34, 56.95)])
+    incremental_load_file(engine, str(path), 'customers')
+    bulk_load_file(engine, str(path), 'customers')
+    assert not sqlalchemy.inspect(engine).has_table('customers_row_hashes')
+
+    stats = incremental_load_file(engine, str(path), 'customers')
+
+    assert stats['inserted'] == 2 and stats['deleted'] == 0
+    assert pd.read_sql('SELECT COUNT(*) AS n FROM customers', engine)['n'][0] == 2
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from src.model_codecs import MODEL_CODECS, compression_arg
+from src.model_training import ChurnModelTrainer
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def _trainer():
+    rng = np.random.default_rng(0)
+    X = rng.random((60, 3))
+    trainer = ChurnModelTrainer()
+    trainer.models['Logistic Regression'] = LogisticRegression().fit(X, (X[:, 0] > 0.5).astype(int))
+    return trainer, X
+
+
+@pytest.mark.parametrize('codec', MODEL_CODECS)
+def test_save_and_load_model_round_trip_for_every_codec(tmp_path, codec):
+    trainer, X = _trainer()
+    path = tmp_path / f'model_{codec}.pkl'
+
+    assert trainer.save_model('Logistic Regression', str(path), codec=codec)
+    loaded = trainer.load_model(str(path))
+
+    assert loaded['metadata']['codec'] == codec
+    np.testing.assert_array_equal(loaded['model'].predict_proba(X),
+                                  trainer.models['Logistic Regression'].predict_proba(X))
+
+
+def test_uncompressed_model_is_memory_mapped(tmp_path):
+    trainer, _ = _trainer()
+    path = tmp_path / 'model.pkl'
+    trainer.save_model('Logistic Regression', str(path), codec='none')
+
+    model = trainer.load_model(str(path), mmap_mode='r')['model']
+
+    assert isinstance(model.coef_, np.memmap)
+
+
+def test_zstd_file_loads_in_a_fresh_process(tmp_path):
+    path = tmp_path / 'values.joblib'
+    joblib.dump(np.arange(10), path, compress=compression_arg('zstd', 3))
+    # joblib only knows the codec after register_codec_for_file has seen the file
+    code = ("import joblib; from src.model_codecs import register_codec_for_file; "
+            f"register_codec_for_file({str(path)!r}); print(joblib.load({str(path)!r}).sum())")
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+
+    assert result.stdout.strip() == '45', result.stderr
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError, match='Unsupported codec'):
+        compression_arg('brotli', 3)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
+
+from src.model_evaluation import bootstrap_metrics, evaluate_models, paired_bootstrap_test, threshold_analysis
+
+
+def test_threshold_analysis_contacts_nobody_when_every_threshold_loses_money():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 200)
+    # Contacting costs more than any customer is worth
+    result = threshold_analysis(y_true, rng.random(200), customer_value=np.full(200, 5.0), contact_cost=10.0)
+
+    optimal = result['optimal']
+    assert optimal['n_targeted'] == 0
+    assert optimal['net_benefit'] == 0.0
+    assert (result['curve']['net_benefit'].iloc[1:] < 0).all()
+
+
+class _CountingModel:
+    def __init__(self, model):
+        self.model = model
+        self.calls = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        return self.model.predict_proba(X)
+
+
+def test_evaluate_models_runs_inference_once_per_model_and_skips_failures(monkeypatch):
+    monkeypatch.setattr('src.rendering._headless', True)
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(120, 3))
+    y = (X[:, 0] + rng.normal(size=120) > 0).astype(int)
+    good = _CountingModel(LogisticRegression().fit(X, y))
+
+    results, probabilities = evaluate_models({'good': good, 'no proba': object()}, X, y,
+                                             threshold=0.4, save_plots=False)
+
+    assert good.calls == 1
+    assert [result['Model'] for result in results] == ['good'] and list(probabilities) == ['good']
+    proba = good.model.predict_proba(X)[:, 1]
+    np.testing.assert_array_equal(probabilities['good'], proba)
+    assert results[0]['Accuracy'] == accuracy_score(y, proba >= 0.4)
+    assert results[0]['ROC_AUC'] == roc_auc_score(y, proba)
+
+
+def _scored_sample(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, n)
+    # Rounded so tied scores exercise the tie groups of the AUC
+    return y, np.round(np.clip(0.3 * y + rng.random(n) * 0.7, 0, 1), 2)
+
+
+def test_bootstrap_metrics_table_estimates_and_seed_determinism():
+    y, proba = _scored_sample()
+
+    table = bootstrap_metrics(y, proba, n_resamples=200, random_state=7)
+
+    assert table['Metric'].tolist() == ['Accuracy', 'Precision', 'Recall', 'F1_Score', 'ROC_AUC']
+    assert list(table.columns) == ['Metric', 'Estimate', 'CI_Lower', 'CI_Upper', 'Std_Error']
+    estimates = table.set_index('Metric')['Estimate']
+    assert np.isclose(estimates['ROC_AUC'], roc_auc_score(y, proba))
+    assert np.isclose(estimates['F1_Score'], f1_score(y, proba >= 0.5))
+    assert (table['CI_Lower'] <= table['Estimate']).all() and (table['Estimate'] <= table['CI_Upper']).all()
+    # Same seed, same intervals, however the resamples are chunked
+    pd.testing.assert_frame_equal(table, bootstrap_metrics(y, proba, n_resamples=200, random_state=7,
+                                                           chunk_size=30))
+    assert not table.equals(bootstrap_metrics(y, proba, n_resamples=200, random_state=8))
+
+
+def test_paired_bootstrap_test_of_a_model_against_itself_finds_no_difference():
+    y, proba = _scored_sample()
+
+    result = paired_bootstrap_test(y, proba, proba, n_resamples=100)
+
+    assert (result['Difference'] == 0).all()
+    assert (result['P_Value'] == 1.0).all()
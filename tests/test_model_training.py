@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from src.data_preprocessing import ChurnDataPreprocessor
+from src.model_training import ChurnModelTrainer
+
+
+def _churn_frame(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    contract = rng.choice(['Month-to-month', 'One year', 'Two year'], n)
+    tenure = rng.integers(0, 72, n)
+    churn_prob = np.where(contract == 'Month-to-month', 0.5, 0.1)
+    return pd.DataFrame({
+        'customerID': [f'C{i:05d}' for i in range(n)],
+        'gender': rng.choice(['Male', 'Female'], n),
+        'Contract': contract,
+        'InternetService': rng.choice(['DSL', 'Fiber optic', 'No'], n),
+        'tenure': tenure,
+        'MonthlyCharges': rng.uniform(20, 110, n).round(2),
+        'TotalCharges': (rng.uniform(20, 110, n) * (tenure + 1)).round(2).astype(str),
+        'Churn': (rng.random(n) < churn_prob).astype(int),
+    })
+
+
+def test_hist_engine_uses_native_categorical_features():
+    preprocessor = ChurnDataPreprocessor()
+    X, y = preprocessor.preprocess_pipeline(_churn_frame(), target_col='Churn', fit=True)
+    expected = preprocessor.categorical_feature_indices()
+    assert [preprocessor.feature_columns[i] for i in expected] == ['gender', 'Contract', 'InternetService']
+
+    trainer = ChurnModelTrainer()
+    X_train, X_test, _, _ = trainer.train_all_models(X, y, gb_engine='hist', preprocessor=preprocessor)
+
+    model = trainer.models['Gradient Boosting']
+    is_categorical = model[-1].is_categorical_
+    assert np.flatnonzero(is_categorical).tolist() == expected
+    # Scaled inputs are mapped back to integer codes, one per category
+    codes = model[:-1].transform(X_test)
+    assert set(np.unique(codes[:, expected[1]])) <= {0, 1, 2}
+    assert model.predict_proba(X_test).shape == (len(X_test), 2)
+
+
+def test_split_cv_budget_never_exceeds_the_core_budget():
+    trainer = ChurnModelTrainer()
+    for n_tasks in (1, 3, 15, 40):
+        for n_jobs in (1, 2, 4):
+            outer, inner = trainer.split_cv_budget(n_tasks, n_jobs)
+            assert 1 <= outer <= min(n_tasks, n_jobs)
+            assert outer * inner <= n_jobs
+
+
+def test_cross_validate_batch_matches_per_model_cross_val_score():
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.model_selection import cross_val_score
+    from sklearn.tree import DecisionTreeClassifier
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    y = (X[:, 0] + rng.normal(scale=0.5, size=200) > 0).astype(int)
+    trainer = ChurnModelTrainer()
+    trainer.models = {'Logistic Regression': LogisticRegression(),
+                      'Decision Tree': DecisionTreeClassifier(max_depth=3, random_state=0)}
+
+    results = trainer.cross_validate(X, y, cv=5, n_jobs=2)
+
+    for name, model in trainer.models.items():
+        expected = cross_val_score(model, X, y, cv=5, scoring='roc_auc')
+        np.testing.assert_allclose(results[name]['scores'], expected)
@@ -0,0 +1,61 @@
+import multiprocessing
+import threading
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.artist import Artist
+
+from src.rendering import BackgroundRenderer
+from src.visualization import _render_churn_distribution
+
+
+class _BlockingArtist(Artist):
+    """Holds its figure's draw (and matplotlib's figure render lock) until released"""
+
+    def __init__(self, inside, release):
+        super().__init__()
+        self.inside = inside
+        self.release = release
+
+    def draw(self, renderer):
+        self.inside.set()
+        self.release.wait()
+
+
+def test_background_render_completes_while_another_thread_draws(tmp_path):
+    inside, release = threading.Event(), threading.Event()
+    fig = plt.figure()
+    fig.add_artist(_BlockingArtist(inside, release))
+    drawer = threading.Thread(target=fig.canvas.draw)
+    drawer.start()
+    inside.wait()
+
+    renderer = BackgroundRenderer(max_workers=2)
+    agg = {'labels': [0, 1], 'counts': [70, 30], 'total': 100}
+    try:
+        futures = [renderer.submit(_render_churn_distribution, agg, str(tmp_path / f'churn_{i}.png'))
+                   for i in range(2)]
+        # Workers forked while the lock is held never finish their draw
+        paths = [future.result(timeout=120) for future in futures]
+    except BaseException:
+        for process in multiprocessing.active_children():
+            process.terminate()
+        raise
+    finally:
+        release.set()
+        drawer.join()
+        plt.close(fig)
+        renderer.shutdown()
+
+    assert paths == [str(tmp_path / f'churn_{i}.png') for i in range(2)]
+    assert all((tmp_path / f'churn_{i}.png').exists() for i in range(2))
+
+
+def test_wait_only_collects_the_given_futures():
+    with BackgroundRenderer(max_workers=1) as renderer:
+        mine = renderer.submit(abs, -1)
+        other = renderer.submit(abs, -2)
+        assert renderer.wait([mine]) == [1]
+        assert renderer.wait() == [2]
+        assert other.done()
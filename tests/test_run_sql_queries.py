@@ -0,0 +1,32 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from run_sql_queries import referenced_tables, split_statements
+
+TABLES = ['customers', 'customers_raw', 'orders']
+
+
+def test_referenced_tables_follows_comma_joins_and_derived_tables():
+    statement = """
+        WITH recent AS (SELECT EXTRACT(YEAR FROM signup) AS y FROM customers_raw)
+        SELECT * FROM recent r, customers c, (SELECT * FROM orders) o
+        WHERE c.id = o.id
+    """
+    assert referenced_tables(statement, TABLES) == ['customers', 'customers_raw', 'orders']
+
+
+def test_referenced_tables_resolves_default_schema_and_rejects_others():
+    assert referenced_tables('SELECT * FROM main.customers', TABLES, 'main') == ['customers']
+    assert referenced_tables('SELECT * FROM customers JOIN archive.orders ON 1 = 1', TABLES, 'main') is None
+
+
+def test_referenced_tables_is_none_for_unknown_objects():
+    assert referenced_tables('SELECT * FROM customers, generate_series(1, 3)', TABLES) is None
+    assert referenced_tables('SELECT * FROM some_view', TABLES) is None
+
+
+def test_split_statements_keeps_quoted_semicolons_and_drops_comments():
+    sql = "-- header\nSELECT ';' FROM customers; /* note; */ SELECT 1 # trailing\n;"
+    assert split_statements(sql) == ["SELECT ';' FROM customers", 'SELECT 1']
@@ -0,0 +1,28 @@
+import numpy as np
+
+from src.data_preprocessing import ChurnDataPreprocessor
+from src.feature_engineering import create_engineered_features
+from src.model_training import ChurnModelTrainer
+from src.scoring import load_scorer
+from tests.test_model_training import _churn_frame
+
+
+def test_scorer_reproduces_the_training_feature_matrix(tmp_path):
+    raw = _churn_frame()
+    preprocessor = ChurnDataPreprocessor()
+    cleaned = preprocessor.clean_data(raw.copy(), keep_id=True)
+    X, y = preprocessor.preprocess_pipeline(create_engineered_features(cleaned, verbose=False),
+                                            target_col='Churn', fit=True)
+    trainer = ChurnModelTrainer()
+    trainer.train_all_models(X, y, balance_data=False)
+    path = tmp_path / 'churn_scoring_pipeline.joblib'
+    assert trainer.save_pipeline('Logistic Regression', str(path), preprocessor)
+
+    scorer = load_scorer(str(path))
+    features = scorer.transform(raw.copy())
+
+    np.testing.assert_allclose(features, trainer.scaler.transform(X))
+    expected = trainer.models['Logistic Regression'].predict_proba(trainer.scaler.transform(X))[:, 1]
+    scores = scorer.score(raw)
+    np.testing.assert_allclose(scores['churn_probability'], expected)
+    assert scores.index.tolist() == raw['customerID'].tolist()
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from src.stage_cache import StageCache
+
+
+def _stage():
+    return 1
+
+
+def _other_stage():
+    return 2
+
+
+def test_stage_key_changes_with_each_input_kind(tmp_path):
+    cache = StageCache(tmp_path / 'cache')
+    data = tmp_path / 'raw.csv'
+    data.write_text('a\n1\n')
+    key = cache.stage_key('clean', inputs=['upstream'], files=[data], params={'cv': 5}, code=[_stage])
+
+    assert key == cache.stage_key('clean', inputs=['upstream'], files=[data], params={'cv': 5}, code=[_stage])
+    assert key != cache.stage_key('train', inputs=['upstream'], files=[data], params={'cv': 5}, code=[_stage])
+    assert key != cache.stage_key('clean', inputs=['changed'], files=[data], params={'cv': 5}, code=[_stage])
+    assert key != cache.stage_key('clean', inputs=['upstream'], files=[data], params={'cv': 3}, code=[_stage])
+    assert key != cache.stage_key('clean', inputs=['upstream'], files=[data], params={'cv': 5},
+                                  code=[_other_stage])
+    data.write_text('a\n2\n')
+    assert key != cache.stage_key('clean', inputs=['upstream'], files=[data], params={'cv': 5}, code=[_stage])
+
+
+def test_run_reuses_output_until_an_input_changes(tmp_path):
+    cache = StageCache(tmp_path / 'cache')
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return pd.DataFrame({'x': [1, 2]}), np.arange(3), {'model': 'fitted'}
+
+    first, key = cache.run('features', compute, inputs=['v1'])
+    second, same_key = cache.run('features', compute, inputs=['v1'])
+    _, new_key = cache.run('features', compute, inputs=['v2'])
+
+    assert len(calls) == 2 and key == same_key != new_key
+    assert cache.hits == ['features'] and cache.misses == ['features', 'features']
+    pd.testing.assert_frame_equal(second[0], first[0])
+    np.testing.assert_array_equal(second[1], first[1])
+    assert second[2] == {'model': 'fitted'}
+
+
+def test_failed_stage_is_not_cached_and_disabled_cache_always_runs(tmp_path):
+    cache = StageCache(tmp_path / 'cache')
+    cache.run('load', lambda: None)
+    assert cache.load('load', cache.stage_key('load')) == (False, None)
+
+    disabled = StageCache(tmp_path / 'cache', enabled=False)
+    disabled.run('load', lambda: 1)
+    disabled.run('load', lambda: 1)
+    assert disabled.hits == [] and disabled.misses == ['load', 'load']
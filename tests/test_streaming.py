@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+
+from src.data_preprocessing import ChurnDataPreprocessor
+from src.feature_engineering import create_engineered_features
+from src.streaming import run_streaming_pipeline
+from src.utils import load_dataframe
+
+SAMPLE_CSV = os.path.join(os.path.dirname(__file__), '..', 'data', 'sql_exports', 'combined_customer_data.csv')
+
+
+def _raw_sample(path):
+    """Raw-format rows of the sample export, with blank charges and duplicates across chunks"""
+    df = pd.read_csv(SAMPLE_CSV, nrows=500).iloc[:, :21]
+    df['Churn'] = df['Churn'].map({1: 'Yes', 0: 'No'})
+    df['TotalCharges'] = df['TotalCharges'].astype(str)
+    df.loc[[3, 250, 420], 'TotalCharges'] = ' '
+    df = pd.concat([df, df.iloc[[0, 3, 130, 260]]], ignore_index=True)
+    df.to_csv(path, index=False)
+
+
+def test_streamed_output_matches_in_memory_cleaning(tmp_path):
+    raw_path = tmp_path / 'raw.csv'
+    _raw_sample(raw_path)
+    expected = ChurnDataPreprocessor().clean_data(load_dataframe(str(raw_path), use_schema=True), keep_id=True)
+
+    for engineer in (False, True):
+        output_path = tmp_path / f'streamed_{engineer}.parquet'
+        rows = run_streaming_pipeline(str(raw_path), str(output_path), chunksize=128, engineer=engineer)
+        streamed = pd.read_parquet(output_path)
+        in_memory = create_engineered_features(expected, verbose=False) if engineer else expected
+
+        assert rows == len(in_memory) < 504
+        assert 'customerID' in streamed.columns
+        pd.testing.assert_frame_equal(streamed, in_memory.reset_index(drop=True), check_dtype=False,
+                                      check_categorical=False)
@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from src.utils import load_dataframe, save_dataframe
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_columnar_round_trip_keeps_dtypes_and_reads_selected_columns(tmp_path, suffix):
+    df = pd.DataFrame({
+        'tenure': pd.Series([1, 24, 60], dtype='int16'),
+        'MonthlyCharges': pd.Series([20.05, 70.4, 101.15], dtype='float32'),
+        'tenure_group': pd.Categorical(['0-1 year', '1-2 years', '4+ years']),
+    }, index=[5, 6, 7])
+    path = tmp_path / f'customers{suffix}'
+
+    assert save_dataframe(df, str(path), 'Customers')
+    loaded = load_dataframe(str(path))
+
+    pd.testing.assert_frame_equal(loaded, df.reset_index(drop=True))
+    assert list(load_dataframe(str(path), columns=['tenure']).columns) == ['tenure']
+
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from src.rendering import BackgroundRenderer
+from src.visualization import ChurnVisualizer
+
+
+def test_render_charts_draws_on_a_shared_renderer_without_collecting_its_other_work(tmp_path):
+    df = pd.DataFrame({'Contract': ['Month-to-month', 'One year', 'Two year'] * 20,
+                       'Churn': [1, 0, 0] * 20})
+    specs = [{'chart': 'churn_distribution', 'save_path': str(tmp_path / 'churn.png')},
+             {'chart': 'churn_rate_by_category', 'category_col': 'Contract',
+              'save_path': str(tmp_path / 'contract.png')},
+             {'chart': 'churn_rate_by_category', 'category_col': 'missing'}]
+
+    with BackgroundRenderer(max_workers=1) as renderer:
+        other = renderer.submit(abs, -1)
+        saved = ChurnVisualizer(headless=True).render_charts(df, specs, renderer=renderer)
+        # Another caller's render is still collected by the renderer's owner
+        assert renderer.wait() == [1]
+        assert other.done()
+
+    assert saved == [str(tmp_path / 'churn.png'), str(tmp_path / 'contract.png'), None]
+    assert (tmp_path / 'churn.png').exists() and (tmp_path / 'contract.png').exists()